@@ -7,17 +7,49 @@ from email import encoders
 import os
 import json
 import hashlib
-from datetime import datetime
-from functools import wraps
-from flask import render_template, request, redirect, url_for, flash, session, make_response, jsonify
+from datetime import date, datetime, timedelta
+from functools import wraps, lru_cache
+from contextlib import contextmanager
+from flask import render_template, request, redirect, url_for, flash, session, make_response, jsonify, g, has_app_context, has_request_context, Response, stream_with_context, before_render_template, template_rendered, send_file
 from werkzeug.utils import secure_filename
+from werkzeug.security import safe_join
+import jinja2
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.sandbox import SandboxedEnvironment
 import mysql.connector
+from mysql.connector import pooling, errorcode
 from dotenv import load_dotenv
 from io import StringIO
 import csv
 import re
 import time
+import random
+import atexit
+import queue
+import threading
+import bisect
+import tempfile
+import glob
+import secrets
+import mimetypes
+import gzip
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from markupsafe import Markup, escape
 from flask import Flask
+from build_assets import ASSET_BUNDLES, DIST_FOLDER, MANIFEST_FILE, COMPRESSED_SUFFIXES
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # Pillow is optional; without it images are served as uploaded
+    Image = None
+    ImageOps = None
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; without it responses are gzipped
+    brotli = None
 
 # Load environment variables
 load_dotenv()
@@ -33,6 +65,22 @@ DB_CONFIG = {
     'database': os.getenv('DB_DATABASE', 'mindtunes_db')
 }
 
+# Connection pool configuration
+DB_POOL_NAME = os.getenv('DB_POOL_NAME', 'mindtunes_pool')
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+# Outbox workers and campaign senders hold connections outside requests, so they get their own pool
+DB_BACKGROUND_POOL_SIZE = int(os.getenv('DB_BACKGROUND_POOL_SIZE', 4))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 5))  # seconds to wait for a free connection
+DB_CONNECT_TIMEOUT = int(os.getenv('DB_CONNECT_TIMEOUT', 10))
+DB_PING_ATTEMPTS = int(os.getenv('DB_PING_ATTEMPTS', 2))
+
+# Content cache configuration (bounds staleness across worker processes)
+CONTENT_CACHE_TTL = int(os.getenv('CONTENT_CACHE_TTL', 300))
+
+# Rendered page cache configuration
+PAGE_CACHE_TTL = int(os.getenv('PAGE_CACHE_TTL', 60))
+PAGE_CACHE_MAX_ENTRIES = int(os.getenv('PAGE_CACHE_MAX_ENTRIES', 500))
+
 ADMIN_USERNAME = os.getenv('ADMIN_USERNAME', 'admin')
 # Fixed: Hash the password properly
 admin_password = os.getenv('ADMIN_PASSWORD_HASH', '12345')
@@ -43,6 +91,10 @@ SMTP_PORT = int(os.getenv('SMTP_PORT', 587))
 EMAIL_USER = os.getenv('EMAIL_USER')
 EMAIL_PASSWORD = os.getenv('EMAIL_PASSWORD')
 EMAIL_FROM_NAME = os.getenv('EMAIL_FROM_NAME', 'MindTune Innovations')
+SMTP_TIMEOUT = int(os.getenv('SMTP_TIMEOUT', 30))
+SMTP_POOL_SIZE = int(os.getenv('SMTP_POOL_SIZE', 3))
+SMTP_IDLE_TIMEOUT = int(os.getenv('SMTP_IDLE_TIMEOUT', 60))  # seconds before an idle session is dropped
+SMTP_MAX_MESSAGES_PER_SESSION = int(os.getenv('SMTP_MAX_MESSAGES_PER_SESSION', 100))
 
 
 # File upload configuration
@@ -73,8 +125,31 @@ def allowed_cv_file(filename):
 # Email Configuration using smtplib
 # =================================================================================================
 
+class SMTPSession:
+    """An authenticated SMTP connection plus the bookkeeping the pool needs."""
+
+    def __init__(self, server):
+        self.server = server
+        self.messages_sent = 0
+        self.last_used = time.monotonic()
+
+    def close(self):
+        try:
+            self.server.quit()
+        except Exception:
+            try:
+                self.server.close()
+            except Exception:
+                pass
+
 class EmailService:
-    """Email service using smtplib for sending emails."""
+    """Email service using smtplib for sending emails.
+
+    Authenticated sessions are pooled: a message borrows an idle session (checked with
+    NOOP), so sending is a single envelope/DATA exchange instead of connect, STARTTLS,
+    login and quit every time. Sessions are dropped after SMTP_IDLE_TIMEOUT seconds
+    idle or SMTP_MAX_MESSAGES_PER_SESSION messages, whichever comes first.
+    """
     
     def __init__(self):
         self.smtp_server = SMTP_SERVER
@@ -82,15 +157,80 @@ class EmailService:
         self.email_user = EMAIL_USER
         self.email_password = EMAIL_PASSWORD
         self.from_name = EMAIL_FROM_NAME
+        self._idle_sessions = []
+        self._sessions_lock = threading.Lock()
+        self._session_slots = threading.BoundedSemaphore(SMTP_POOL_SIZE)
     
-    def test_connection(self):
-        """Test SMTP connection and authentication."""
+    def _connect(self):
+        """Opens and authenticates a new SMTP session."""
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=SMTP_TIMEOUT)
         try:
-            # Create SMTP session
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
             server.starttls()  # Enable TLS encryption
             server.login(self.email_user, self.email_password)
-            server.quit()
+        except Exception:
+            server.close()
+            raise
+        return SMTPSession(server)
+    
+    def _checkout(self):
+        """Returns a live session, reusing an idle one when it still answers NOOP."""
+        if not self._session_slots.acquire(timeout=SMTP_TIMEOUT):
+            raise smtplib.SMTPException("Timed out waiting for a free SMTP session")
+        try:
+            while True:
+                with self._sessions_lock:
+                    session = self._idle_sessions.pop() if self._idle_sessions else None
+                if session is None:
+                    return self._connect()
+                if time.monotonic() - session.last_used > SMTP_IDLE_TIMEOUT:
+                    session.close()
+                    continue
+                try:
+                    if session.server.noop()[0] == 250:
+                        return session
+                except (smtplib.SMTPException, OSError):
+                    pass
+                session.close()
+        except Exception:
+            self._session_slots.release()
+            raise
+    
+    def _checkin(self, session, healthy=True):
+        """Returns a session to the pool, or closes it if it is broken or worn out."""
+        try:
+            if healthy and session.messages_sent < SMTP_MAX_MESSAGES_PER_SESSION:
+                session.last_used = time.monotonic()
+                with self._sessions_lock:
+                    self._idle_sessions.append(session)
+            else:
+                session.close()
+        finally:
+            self._session_slots.release()
+    
+    @contextmanager
+    def smtp_session(self):
+        """Borrows a pooled session for one or more messages."""
+        session = self._checkout()
+        healthy = False
+        try:
+            yield session
+            healthy = True
+        finally:
+            self._checkin(session, healthy)
+    
+    def close_sessions(self):
+        """Closes every idle session (used at shutdown)."""
+        with self._sessions_lock:
+            sessions, self._idle_sessions = self._idle_sessions, []
+        for smtp_session in sessions:
+            smtp_session.close()
+    
+    def test_connection(self):
+        """Test SMTP connection and authentication."""
+        smtp_started = time.perf_counter()
+        try:
+            with self.smtp_session():
+                pass
             return True, "Connection successful"
         except smtplib.SMTPAuthenticationError as e:
             return False, f"Authentication failed: {str(e)}"
@@ -100,8 +240,42 @@ class EmailService:
             return False, f"SMTP error: {str(e)}"
         except Exception as e:
             return False, f"Unexpected error: {str(e)}"
+        finally:
+            add_request_metric('smtp_time', time.perf_counter() - smtp_started)
     
-    def send_email(self, to_emails, subject, body, html_body=None, attachments=None):
+    def build_message(self, to_emails, subject, body, html_body=None, attachments=None):
+        """Builds the MIME message for send_email."""
+        msg = MIMEMultipart('alternative')
+        msg['From'] = f"{self.from_name} <{self.email_user}>"
+        msg['To'] = ', '.join(to_emails)
+        msg['Subject'] = subject
+        
+        # Add plain text part
+        text_part = MIMEText(body, 'plain', 'utf-8')
+        msg.attach(text_part)
+        
+        # Add HTML part if provided
+        if html_body:
+            html_part = MIMEText(html_body, 'html', 'utf-8')
+            msg.attach(html_part)
+        
+        # Add attachments if provided
+        if attachments:
+            for file_path in attachments:
+                if os.path.isfile(file_path):
+                    with open(file_path, 'rb') as attachment:
+                        part = MIMEBase('application', 'octet-stream')
+                        part.set_payload(attachment.read())
+                    
+                    encoders.encode_base64(part)
+                    part.add_header(
+                        'Content-Disposition',
+                        f'attachment; filename= {os.path.basename(file_path)}'
+                    )
+                    msg.attach(part)
+        return msg
+    
+    def send_email(self, to_emails, subject, body, html_body=None, attachments=None, session=None):
         """
         Send email using smtplib.
         
@@ -111,6 +285,8 @@ class EmailService:
             body: Plain text body
             html_body: Optional HTML body
             attachments: List of file paths to attach
+            session: Optional session from smtp_session(), for sending several
+                messages over one connection; a pooled one is borrowed otherwise
         
         Returns:
             tuple: (success: bool, message: str)
@@ -120,45 +296,25 @@ class EmailService:
             if isinstance(to_emails, str):
                 to_emails = [to_emails]
             
-            # Create message
-            msg = MIMEMultipart('alternative')
-            msg['From'] = f"{self.from_name} <{self.email_user}>"
-            msg['To'] = ', '.join(to_emails)
-            msg['Subject'] = subject
-            
-            # Add plain text part
-            text_part = MIMEText(body, 'plain', 'utf-8')
-            msg.attach(text_part)
-            
-            # Add HTML part if provided
-            if html_body:
-                html_part = MIMEText(html_body, 'html', 'utf-8')
-                msg.attach(html_part)
-            
-            # Add attachments if provided
-            if attachments:
-                for file_path in attachments:
-                    if os.path.isfile(file_path):
-                        with open(file_path, 'rb') as attachment:
-                            part = MIMEBase('application', 'octet-stream')
-                            part.set_payload(attachment.read())
-                        
-                        encoders.encode_base64(part)
-                        part.add_header(
-                            'Content-Disposition',
-                            f'attachment; filename= {os.path.basename(file_path)}'
-                        )
-                        msg.attach(part)
-            
-            # Create SMTP session and send email
-            server = smtplib.SMTP(self.smtp_server, self.smtp_port)
-            server.starttls()  # Enable TLS encryption
-            server.login(self.email_user, self.email_password)
+            text = self.build_message(to_emails, subject, body, html_body, attachments).as_string()
             
-            # Send email
-            text = msg.as_string()
-            server.sendmail(self.email_user, to_emails, text)
-            server.quit()
+            smtp_started = time.perf_counter()
+            try:
+                if session is not None:
+                    session.server.sendmail(self.email_user, to_emails, text)
+                    session.messages_sent += 1
+                else:
+                    try:
+                        with self.smtp_session() as pooled:
+                            pooled.server.sendmail(self.email_user, to_emails, text)
+                            pooled.messages_sent += 1
+                    except smtplib.SMTPServerDisconnected:
+                        # The server dropped the session between NOOP and DATA; one retry on a fresh one
+                        with self.smtp_session() as pooled:
+                            pooled.server.sendmail(self.email_user, to_emails, text)
+                            pooled.messages_sent += 1
+            finally:
+                add_request_metric('smtp_time', time.perf_counter() - smtp_started)
             
             print(f"Email sent successfully to: {', '.join(to_emails)}")
             return True, "Email sent successfully"
@@ -187,124 +343,305 @@ class EmailService:
             plain_text_fallback = re.sub('<[^<]+?>', '', html_content)
         
         return self.send_email(to_emails, subject, plain_text_fallback, html_content)
+    
+    def send_bulk(self, name, subject, body, recipients=None, query=None, params=(), html_body=None,
+                  concurrency=None, rate_limit=None, background=True):
+        """
+        Send one templated message to many recipients.
+        
+        Recipients are snapshotted into email_campaign_recipients before anything is
+        sent, and each one is marked sent or failed as it goes, so a campaign cut short
+        by a crash can be picked up again with resume_bulk().
+        
+        Args:
+            name: Campaign name shown in the admin panel
+            subject: Jinja template for the subject
+            body: Jinja template for the plain text body
+            recipients: List of email strings or dicts with an 'email' key
+            query: Alternatively, a SELECT returning an 'email' column
+            params: Bind parameters for query
+            html_body: Optional Jinja template for the HTML body
+            concurrency: Parallel SMTP sessions (default EMAIL_BULK_CONCURRENCY)
+            rate_limit: Messages per second across all sessions (default EMAIL_BULK_RATE_LIMIT)
+            background: Send from a daemon thread and return immediately
+        
+        Every field of a recipient dict or query row is available to the templates.
+        
+        Returns:
+            int: campaign id, or None if the campaign could not be created
+        """
+        campaign_id = create_email_campaign(name, subject, body, html_body, recipients, query, params)
+        if campaign_id is not None:
+            self.resume_bulk(campaign_id, concurrency, rate_limit, background)
+        return campaign_id
+    
+    def resume_bulk(self, campaign_id, concurrency=None, rate_limit=None, background=True):
+        """Sends to every recipient of a campaign that is still pending.
+        
+        The campaign is claimed in the database first, so only one process sends it.
+        Returns False if another sender (in any worker) already holds the claim.
+        """
+        if not claim_email_campaign(campaign_id):
+            return False
+        args = (campaign_id, concurrency or EMAIL_BULK_CONCURRENCY,
+                EMAIL_BULK_RATE_LIMIT if rate_limit is None else rate_limit)
+        if background:
+            threading.Thread(target=self._run_campaign, args=args,
+                             name=f"email-campaign-{campaign_id}", daemon=True).start()
+        else:
+            self._run_campaign(*args)
+        return True
+    
+    def is_campaign_active(self, campaign):
+        """Whether some process holds a live claim on a campaign from get_email_campaign()."""
+        return bool(campaign and campaign['is_sending'])
+    
+    def _run_campaign(self, campaign_id, concurrency, rate_limit):
+        try:
+            campaign = get_email_campaign(campaign_id)
+            if campaign is None:
+                set_email_campaign_status(campaign_id, 'paused')
+                return
+            templates = {
+                'subject': BULK_TEMPLATE_ENV.from_string(campaign['subject']),
+                'body': BULK_TEMPLATE_ENV.from_string(campaign['body']),
+                'html_body': BULK_HTML_TEMPLATE_ENV.from_string(campaign['html_body']) if campaign['html_body'] else None
+            }
+            pending = queue.Queue()
+            for recipient in fetch_campaign_recipients(campaign_id, 'pending'):
+                pending.put(recipient)
+            limiter = RateLimiter(rate_limit)
+            
+            workers = [threading.Thread(target=self._bulk_worker, args=(templates, pending, limiter), daemon=True)
+                       for _ in range(max(1, min(concurrency, SMTP_POOL_SIZE)))]
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                while worker.is_alive():
+                    worker.join(EMAIL_CAMPAIGN_HEARTBEAT)
+                    touch_email_campaign(campaign_id)  # keeps the claim from looking abandoned
+            
+            # Anything left pending (SMTP went away) keeps the campaign resumable
+            set_email_campaign_status(campaign_id, 'paused' if not pending.empty() else 'completed')
+            print(f"Campaign {campaign_id} finished sending")
+        except Exception as e:
+            print(f"Error sending campaign {campaign_id}: {e}")
+            set_email_campaign_status(campaign_id, 'paused')
+    
+    def _bulk_worker(self, templates, pending, limiter):
+        """Drains the pending queue over one pooled session at a time."""
+        while not pending.empty():
+            try:
+                session = self._checkout()
+            except Exception as e:
+                print(f"Bulk send stopped, no SMTP session available: {e}")
+                return
+            healthy = False
+            try:
+                while session.messages_sent < SMTP_MAX_MESSAGES_PER_SESSION:
+                    try:
+                        recipient = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    context = json.loads(recipient['context'] or '{}')
+                    try:
+                        msg = self.build_message(
+                            [recipient['email']],
+                            templates['subject'].render(**context),
+                            templates['body'].render(**context),
+                            templates['html_body'].render(**context) if templates['html_body'] else None
+                        )
+                    except Exception as e:
+                        record_campaign_result(recipient['id'], False, f"Template error: {e}")
+                        continue
+                    
+                    limiter.wait()
+                    smtp_started = time.perf_counter()
+                    try:
+                        session.server.sendmail(self.email_user, [recipient['email']], msg.as_string())
+                        session.messages_sent += 1
+                    except smtplib.SMTPRecipientsRefused as e:
+                        record_campaign_result(recipient['id'], False, f"Recipients refused: {e}")
+                        continue
+                    except Exception as e:
+                        # The session is suspect now; record the failure and start a fresh one
+                        record_campaign_result(recipient['id'], False, f"SMTP error: {e}")
+                        raise
+                    finally:
+                        add_request_metric('smtp_time', time.perf_counter() - smtp_started)
+                    record_campaign_result(recipient['id'], True)
+                healthy = True
+            except Exception as e:
+                print(f"Bulk send session error: {e}")
+            finally:
+                self._checkin(session, healthy)
 
 # Initialize email service
 email_service = EmailService()
+atexit.register(email_service.close_sessions)
 
 def allowed_file(filename):
     """Check if file has allowed extension."""
     return '.' in filename and \
            filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def get_db_connection():
-    """Establishes and returns a database connection."""
-    try:
-        conn = mysql.connector.connect(**DB_CONFIG)
-        return conn
-    except mysql.connector.Error as err:
-        print(f"Error connecting to database: {err}")
-        return None
-
-def fetch_data(table_name):
-    """Fetches all data from a specified table."""
+# =================================================================================================
+# Upload Storage
+# =================================================================================================
+# Uploads are stored once per distinct content, as /static/uploads/<sha256><ext>, and indexed in
+# the uploads table. upload_references holds how often each table mentions each upload, whether
+# as a whole column value or embedded in HTML; an admin save recounts only the tables it changed.
+# ref_count is the sum over tables, and files nobody has referenced for UPLOAD_GC_GRACE seconds
+# are removed together with their image variants.
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+UPLOAD_GC_GRACE = int(os.getenv('UPLOAD_GC_GRACE', 3600))
+HASHED_UPLOAD_RE = re.compile(r'^[0-9a-f]{64}(?:-\d+w)?\.[a-z0-9]+$')
+
+# Column types that can hold an upload URL
+UPLOAD_REFERENCE_TYPES = {'char', 'varchar', 'tinytext', 'text', 'mediumtext', 'longtext'}
+# An upload URL as a column value or inside HTML (src="...", url(...), srcset lists)
+UPLOAD_URL_RE = re.compile(r"/static/uploads/[^\s\"'<>()?#,]+")
+
+def upload_reference_columns(tables=None):
+    """Table -> columns that may hold an upload URL; empty if the schema can't be read.
+
+    Every text column of the CMS tables and blog posts (or of the given subset) is
+    included. Admin forms save upload fields under their column names, so a new
+    field is counted without being listed here.
+    """
+    columns = {}
+    for table in sorted(CACHED_CONTENT_TABLES | {'blog_posts'} if tables is None else tables):
+        schema = schema_registry.get(table)
+        if schema is None:
+            continue
+        text_columns = tuple(column for column, data_type in schema['columns'].items()
+                             if data_type in UPLOAD_REFERENCE_TYPES)
+        if text_columns:
+            columns[schema['name']] = text_columns
+    return columns
+
+def create_uploads_table():
+    """Creates the uploads index table if it doesn't exist."""
     conn = get_db_connection()
     if conn is None:
-        return []
-    cursor = conn.cursor(dictionary=True)
-    try:
-        cursor.execute(f"SELECT * FROM {table_name}")
-        data = cursor.fetchall()
-        return data
-    except mysql.connector.Error as err:
-        print(f"Error fetching data from {table_name}: {err}")
-        return []
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
+        return False
 
-def fetch_client_logos():
-    """Fetch client logos from database."""
-    conn = get_db_connection()
-    if conn is None:
-        return []
-    cursor = conn.cursor(dictionary=True)
+    cursor = conn.cursor()
     try:
-        cursor.execute("SELECT * FROM client_logos ORDER BY logo_order")
-        data = cursor.fetchall()
-        return [row['logo_url'] for row in data]
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS uploads (
+                upload_id INT AUTO_INCREMENT PRIMARY KEY,
+                content_hash CHAR(64) NOT NULL,
+                file_url VARCHAR(255) NOT NULL UNIQUE,
+                original_name VARCHAR(255),
+                size_bytes BIGINT NOT NULL,
+                ref_count INT NOT NULL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                INDEX idx_upload_hash (content_hash),
+                INDEX idx_upload_refs (ref_count, updated_at)
+            )
+        """)
+        conn.commit()
+        return True
     except mysql.connector.Error as err:
-        print(f"Error fetching client logos: {err}")
-        return []
+        print(f"Error creating uploads table: {err}")
+        return False
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
 
-def update_client_logos(logos):
-    """Update client logos in database."""
+def create_upload_references_table():
+    """Creates the per-table upload reference counts and fills them while they are empty."""
     conn = get_db_connection()
     if conn is None:
         return False
 
     cursor = conn.cursor()
     try:
-        # Clear existing logos
-        cursor.execute("DELETE FROM client_logos")
-
-        # Insert new logos
-        for i, logo_url in enumerate(logos, 1):
-            cursor.execute("INSERT INTO client_logos (logo_url, logo_order) VALUES (%s, %s)",
-                           (logo_url, i))
-
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS upload_references (
+                table_name VARCHAR(64) NOT NULL,
+                file_url VARCHAR(255) NOT NULL,
+                refs INT NOT NULL,
+                PRIMARY KEY (table_name, file_url),
+                INDEX idx_upload_reference_url (file_url)
+            )
+        """)
+        cursor.execute("SELECT 1 FROM upload_references LIMIT 1")
+        counted = cursor.fetchone() is not None
         conn.commit()
-        return True
     except mysql.connector.Error as err:
-        print(f"Error updating client logos: {err}")
+        print(f"Error creating upload_references table: {err}")
         return False
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
-
-def fetch_founders():
-    """Fetches all founders from the database."""
-    conn = get_db_connection()
-    if conn is None:
-        return []
-    cursor = conn.cursor(dictionary=True)
+    # A new table starts empty; count every table once without collecting anything
+    return counted or refresh_upload_references(collect=False)
+
+def finalize_stored_file(tmp_path, content_hash, ext, folder=None):
+    """Moves a fully written file to its content-addressed name; returns (filename, created).
+
+    If a file with the same content already exists the new copy is discarded.
+    """
+    folder = folder or app.config['UPLOAD_FOLDER']
+    filename = f"{content_hash}{ext}"
+    final_path = os.path.join(folder, filename)
+    if os.path.exists(final_path):
+        os.remove(tmp_path)
+        return filename, False
+    os.chmod(tmp_path, 0o644)
+    os.replace(tmp_path, final_path)
+    return filename, True
+
+def store_upload_stream(stream, original_name, folder=None):
+    """Hashes a stream into folder and returns (digest, filename, size, created).
+
+    The bytes go to a temporary file in the same folder while they are hashed,
+    then finalize_stored_file() renames it into place.
+    """
+    folder = folder or app.config['UPLOAD_FOLDER']
+    ext = os.path.splitext(secure_filename(original_name))[1].lower()
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.upload-', suffix='.tmp')
     try:
-        cursor.execute("SELECT * FROM founders ORDER BY founder_order")
-        data = cursor.fetchall()
-        return data
-    except mysql.connector.Error as err:
-        print(f"Error fetching founders: {err}")
-        return []
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
-
-def update_founders(founders_list):
-    """Updates the founders in the database by clearing existing and inserting new ones."""
+        with os.fdopen(fd, 'wb') as out:
+            while True:
+                chunk = stream.read(UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+        filename, created = finalize_stored_file(tmp_path, digest.hexdigest(), ext, folder)
+        return digest.hexdigest(), filename, size, created
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def register_upload(content_hash, file_url, original_name, size):
+    """Adds a stored file to the uploads index (or touches it if it is already there)."""
     conn = get_db_connection()
     if conn is None:
         return False
     cursor = conn.cursor()
     try:
-        cursor.execute("DELETE FROM founders")
-
-        query = "INSERT INTO founders (founder_name, founder_role, founder_image, founder_description, founder_order) VALUES (%s, %s, %s, %s, %s)"
-        for i, founder in enumerate(founders_list, 1):
-            cursor.execute(query, (founder['founder_name'], founder['founder_role'], founder['founder_image'], founder['founder_description'], i))
+        # Content may already point at the URL (e.g. the file was uploaded again), so start from its count
+        cursor.execute("""INSERT INTO uploads (content_hash, file_url, original_name, size_bytes, ref_count)
+                          SELECT %s, %s, %s, %s, COALESCE(SUM(refs), 0) FROM upload_references WHERE file_url = %s
+                          ON DUPLICATE KEY UPDATE updated_at = CURRENT_TIMESTAMP""",
+                       (content_hash, file_url, original_name, size, file_url))
         conn.commit()
         return True
     except mysql.connector.Error as err:
-        print(f"Error updating founders: {err}")
+        print(f"Error registering upload: {err}")
         return False
     finally:
         if cursor:
@@ -312,41 +649,173 @@ def update_founders(founders_list):
         if conn:
             conn.close()
 
-def fetch_who_we_work_with():
-    """Fetches all 'Who We Work With' entries from the database."""
+def save_upload(file):
+    """Saves an uploaded file content-addressed under UPLOAD_FOLDER and returns its public URL.
+
+    Identical bytes map to the same file. New images are queued for responsive
+    variants (see queue_image_variants).
+    """
+    content_hash, filename, size, created = store_upload_stream(file.stream, file.filename)
+    file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    file_url = f"/static/uploads/{filename}"
+    if created:
+        queue_image_variants(file_path)
+    register_upload(content_hash, file_url, file.filename, size)
+    return file_url
+
+def refresh_upload_references(tables=None, collect=True):
+    """Recounts the upload URLs in the given tables (all of them by default).
+
+    Each table's text columns are read once and the URLs found in them replace
+    that table's rows in upload_references; ref_count is then recomputed for the
+    uploads whose counts changed. With collect=True, uploads that have had no
+    references for UPLOAD_GC_GRACE seconds are then deleted, except those a
+    retained upload session may still hand to an admin form.
+    """
+    reference_columns = upload_reference_columns(tables)
+    if not reference_columns and tables is None:
+        # Without the schema every count would be zero, and the GC would delete live files
+        print("Error refreshing upload references: schema unavailable")
+        return False
+
     conn = get_db_connection()
     if conn is None:
-        return []
+        return False
     cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("SELECT * FROM who_we_work_with ORDER BY work_order")
-        data = cursor.fetchall()
-        return data
+        affected = set()
+        for table, columns in reference_columns.items():
+            cursor.execute(f"SELECT {', '.join(f'`{column}`' for column in columns)} FROM `{table}`")
+            counts = {}
+            for row in cursor.fetchall():
+                for value in row.values():
+                    if isinstance(value, str) and '/static/uploads/' in value:
+                        for url in UPLOAD_URL_RE.findall(value):
+                            counts[url] = counts.get(url, 0) + 1
+
+            cursor.execute("SELECT file_url, refs FROM upload_references WHERE table_name = %s", (table,))
+            previous = {row['file_url']: row['refs'] for row in cursor.fetchall()}
+            if previous == counts:
+                continue
+            affected |= {url for url in previous.keys() | counts.keys() if previous.get(url) != counts.get(url)}
+            cursor.execute("DELETE FROM upload_references WHERE table_name = %s", (table,))
+            if counts:
+                cursor.executemany("INSERT INTO upload_references (table_name, file_url, refs) VALUES (%s, %s, %s)",
+                                   [(table, url, refs) for url, refs in counts.items()])
+
+        if affected:
+            placeholders = ', '.join(['%s'] * len(affected))
+            cursor.execute(f"""UPDATE uploads u
+                               SET u.ref_count = (SELECT COALESCE(SUM(r.refs), 0) FROM upload_references r
+                                                  WHERE r.file_url = u.file_url)
+                               WHERE u.file_url IN ({placeholders})""", list(affected))
+        orphans = []
+        if collect:
+            cursor.execute("""SELECT upload_id, file_url FROM uploads u
+                              WHERE ref_count = 0 AND updated_at < %s
+                                AND NOT EXISTS (SELECT 1 FROM upload_sessions s WHERE s.file_url = u.file_url)""",
+                           (datetime.now() - timedelta(seconds=UPLOAD_GC_GRACE),))
+            orphans = cursor.fetchall()
+            if orphans:
+                placeholders = ', '.join(['%s'] * len(orphans))
+                cursor.execute(f"DELETE FROM uploads WHERE upload_id IN ({placeholders})",
+                               [row['upload_id'] for row in orphans])
+        conn.commit()
+        for row in orphans:
+            remove_upload_files(row['file_url'])
+        return True
     except mysql.connector.Error as err:
-        print(f"Error fetching 'who we work with' data: {err}")
-        return []
+        print(f"Error refreshing upload references: {err}")
+        return False
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
 
-def update_who_we_work_with(work_with_list):
-    """Updates the 'Who We Work With' entries in the database."""
+def remove_upload_files(file_url):
+    """Deletes an upload and its image variants from disk."""
+    path = os.path.join(app.root_path, file_url.lstrip('/'))
+    stem = os.path.splitext(path)[0]
+    for candidate in [path, f"{stem}.variants.json"] + glob.glob(f"{glob.escape(stem)}-*w.*"):
+        try:
+            os.remove(candidate)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"Error removing {candidate}: {e}")
+    _image_manifests.pop(file_url, None)
+
+# Admin views whose saves can add or drop references to uploads. CMS saves are recognised by the
+# content cache versions they bump; blog views always write blog_posts.
+UPLOAD_REFERENCING_ENDPOINTS = {'admin_update', 'admin_blog_create', 'admin_blog_edit', 'admin_blog_delete'}
+
+@app.before_request
+def snapshot_content_versions():
+    if request.method == 'POST' and request.endpoint in UPLOAD_REFERENCING_ENDPOINTS:
+        g.content_versions = {table: content_cache.table_version(table) for table in CACHED_CONTENT_TABLES}
+
+@app.after_request
+def recount_upload_references(response):
+    """Keeps ref_count current after any admin save, recounting only the tables it changed."""
+    versions = g.pop('content_versions', None)
+    if versions is not None:
+        tables = {table for table, version in versions.items() if content_cache.table_version(table) != version}
+        if request.endpoint.startswith('admin_blog_'):
+            tables.add('blog_posts')
+        if tables:
+            refresh_upload_references(tables)
+    return response
+
+@app.after_request
+def cache_hashed_uploads(response):
+    """Content-addressed uploads never change, so browsers may keep them forever."""
+    if (request.endpoint == 'static' and response.status_code in (200, 206, 304)
+            and (request.view_args or {}).get('filename', '').startswith('uploads/')
+            and HASHED_UPLOAD_RE.match(request.view_args['filename'].rsplit('/', 1)[-1])):
+        # The static view marks files no-cache by default, which would override immutable
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
+# =================================================================================================
+# Chunked Uploads
+# =================================================================================================
+# Large files (mostly admin videos) are sent as a series of PUTs, each carrying its byte offset
+# and a SHA-256 of the chunk. Chunks are written in place into a .part file inside UPLOAD_FOLDER
+# (no buffering of the whole file), progress lives in upload_sessions so an interrupted upload
+# resumes from the last verified byte, and the finished file is renamed to its content address.
+UPLOAD_SESSION_CHUNK_SIZE = int(os.getenv('UPLOAD_SESSION_CHUNK_SIZE', 8 * 1024 * 1024))
+UPLOAD_SESSION_MAX_SIZE = int(os.getenv('UPLOAD_SESSION_MAX_SIZE', 2 * 1024 * 1024 * 1024))
+UPLOAD_SESSION_EXPIRY = int(os.getenv('UPLOAD_SESSION_EXPIRY', 24 * 3600))  # seconds an unfinished upload is kept
+# seconds a completed session is kept, so a form still holding its upload id can be submitted
+UPLOAD_SESSION_COMPLETED_RETENTION = int(os.getenv('UPLOAD_SESSION_COMPLETED_RETENTION', 7 * 24 * 3600))
+
+def create_upload_sessions_table():
+    """Creates the upload_sessions table if it doesn't exist."""
     conn = get_db_connection()
     if conn is None:
         return False
+
     cursor = conn.cursor()
     try:
-        cursor.execute("DELETE FROM who_we_work_with")
-
-        query = "INSERT INTO who_we_work_with (work_icon, work_title, work_description, work_order) VALUES (%s, %s, %s, %s)"
-        for i, work_item in enumerate(work_with_list, 1):
-            cursor.execute(query, (work_item['work_icon'], work_item['work_title'], work_item['work_description'], i))
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS upload_sessions (
+                upload_id CHAR(32) PRIMARY KEY,
+                original_name VARCHAR(255) NOT NULL,
+                total_size BIGINT NOT NULL,
+                received_bytes BIGINT NOT NULL DEFAULT 0,
+                file_url VARCHAR(255),
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """)
         conn.commit()
         return True
     except mysql.connector.Error as err:
-        print(f"Error updating 'who we work with' data: {err}")
+        print(f"Error creating upload_sessions table: {err}")
         return False
     finally:
         if cursor:
@@ -354,142 +823,179 @@ def update_who_we_work_with(work_with_list):
         if conn:
             conn.close()
 
-def update_services(services_list):
-    """Updates the services in the database by clearing existing and inserting new ones."""
+def upload_part_path(upload_id):
+    return os.path.join(app.config['UPLOAD_FOLDER'], f".chunked-{upload_id}.part")
+
+def upload_session_status(session_row):
+    """Public view of an upload session, used by the chunk endpoints."""
+    return {
+        'upload_id': session_row['upload_id'],
+        'size': session_row['total_size'],
+        'received': session_row['received_bytes'],
+        'chunk_size': UPLOAD_SESSION_CHUNK_SIZE,
+        'complete': session_row['file_url'] is not None,
+        'url': session_row['file_url']
+    }
+
+def start_upload_session(original_name, total_size):
+    """Registers a new chunked upload and creates its empty .part file; returns the session."""
+    expire_upload_sessions()
+    upload_id = secrets.token_hex(16)
     conn = get_db_connection()
     if conn is None:
-        return False
-    cursor = conn.cursor()
+        return None
+    cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("DELETE FROM servicesTable")
-
-        query = "INSERT INTO servicesTable (service_head, service_icon, service_desc) VALUES (%s, %s, %s)"
-        for service in services_list:
-            cursor.execute(query, (
-                service['service_head'], 
-                service.get('service_icon', 'fas fa-cogs'),  # Default icon if not provided
-                service['service_desc']
-            ))
+        open(upload_part_path(upload_id), 'wb').close()
+        cursor.execute("INSERT INTO upload_sessions (upload_id, original_name, total_size) VALUES (%s, %s, %s)",
+                       (upload_id, original_name, total_size))
         conn.commit()
-        return True
-    except mysql.connector.Error as err:
-        print(f"Error updating services: {err}")
-        return False
+        return {'upload_id': upload_id, 'total_size': total_size, 'received_bytes': 0, 'file_url': None}
+    except (mysql.connector.Error, OSError) as err:
+        print(f"Error starting upload session: {err}")
+        return None
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
 
-def update_data(table_name, data_dict):
-    """Updates data in a specified table, handling missing columns gracefully."""
+def get_upload_session(upload_id):
+    """Fetches an upload session by id."""
     conn = get_db_connection()
     if conn is None:
-        return False
-
-    cursor = conn.cursor()
+        return None
+    cursor = conn.cursor(dictionary=True)
     try:
-        # First, get existing columns in the table
-        cursor.execute(f"DESCRIBE {table_name}")
-        existing_columns = [row[0] for row in cursor.fetchall()]
-
-        # Filter data_dict to only include existing columns
-        filtered_data = {}
-        for key, value in data_dict.items():
-            if key in existing_columns:
-                filtered_data[key] = value
-            else:
-                print(f"Warning: Column '{key}' does not exist in table '{table_name}'. Skipping...")
-
-        if not filtered_data:
-            print(f"No valid columns to update in table '{table_name}'")
-            return False
-
-        # Build the SET clause dynamically with filtered data
-        set_clause = ', '.join([f"{key} = %s" for key in filtered_data.keys()])
-        values = list(filtered_data.values())
-
-        # Determine the primary key field name based on table name
-        id_field = 'id'
-        if table_name == 'navTable':
-            id_field = 'nav_id'
-        elif table_name == 'heroTable':
-            id_field = 'hero_id'
-        elif table_name == 'Ourclients':
-            id_field = 'clients_id'
-        elif table_name == 'innovations':
-            id_field = 'innovation_id'
-        elif table_name == 'know':
-            id_field = 'know_id'
-        elif table_name == 'statistics':
-            id_field = 'stat_id'
-        elif table_name == 'footer':
-            id_field = 'ftr_id'
-        elif table_name == 'aboutUs':
-            id_field = 'about_id'
-        elif table_name == 'servicesTable':
-            id_field = 'service_id'
-
-        query = f"UPDATE {table_name} SET {set_clause} WHERE {id_field} = 1"
-
-        cursor.execute(query, values)
-        conn.commit()
-        return True
+        cursor.execute("SELECT * FROM upload_sessions WHERE upload_id = %s", (upload_id,))
+        return cursor.fetchone()
     except mysql.connector.Error as err:
-        print(f"Error updating data in {table_name}: {err}")
-        return False
+        print(f"Error fetching upload session: {err}")
+        return None
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
-# ========================================================team members
-def fetch_team_members():
-    """Fetches all active team members from the database."""
+
+def write_upload_chunk(upload_id, offset, stream, expected_sha256=None):
+    """Writes one chunk at offset and advances the session.
+
+    The session row is locked for the duration, so concurrent PUTs for the same
+    upload are applied one at a time. A chunk that was already received is
+    acknowledged without rewriting it; a gap or a checksum mismatch leaves the
+    session where it was.
+
+    Returns:
+        tuple: (session dict or None, error message or None)
+    """
     conn = get_db_connection()
     if conn is None:
-        return []
+        return None, "Database unavailable"
     cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("SELECT * FROM team_members WHERE member_status = 'active' ORDER BY team_order")
-        data = cursor.fetchall()
-        return data
-    except mysql.connector.Error as err:
-        print(f"Error fetching team members: {err}")
-        return []
+        cursor.execute("SELECT * FROM upload_sessions WHERE upload_id = %s FOR UPDATE", (upload_id,))
+        session_row = cursor.fetchone()
+        if session_row is None:
+            return None, "Upload not found"
+        if session_row['file_url'] is not None or offset < session_row['received_bytes']:
+            return session_row, None
+        if offset > session_row['received_bytes']:
+            return session_row, f"Expected offset {session_row['received_bytes']}"
+
+        digest = hashlib.sha256()
+        written = 0
+        limit = session_row['total_size'] - offset
+        with open(upload_part_path(upload_id), 'r+b') as part:
+            part.seek(offset)
+            while True:
+                piece = stream.read(min(UPLOAD_CHUNK_SIZE, limit - written + 1))
+                if not piece:
+                    break
+                written += len(piece)
+                if written > limit:
+                    return session_row, "Chunk runs past the declared file size"
+                digest.update(piece)
+                part.write(piece)
+        if expected_sha256 and digest.hexdigest() != expected_sha256.lower():
+            return session_row, "Checksum mismatch"
+
+        session_row['received_bytes'] = offset + written
+        cursor.execute("UPDATE upload_sessions SET received_bytes = %s WHERE upload_id = %s",
+                       (session_row['received_bytes'], upload_id))
+        if session_row['received_bytes'] == session_row['total_size']:
+            session_row['file_url'] = finish_upload_session(session_row)
+            cursor.execute("UPDATE upload_sessions SET file_url = %s WHERE upload_id = %s",
+                           (session_row['file_url'], upload_id))
+        conn.commit()
+        return session_row, None
+    except (mysql.connector.Error, OSError) as err:
+        print(f"Error writing upload chunk: {err}")
+        return None, "Could not store chunk"
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
 
-def update_team_members(team_members_list):
-    """Updates the team members in the database by clearing existing and inserting new ones."""
+def finish_upload_session(session_row):
+    """Hashes the completed .part file, moves it to its content address and indexes it."""
+    part_path = upload_part_path(session_row['upload_id'])
+    with open(part_path, 'r+b') as part:
+        # Drop anything an interrupted attempt wrote past the end
+        part.truncate(session_row['total_size'])
+    digest = hashlib.sha256()
+    with open(part_path, 'rb') as part:
+        for piece in iter(lambda: part.read(UPLOAD_CHUNK_SIZE), b''):
+            digest.update(piece)
+    ext = os.path.splitext(secure_filename(session_row['original_name']))[1].lower()
+    filename, created = finalize_stored_file(part_path, digest.hexdigest(), ext)
+    if created:
+        queue_image_variants(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+    file_url = f"/static/uploads/{filename}"
+    register_upload(digest.hexdigest(), file_url, session_row['original_name'], session_row['total_size'])
+    return file_url
+
+def get_completed_upload_url(upload_id):
+    """URL of a finished chunked upload, or None if it is unknown, still in progress or gone."""
+    session_row = get_upload_session(upload_id)
+    if not session_row or not session_row['file_url']:
+        return None
+    if not os.path.isfile(os.path.join(app.root_path, session_row['file_url'].lstrip('/'))):
+        return None
+    return session_row['file_url']
+
+def expire_upload_sessions():
+    """Deletes expired upload sessions.
+
+    Unfinished uploads idle for longer than UPLOAD_SESSION_EXPIRY go with their .part
+    files; completed ones are kept for UPLOAD_SESSION_COMPLETED_RETENTION.
+    """
     conn = get_db_connection()
     if conn is None:
-        return False
-    cursor = conn.cursor()
+        return 0
+    cursor = conn.cursor(dictionary=True)
     try:
-        # Clear existing active team members
-        cursor.execute("DELETE FROM team_members WHERE member_status = 'active'")
-
-        query = """INSERT INTO team_members 
-                   (member_name, member_position, member_description, member_image, team_order, member_status) 
-                   VALUES (%s, %s, %s, %s, %s, %s)"""
-        for i, member in enumerate(team_members_list, 1):
-            cursor.execute(query, (
-                member['member_name'], 
-                member['member_position'], 
-                member['member_description'], 
-                member['member_image'], 
-                i, 
-                'active'
-            ))
+        now = datetime.now()
+        cursor.execute("""SELECT upload_id FROM upload_sessions
+                          WHERE (file_url IS NULL AND updated_at < %s)
+                             OR (file_url IS NOT NULL AND updated_at < %s)""",
+                       (now - timedelta(seconds=UPLOAD_SESSION_EXPIRY),
+                        now - timedelta(seconds=UPLOAD_SESSION_COMPLETED_RETENTION)))
+        expired = [row['upload_id'] for row in cursor.fetchall()]
+        if expired:
+            placeholders = ', '.join(['%s'] * len(expired))
+            cursor.execute(f"DELETE FROM upload_sessions WHERE upload_id IN ({placeholders})", expired)
         conn.commit()
-        return True
+        for upload_id in expired:
+            try:
+                os.remove(upload_part_path(upload_id))
+            except FileNotFoundError:
+                pass
+        return len(expired)
     except mysql.connector.Error as err:
-        print(f"Error updating team members: {err}")
-        return False
+        print(f"Error expiring upload sessions: {err}")
+        return 0
     finally:
         if cursor:
             cursor.close()
@@ -497,36 +1003,1826 @@ def update_team_members(team_members_list):
             conn.close()
 
 # =================================================================================================
-# Contact Form Database Functions
+# Media Serving
 # =================================================================================================
-def create_contact_submissions_table():
-    """Creates the contact_submissions table if it doesn't exist."""
-    conn = get_db_connection()
-    if conn is None:
-        return False
-    
-    cursor = conn.cursor()
+# Uploaded media and site assets are served from /media/<path> rather than Flask's static view.
+# Templates link to them through media_url(), which adds ?v=<version> (from size and mtime) to
+# names that aren't already content-addressed, so every URL it hands out can be cached forever.
+# Range requests get 206 partial responses for video seeking. Behind nginx or Apache the bytes
+# can be handed off with X-Accel-Redirect / X-Sendfile; otherwise the file goes out through the
+# server's wsgi.file_wrapper, which gunicorn and uWSGI back with sendfile().
+MEDIA_DIRECTORIES = {'uploads', 'assets'}
+MEDIA_OFFLOAD = os.getenv('MEDIA_OFFLOAD', '').lower()  # '', 'x-accel-redirect' or 'x-sendfile'
+MEDIA_ACCEL_PREFIX = os.getenv('MEDIA_ACCEL_PREFIX', '/protected-static/')
+MEDIA_MAX_AGE = int(os.getenv('MEDIA_MAX_AGE', 3600))  # for unversioned requests
+MEDIA_IMMUTABLE_MAX_AGE = 31536000
+
+def media_path(filename):
+    """Absolute path of a servable media file, or None if it is outside the media directories."""
+    if filename.split('/', 1)[0] not in MEDIA_DIRECTORIES or '/cvs/' in f"/{filename}":
+        return None
+    path = safe_join(app.static_folder, filename)
+    if path is None or not os.path.isfile(path):
+        return None
+    return path
+
+def media_version(path):
+    """Short token that changes whenever the file at path is replaced or rewritten."""
+    stat = os.stat(path)
+    return hashlib.sha1(f"{stat.st_size}:{stat.st_mtime_ns}".encode()).hexdigest()[:12]
+
+@app.template_global()
+def media_url(url):
+    """Versioned /media URL for a /static upload or asset; other URLs are returned unchanged."""
+    if not url:
+        return ''
+    filename = url.split('?', 1)[0].lstrip('/')
+    if not filename.startswith('static/'):
+        return url
+    filename = filename[len('static/'):]
+    path = media_path(filename)
+    if path is None:
+        return url
+    if HASHED_UPLOAD_RE.match(os.path.basename(filename)):
+        return f"/media/{filename}"
+    return f"/media/{filename}?v={media_version(path)}"
+
+def send_media(path, filename, immutable):
+    """Response for one media file, offloaded to the front-end server when configured."""
+    max_age = MEDIA_IMMUTABLE_MAX_AGE if immutable else MEDIA_MAX_AGE
+    if MEDIA_OFFLOAD in ('x-accel-redirect', 'x-sendfile'):
+        # The proxy answers Range and conditional requests itself
+        response = make_response('')
+        response.headers['Content-Type'] = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        if MEDIA_OFFLOAD == 'x-accel-redirect':
+            response.headers['X-Accel-Redirect'] = MEDIA_ACCEL_PREFIX.rstrip('/') + '/' + filename
+        else:
+            response.headers['X-Sendfile'] = os.path.abspath(path)
+    else:
+        # conditional=True handles If-None-Match/If-Modified-Since and Range/If-Range (206 or 416)
+        # Without max_age send_file marks the response no-cache, which would override immutable
+        response = send_file(path, conditional=True, etag=True, max_age=max_age)
+
+    response.headers['Accept-Ranges'] = 'bytes'
+    response.cache_control.public = True
+    response.cache_control.max_age = max_age
+    if immutable:
+        response.cache_control.immutable = True
+    return response
+
+# =================================================================================================
+# Static Assets
+# =================================================================================================
+# build_assets.py writes minified, content-hashed copies of the css/js files and bundles to
+# static/dist with a manifest. url_for('static', filename='css/x.css') resolves to the built
+# copy when one exists, and asset_tags() includes a bundle; without a build both fall back to the
+# source files. In debug mode a source edited after the last build is served directly.
+ASSET_MANIFEST_PATH = os.path.join(app.static_folder, DIST_FOLDER, MANIFEST_FILE)
+
+_asset_manifest = {'mtime': None, 'bundles': {}, 'files': {}}
+
+def asset_manifest():
+    """The build manifest, reloaded whenever the file changes; empty if assets were never built."""
     try:
-        cursor.execute("""
-            CREATE TABLE IF NOT EXISTS contact_submissions (
-                id INT AUTO_INCREMENT PRIMARY KEY,
-                name VARCHAR(255) NOT NULL,
-                email VARCHAR(255) NOT NULL,
-                subject TEXT,
-                message TEXT,
-                submission_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                status ENUM('new', 'read', 'replied', 'archived') DEFAULT 'new',
-                priority ENUM('low', 'medium', 'high') DEFAULT 'medium',
-                assigned_to VARCHAR(255),
-                notes TEXT,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+        mtime = os.stat(ASSET_MANIFEST_PATH).st_mtime
+    except OSError:
+        mtime = None
+    if mtime != _asset_manifest['mtime']:
+        manifest = {}
+        if mtime is not None:
+            try:
+                with open(ASSET_MANIFEST_PATH) as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Error loading asset manifest: {e}")
+        _asset_manifest.update(mtime=mtime, bundles=manifest.get('bundles', {}),
+                               files=manifest.get('files', {}))
+    return _asset_manifest
+
+def built_asset(name, sources, kind='files'):
+    """Path under static/ of the built copy of name, or None to use the sources."""
+    manifest = asset_manifest()
+    built = manifest[kind].get(name)
+    if built and app.debug:
+        try:
+            if any(os.stat(os.path.join(app.static_folder, source)).st_mtime > manifest['mtime']
+                   for source in sources):
+                return None
+        except OSError:
+            return None
+    return built
+
+@app.url_defaults
+def fingerprint_static_urls(endpoint, values):
+    """Points url_for('static', filename=...) at the built copy of a css/js file."""
+    if endpoint == 'static' and values.get('filename'):
+        built = built_asset(values['filename'], [values['filename']])
+        if built:
+            values['filename'] = built
+
+@app.template_global()
+def asset_tags(bundle):
+    """<link>/<script> tags for a bundle: its built file, or one tag per source if not built."""
+    sources = ASSET_BUNDLES[bundle]
+    built = built_asset(bundle, sources, 'bundles')
+    urls = [url_for('static', filename=built)] if built else [url_for('static', filename=s) for s in sources]
+    if bundle.endswith('.css'):
+        tags = [f'<link rel="stylesheet" href="{escape(url)}">' for url in urls]
+    else:
+        tags = [f'<script src="{escape(url)}"></script>' for url in urls]
+    return Markup('\n    '.join(tags))
+
+@app.after_request
+def cache_built_assets(response):
+    """Built assets carry their content hash in the name, so they never need revalidating."""
+    if (request.endpoint == 'static' and response.status_code in (200, 206, 304)
+            and (request.view_args or {}).get('filename', '').startswith(f"{DIST_FOLDER}/")):
+        # The static view marks files no-cache by default (SEND_FILE_MAX_AGE_DEFAULT is None)
+        response.cache_control.no_cache = None
+        response.cache_control.public = True
+        response.cache_control.max_age = 31536000
+        response.cache_control.immutable = True
+    return response
+
+# =================================================================================================
+# Responsive Image Variants
+# =================================================================================================
+# Each uploaded JPEG/PNG gets resized copies next to it, in WebP and in its own format, with
+# metadata stripped: photo.png -> photo-640w.webp, photo-640w.png, ... plus photo.variants.json
+# listing the widths. The full width is re-encoded too, so pages never link the upload itself
+# and its EXIF/GPS data. Templates call responsive_image() to emit a <picture> with srcsets.
+IMAGE_VARIANT_WIDTHS = tuple(int(w) for w in os.getenv('IMAGE_VARIANT_WIDTHS', '320,640,960,1440,1920').split(','))
+IMAGE_VARIANT_QUALITY = int(os.getenv('IMAGE_VARIANT_QUALITY', 82))
+IMAGE_VARIANT_WORKERS = int(os.getenv('IMAGE_VARIANT_WORKERS', 2))
+IMAGE_VARIANT_FORMATS = {'.jpg': 'JPEG', '.jpeg': 'JPEG', '.png': 'PNG'}
+IMAGE_MANIFEST_RETRY = 60  # seconds before a missing manifest is looked for again
+# Bumped when the set of files a manifest promises changes; older manifests are regenerated
+IMAGE_MANIFEST_VERSION = 2
+
+_image_executor = None
+_image_executor_lock = threading.Lock()
+_image_manifests = {}
+
+def image_executor():
+    """Returns the worker pool that builds variants, creating it on first use."""
+    global _image_executor
+    if _image_executor is None:
+        with _image_executor_lock:
+            if _image_executor is None:
+                _image_executor = ThreadPoolExecutor(max_workers=IMAGE_VARIANT_WORKERS,
+                                                     thread_name_prefix='image-variants')
+    return _image_executor
+
+def queue_image_variants(path):
+    """Schedules variant generation for an image; a no-op for other files or without Pillow."""
+    if Image is None or os.path.splitext(path)[1].lower() not in IMAGE_VARIANT_FORMATS:
+        return None
+    return image_executor().submit(generate_image_variants, path)
+
+def generate_image_variants(path):
+    """Writes the resized WebP and original-format copies of one image, then its manifest."""
+    stem, ext = os.path.splitext(path)
+    image_format = IMAGE_VARIANT_FORMATS[ext.lower()]
+    try:
+        with Image.open(path) as original:
+            # Bake the EXIF orientation into the pixels, since the metadata is dropped below
+            image = ImageOps.exif_transpose(original)
+            image.load()
+        widths = sorted({w for w in IMAGE_VARIANT_WIDTHS if w < image.width} | {image.width})
+        for width in widths:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+            # Pillow only writes EXIF/ICC/text chunks when asked to, so these copies carry no metadata
+            resized.save(f"{stem}-{width}w.webp", 'WEBP', quality=IMAGE_VARIANT_QUALITY, method=4)
+            if image_format == 'JPEG':
+                if resized.mode not in ('RGB', 'L'):
+                    resized = resized.convert('RGB')
+                resized.save(f"{stem}-{width}w{ext}", 'JPEG', quality=IMAGE_VARIANT_QUALITY,
+                             optimize=True, progressive=True)
+            else:
+                resized.save(f"{stem}-{width}w{ext}", 'PNG', optimize=True)
+
+        manifest_path = f"{stem}.variants.json"
+        with open(manifest_path + '.tmp', 'w') as f:
+            json.dump({'version': IMAGE_MANIFEST_VERSION, 'widths': widths, 'width': image.width}, f)
+        os.replace(manifest_path + '.tmp', manifest_path)
+        return widths
+    except Exception as e:
+        print(f"Error generating image variants for {path}: {e}")
+        return None
+
+def image_manifest_is_current(manifest_path):
+    """Whether a variants manifest exists and was written by the current generator."""
+    try:
+        with open(manifest_path) as f:
+            return json.load(f).get('version') == IMAGE_MANIFEST_VERSION
+    except (OSError, ValueError):
+        return False
+
+def backfill_image_variants():
+    """Queues variants for uploaded images that don't have them (or have outdated ones)."""
+    if Image is None:
+        return 0
+    queued = 0
+    for entry in os.scandir(UPLOAD_FOLDER):
+        stem, ext = os.path.splitext(entry.name)
+        if (entry.is_file() and ext.lower() in IMAGE_VARIANT_FORMATS
+                and not re.search(r'-\d+w$', stem)
+                and not image_manifest_is_current(os.path.join(UPLOAD_FOLDER, f"{stem}.variants.json"))):
+            queue_image_variants(entry.path)
+            queued += 1
+    if queued:
+        print(f"Queued image variants for {queued} existing upload(s)")
+    return queued
+
+def image_variant_widths(url):
+    """Widths available for an uploaded image URL, or None if it has no variants (yet)."""
+    if not url or not url.startswith('/static/uploads/'):
+        return None
+    cached = _image_manifests.get(url)
+    if cached and (cached[0] is not None or time.monotonic() - cached[1] < IMAGE_MANIFEST_RETRY):
+        return cached[0]
+    stem = os.path.splitext(os.path.join(app.root_path, url.lstrip('/')))[0]
+    try:
+        with open(f"{stem}.variants.json") as f:
+            manifest = json.load(f)
+        # An older manifest has no stripped full-width copy; use the plain <img> until backfilled
+        widths = manifest['widths'] if manifest.get('version') == IMAGE_MANIFEST_VERSION else None
+    except (OSError, ValueError, KeyError):
+        widths = None
+    _image_manifests[url] = (widths, time.monotonic())
+    return widths
+
+@app.template_global()
+def image_srcset(url, image_format=None):
+    """srcset value for an uploaded image; image_format='webp' lists the WebP variants."""
+    widths = image_variant_widths(url)
+    if not widths:
+        return ''
+    stem, ext = os.path.splitext(url)
+    if image_format == 'webp':
+        return ', '.join(f"{media_url(f'{stem}-{w}w.webp')} {w}w" for w in widths)
+    return ', '.join(f"{media_url(f'{stem}-{w}w{ext}')} {w}w" for w in widths)
+
+@app.template_global()
+def responsive_image(url, alt='', sizes='100vw', **attrs):
+    """<picture> with WebP and original-format srcsets, or a plain <img> when there are no variants."""
+    extra = ''.join(f' {name.replace("_", "-")}="{escape(value)}"' for name, value in attrs.items())
+    widths = image_variant_widths(url)
+    if not widths:
+        return Markup(f'<img src="{escape(media_url(url))}" alt="{escape(alt or "")}"{extra}>')
+    # The stripped full-width copy stands in for the upload, which still carries its metadata
+    stem, ext = os.path.splitext(url)
+    img = f'<img src="{escape(media_url(f"{stem}-{widths[-1]}w{ext}"))}" alt="{escape(alt or "")}"{extra}'
+    return Markup(
+        f'<picture>'
+        f'<source type="image/webp" srcset="{escape(image_srcset(url, "webp"))}" sizes="{escape(sizes)}">'
+        f'{img} srcset="{escape(image_srcset(url))}" sizes="{escape(sizes)}">'
+        f'</picture>'
+    )
+
+# =================================================================================================
+# Request Metrics
+# =================================================================================================
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+# Latency histogram bucket bounds, in seconds
+METRICS_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+class RequestMetrics:
+    """Per-endpoint counters rendered in the Prometheus text format.
+
+    During a request the numbers accumulate on g.metrics without locking; they
+    are folded into the shared totals once, in record_request().
+    """
+
+    TOTALS = (
+        ('db_queries', 'mindtunes_db_queries_total', 'Database statements executed'),
+        ('db_time', 'mindtunes_db_query_seconds_total', 'Time spent executing database statements'),
+        ('smtp_time', 'mindtunes_smtp_seconds_total', 'Time spent talking to the SMTP server'),
+        ('render_time', 'mindtunes_template_render_seconds_total', 'Time spent rendering Jinja templates'),
+        ('response_bytes', 'mindtunes_response_bytes_total', 'Response body bytes sent')
+    )
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self._endpoints = {}
+        self._statuses = {}
+        self._lock = threading.Lock()
+
+    def _endpoint(self, endpoint):
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = {'buckets': [0] * len(self.buckets), 'count': 0, 'sum': 0.0}
+            stats.update({field: 0 for field, _, _ in self.TOTALS})
+            self._endpoints[endpoint] = stats
+        return stats
+
+    def record_request(self, endpoint, status, duration, request_stats):
+        """Folds one finished request into the totals."""
+        bucket = bisect.bisect_left(self.buckets, duration)
+        with self._lock:
+            stats = self._endpoint(endpoint)
+            if bucket < len(self.buckets):
+                stats['buckets'][bucket] += 1
+            stats['count'] += 1
+            stats['sum'] += duration
+            for field, _, _ in self.TOTALS:
+                stats[field] += request_stats.get(field, 0)
+            key = (endpoint, status)
+            self._statuses[key] = self._statuses.get(key, 0) + 1
+
+    def record_background(self, field, value):
+        """Adds work done outside any request (e.g. outbox deliveries) under endpoint="background"."""
+        with self._lock:
+            self._endpoint('background')[field] += value
+
+    def render(self):
+        """Returns every metric in the Prometheus text exposition format."""
+        with self._lock:
+            endpoints = {name: dict(stats, buckets=list(stats['buckets'])) for name, stats in self._endpoints.items()}
+            statuses = dict(self._statuses)
+
+        lines = ['# HELP mindtunes_request_duration_seconds Request latency',
+                 '# TYPE mindtunes_request_duration_seconds histogram']
+        for name, stats in sorted(endpoints.items()):
+            if not stats['count']:
+                continue
+            cumulative = 0
+            for bound, count in zip(self.buckets, stats['buckets']):
+                cumulative += count
+                lines.append(f'mindtunes_request_duration_seconds_bucket{{endpoint="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'mindtunes_request_duration_seconds_bucket{{endpoint="{name}",le="+Inf"}} {stats["count"]}')
+            lines.append(f'mindtunes_request_duration_seconds_sum{{endpoint="{name}"}} {stats["sum"]:.6f}')
+            lines.append(f'mindtunes_request_duration_seconds_count{{endpoint="{name}"}} {stats["count"]}')
+
+        lines += ['# HELP mindtunes_requests_total Requests by endpoint and status',
+                  '# TYPE mindtunes_requests_total counter']
+        for (name, status), count in sorted(statuses.items()):
+            lines.append(f'mindtunes_requests_total{{endpoint="{name}",status="{status}"}} {count}')
+
+        for field, metric, description in self.TOTALS:
+            lines += [f'# HELP {metric} {description}', f'# TYPE {metric} counter']
+            for name, stats in sorted(endpoints.items()):
+                value = stats[field]
+                lines.append(f'{metric}{{endpoint="{name}"}} {value:.6f}' if isinstance(value, float)
+                             else f'{metric}{{endpoint="{name}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+request_metrics = RequestMetrics(METRICS_LATENCY_BUCKETS)
+
+def add_request_metric(field, value):
+    """Adds to a per-request counter, or to the background totals outside a request."""
+    if not METRICS_ENABLED:
+        return
+    if has_request_context() and 'metrics' in g:
+        g.metrics[field] += value
+    else:
+        request_metrics.record_background(field, value)
+
+SLOW_QUERY_THRESHOLD = float(os.getenv('SLOW_QUERY_THRESHOLD', 0.2))  # seconds, 0 disables the log
+REPEATED_QUERY_THRESHOLD = int(os.getenv('REPEATED_QUERY_THRESHOLD', 5))  # debug-mode N+1 warning
+
+_SQL_STRING_RE = re.compile(r"'(?:[^'\\]|\\.)*'")
+_SQL_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_SQL_PLACEHOLDER_RE = re.compile(r"%(?:\([^)]+\))?s")
+_SQL_IN_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+@lru_cache(maxsize=512)
+def normalize_sql(operation):
+    """Reduces a statement to its shape: literals and placeholders become ?, IN lists (?+)."""
+    if isinstance(operation, bytes):
+        operation = operation.decode('utf-8', 'replace')
+    shape = _SQL_STRING_RE.sub('?', operation)
+    shape = _SQL_PLACEHOLDER_RE.sub('?', shape)
+    shape = _SQL_NUMBER_RE.sub('?', shape)
+    shape = _SQL_IN_LIST_RE.sub('(?+)', shape)
+    return ' '.join(shape.split())
+
+def bind_count(params):
+    if not params:
+        return 0
+    return len(params)
+
+def record_query(operation, binds, elapsed):
+    """Metrics, slow-query log and (in debug mode) per-request statement shapes."""
+    add_request_metric('db_time', elapsed)
+    add_request_metric('db_queries', 1)
+    if SLOW_QUERY_THRESHOLD and elapsed >= SLOW_QUERY_THRESHOLD:
+        where = request.endpoint if has_request_context() else 'background'
+        print(f"Slow query ({elapsed * 1000:.0f} ms, {binds} binds) [{where}]: {normalize_sql(operation)}")
+    if app.debug and has_request_context():
+        shapes = g.setdefault('query_shapes', {})
+        shape = normalize_sql(operation)
+        shapes[shape] = shapes.get(shape, 0) + 1
+
+class TimedCursor:
+    """Cursor proxy that times execute()/executemany() for the metrics and slow-query log."""
+
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def execute(self, operation, params=None, multi=False):
+        start = time.perf_counter()
+        if multi:
+            return self._timed_results(self._cursor.execute(operation, params, multi=True), params, start)
+        try:
+            return self._cursor.execute(operation, params)
+        finally:
+            record_query(operation, bind_count(params), time.perf_counter() - start)
+
+    def _timed_results(self, results, params, start):
+        """Records each statement of a multi=True execute as the caller reads its result."""
+        binds = bind_count(params)
+        for result in results:
+            statement = getattr(result, 'statement', None) or ''
+            yield result
+            # By the time the next result is asked for, this statement's rows have been fetched
+            record_query(statement, binds, time.perf_counter() - start)
+            binds, start = 0, time.perf_counter()
+
+    def executemany(self, operation, seq_params):
+        seq_params = list(seq_params)
+        start = time.perf_counter()
+        try:
+            return self._cursor.executemany(operation, seq_params)
+        finally:
+            record_query(operation, sum(bind_count(params) for params in seq_params), time.perf_counter() - start)
+
+class TimedConnection:
+    """Connection proxy whose cursors are TimedCursors."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def cursor(self, *args, **kwargs):
+        return TimedCursor(self._conn.cursor(*args, **kwargs))
+
+@app.after_request
+def report_repeated_queries(response):
+    """In debug mode, warns about statements a request ran more than REPEATED_QUERY_THRESHOLD times."""
+    shapes = g.pop('query_shapes', None)
+    if shapes:
+        for shape, count in shapes.items():
+            if count > REPEATED_QUERY_THRESHOLD:
+                print(f"Possible N+1: {request.method} {request.path} ran this statement {count} times: {shape}")
+    return response
+
+@app.before_request
+def start_request_metrics():
+    if METRICS_ENABLED:
+        g.metrics = {field: 0 for field, _, _ in RequestMetrics.TOTALS}
+        g.metrics_started = time.perf_counter()
+
+@app.after_request
+def finish_request_metrics(response):
+    if METRICS_ENABLED and 'metrics_started' in g:
+        if not response.is_streamed:
+            g.metrics['response_bytes'] += response.calculate_content_length() or 0
+        request_metrics.record_request(request.endpoint or 'unmatched', response.status_code,
+                                       time.perf_counter() - g.metrics_started, g.metrics)
+    return response
+
+@before_render_template.connect_via(app)
+def start_template_timer(sender, template, context, **extra):
+    if METRICS_ENABLED:
+        g.setdefault('render_started', []).append(time.perf_counter())
+
+@template_rendered.connect_via(app)
+def stop_template_timer(sender, template, context, **extra):
+    started = g.get('render_started')
+    if started:
+        add_request_metric('render_time', time.perf_counter() - started.pop())
+
+# =================================================================================================
+# Database Connection Pool
+# =================================================================================================
+_db_pools = {}
+_db_pool_lock = threading.Lock()
+
+def get_db_pool(background=False):
+    """Returns the request pool (or the background threads' pool), creating it on first use."""
+    name = f"{DB_POOL_NAME}_background" if background else DB_POOL_NAME
+    if name not in _db_pools:
+        with _db_pool_lock:
+            if name not in _db_pools:
+                _db_pools[name] = pooling.MySQLConnectionPool(
+                    pool_name=name,
+                    pool_size=DB_BACKGROUND_POOL_SIZE if background else DB_POOL_SIZE,
+                    pool_reset_session=True,
+                    connection_timeout=DB_CONNECT_TIMEOUT,
+                    **DB_CONFIG
+                )
+    return _db_pools[name]
+
+def checkout_pooled_connection(background=False):
+    """Borrows a healthy connection from a pool, waiting up to DB_POOL_TIMEOUT seconds."""
+    pool = get_db_pool(background)
+    deadline = time.monotonic() + DB_POOL_TIMEOUT
+    while True:
+        try:
+            conn = pool.get_connection()
+            break
+        except mysql.connector.errors.PoolError:
+            # Pool exhausted - wait for another request to give a connection back
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.05)
+
+    # Health check: revive connections the server dropped while they sat idle
+    try:
+        conn.ping(reconnect=True, attempts=DB_PING_ATTEMPTS, delay=0)
+    except mysql.connector.Error:
+        conn.close()
+        raise
+    return conn
+
+class RequestConnection(TimedConnection):
+    """Proxy around the request's pooled connection.
+
+    Helpers still call close() in their finally blocks. Here that only discards
+    uncommitted work, so the same connection serves the rest of the request and
+    is handed back to the pool in release_db_connection().
+
+    A helper called while another one has a transaction open (e.g. register_upload
+    inside write_upload_chunk) works inside a savepoint instead: its commit() keeps
+    the work for the outer transaction to commit, and its rollback() or close()
+    undoes only what it did, so locks and writes of the caller are left alone.
+    """
+
+    def __init__(self, conn):
+        super().__init__(conn)
+        self._nested = conn.in_transaction
+        self._savepoint = None  # name while the savepoint is open
+        if self._nested:
+            g.db_savepoints = g.get('db_savepoints', 0) + 1
+            self._savepoint = f"helper_{g.db_savepoints}"
+            self._run(f"SAVEPOINT {self._savepoint}")
+
+    def _run(self, statement):
+        cursor = self._conn.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+
+    def commit(self):
+        if not self._nested:
+            self._conn.commit()
+        elif self._savepoint:
+            self._run(f"RELEASE SAVEPOINT {self._savepoint}")
+            self._savepoint = None
+
+    def rollback(self):
+        if not self._nested:
+            self._conn.rollback()
+        elif self._savepoint:
+            self._run(f"ROLLBACK TO SAVEPOINT {self._savepoint}")
+
+    def close(self):
+        try:
+            if not self._nested:
+                if self._conn.in_transaction:
+                    self._conn.rollback()
+            elif self._savepoint:
+                self._run(f"ROLLBACK TO SAVEPOINT {self._savepoint}")
+                self._run(f"RELEASE SAVEPOINT {self._savepoint}")
+        except mysql.connector.Error as err:
+            print(f"Error rolling back request connection: {err}")
+        self._savepoint = None
+
+def get_db_connection():
+    """Returns a pooled database connection.
+
+    Inside a request the connection is borrowed once and kept on flask.g;
+    outside one (startup, scripts, background threads) it comes from the
+    background pool and the caller's close() returns it.
+    """
+    try:
+        if has_app_context():
+            if 'db_conn' not in g:
+                g.db_conn = checkout_pooled_connection()
+            return RequestConnection(g.db_conn)
+        return TimedConnection(checkout_pooled_connection(background=True))
+    except mysql.connector.Error as err:
+        print(f"Error connecting to database: {err}")
+        return None
+
+@app.teardown_appcontext
+def release_db_connection(exception=None):
+    """Returns the request's connection to the pool."""
+    conn = g.pop('db_conn', None)
+    if conn is not None:
+        try:
+            conn.close()
+        except mysql.connector.Error as err:
+            print(f"Error releasing database connection: {err}")
+
+# =================================================================================================
+# Schema Registry
+# =================================================================================================
+class SchemaRegistry:
+    """Columns, types and primary key of every table in the database.
+
+    Introspected from information_schema once (at startup or on first use) and
+    refreshed after migrations, so writers don't DESCRIBE tables on every save.
+    Lookups are case-insensitive to cope with lower_case_table_names=1 servers.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def refresh(self):
+        """Reloads the schema of every table in the current database."""
+        conn = get_db_connection()
+        if conn is None:
+            return False
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute("""
+                SELECT TABLE_NAME AS table_name, COLUMN_NAME AS column_name,
+                       DATA_TYPE AS data_type, COLUMN_KEY AS column_key
+                FROM information_schema.COLUMNS
+                WHERE TABLE_SCHEMA = DATABASE()
+                ORDER BY TABLE_NAME, ORDINAL_POSITION
+            """)
+            tables = {}
+            for row in cursor.fetchall():
+                table = tables.setdefault(row['table_name'].lower(), {
+                    'name': row['table_name'],
+                    'columns': {},
+                    'primary_key': None
+                })
+                table['columns'][row['column_name']] = row['data_type']
+                if row['column_key'] == 'PRI' and table['primary_key'] is None:
+                    table['primary_key'] = row['column_name']
+            with self._lock:
+                self._tables = tables
+                self.loaded = True
+            return True
+        except mysql.connector.Error as err:
+            print(f"Error loading schema registry: {err}")
+            return False
+        finally:
+            if cursor:
+                cursor.close()
+            if conn:
+                conn.close()
+
+    def get(self, table_name):
+        """Returns {'name', 'columns', 'primary_key'} for a table, or None if unknown."""
+        if not self.loaded:
+            self.refresh()
+        return self._tables.get(table_name.lower())
+
+schema_registry = SchemaRegistry()
+
+# =================================================================================================
+# Content Cache
+# =================================================================================================
+# CMS tables that only change through the admin panel
+CACHED_CONTENT_TABLES = {
+    'navTable', 'footer', 'heroTable', 'Ourclients', 'innovations', 'know', 'statistics',
+    'aboutUs', 'servicesTable', 'founders', 'who_we_work_with', 'team_members', 'client_logos'
+}
+
+class ContentCache:
+    """In-process cache for CMS content tables.
+
+    Entries are grouped by table. Writers call invalidate() with the tables they
+    changed, which drops only those entries and bumps the table's version.
+    Cached rows are shared between requests and must be treated as read-only.
+    """
+
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.version = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._table_versions = {}
+        self._lock = threading.Lock()
+
+    def table_version(self, table):
+        """Returns the current version of a table, to pass to set()."""
+        return self._table_versions.get(table, 0)
+
+    def get(self, table, key):
+        """Returns (hit, value) for a cached entry."""
+        with self._lock:
+            entry = self._entries.get((table, key))
+            if entry and entry[0] > time.monotonic():
+                self.hits += 1
+                return True, entry[1]
+            self.misses += 1
+            return False, None
+
+    def set(self, table, key, value, version):
+        """Stores a value unless the table was invalidated after version was read."""
+        with self._lock:
+            if self._table_versions.get(table, 0) == version:
+                self._entries[(table, key)] = (time.monotonic() + self.ttl, value)
+
+    def invalidate(self, *tables):
+        """Drops the entries for the given tables and bumps their versions."""
+        with self._lock:
+            for table in tables:
+                self._table_versions[table] = self._table_versions.get(table, 0) + 1
+            self._entries = {k: v for k, v in self._entries.items() if k[0] not in tables}
+            self.version += 1
+
+    def expires_at(self, table):
+        """Earliest expiry among a table's live entries, or None if none (e.g. its fetch failed)."""
+        now = time.monotonic()
+        with self._lock:
+            expiries = [entry[0] for k, entry in self._entries.items() if k[0] == table and entry[0] > now]
+        return min(expiries) if expiries else None
+
+    def stats(self):
+        """Returns hit/miss counters and cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'entries': len(self._entries),
+                'version': self.version,
+                'table_versions': dict(self._table_versions)
+            }
+
+content_cache = ContentCache(CONTENT_CACHE_TTL)
+
+def cached_content(table, key='list'):
+    """Decorator caching a content fetcher's result under (table, key).
+
+    Empty results are not cached, so a failed query is retried on the next call.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            hit, value = content_cache.get(table, key)
+            if hit:
+                return value
+            version = content_cache.table_version(table)
+            value = f(*args, **kwargs)
+            if value:
+                content_cache.set(table, key, value, version)
+            return value
+        return decorated_function
+    return decorator
+
+def fetch_data(table_name):
+    """Fetches all data from a specified table, using the content cache for CMS tables."""
+    cacheable = table_name in CACHED_CONTENT_TABLES
+    if cacheable:
+        hit, data = content_cache.get(table_name, 'rows')
+        if hit:
+            return data
+        version = content_cache.table_version(table_name)
+
+    if schema_registry.get(table_name) is None:
+        print(f"Error fetching data from {table_name}: unknown table")
+        return []
+
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(f"SELECT * FROM {table_name}")
+        data = cursor.fetchall()
+        if cacheable:
+            content_cache.set(table_name, 'rows', data, version)
+        return data
+    except mysql.connector.Error as err:
+        print(f"Error fetching data from {table_name}: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# Single-row section tables rendered on each page, keyed by template variable
+BASE_SECTIONS = {
+    'nav': 'navTable',
+    'footer': 'footer'
+}
+
+HOME_SECTIONS = {
+    **BASE_SECTIONS,
+    'hero': 'heroTable',
+    'client': 'Ourclients',
+    'innovation': 'innovations',
+    'know': 'know',
+    'statistic': 'statistics'
+}
+
+# Multi-row tables that can be batched alongside the section tables
+SECTION_LIST_QUERIES = {
+    'client_logos': "SELECT logo_url FROM client_logos ORDER BY logo_order",
+    'founders': "SELECT * FROM founders ORDER BY founder_order",
+    'who_we_work_with': "SELECT * FROM who_we_work_with ORDER BY work_order",
+    'team_members': "SELECT * FROM team_members WHERE member_status = 'active' ORDER BY team_order",
+    'servicesTable': "SELECT * FROM servicesTable"
+}
+
+def fetch_sections(section_tables, list_tables=None):
+    """Fetches several section tables in a single round trip.
+
+    Args:
+        section_tables: Maps template keys to single-row tables; each key gets
+            the table's first row, or {} if it is empty.
+        list_tables: Maps template keys to SECTION_LIST_QUERIES entries; each
+            key gets the full list of rows (client logos as plain URLs).
+
+    Returns:
+        dict: Template data keyed like the arguments.
+    """
+    list_tables = list_tables or {}
+    result = {key: {} for key in section_tables}
+    result.update({key: [] for key in list_tables})
+
+    # Serve what we can from the content cache and batch only the misses
+    keys, statements, versions = [], [], {}
+    for key, table in list(section_tables.items()) + list(list_tables.items()):
+        cache_key = 'first_row' if key in section_tables else 'list'
+        hit, value = content_cache.get(table, cache_key)
+        if hit:
+            result[key] = value
+            continue
+        versions[key] = content_cache.table_version(table)
+        keys.append(key)
+        statements.append(f"SELECT * FROM {table} LIMIT 1" if key in section_tables
+                          else SECTION_LIST_QUERIES[table])
+    if not statements:
+        return result
+
+    conn = get_db_connection()
+    if conn is None:
+        return result
+    cursor = conn.cursor(dictionary=True)
+    try:
+        # All statements go to the server in one packet; results come back in order
+        rows_per_statement = [res.fetchall() for res in cursor.execute('; '.join(statements), multi=True)
+                              if res.with_rows]
+        for key, rows in zip(keys, rows_per_statement):
+            if key in section_tables:
+                table, cache_key = section_tables[key], 'first_row'
+                result[key] = rows[0] if rows else {}
+            else:
+                table, cache_key = list_tables[key], 'list'
+                result[key] = [row['logo_url'] for row in rows] if table == 'client_logos' else rows
+            content_cache.set(table, cache_key, result[key], versions[key])
+        return result
+    except mysql.connector.Error as err:
+        print(f"Error fetching sections {', '.join(keys)}: {err}")
+        return result
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+@cached_content('client_logos')
+def fetch_client_logos():
+    """Fetch client logos from database."""
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT * FROM client_logos ORDER BY logo_order")
+        data = cursor.fetchall()
+        return [row['logo_url'] for row in data]
+    except mysql.connector.Error as err:
+        print(f"Error fetching client logos: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def sync_ordered_list(table, items, columns, order_column=None, scope=None):
+    """Syncs a table's rows to a submitted ordered list in one transaction.
+
+    The submitted list is diffed against the current rows: unchanged rows are
+    left alone, moved rows only get a new position, edited rows are updated in
+    place and the rest are inserted or deleted. Ids stay stable across saves.
+
+    Args:
+        table: Table to sync.
+        items: Submitted rows as dicts keyed by column, in display order.
+        columns: Content columns to compare and write.
+        order_column: Column holding the 1-based position. Without one the list
+            is ordered by primary key and rows are matched by position.
+        scope: Optional (column, value) limiting the rows the list owns,
+            e.g. ('member_status', 'active'). New rows get that value.
+
+    Returns:
+        int: Number of rows inserted, updated or deleted, or None on error.
+    """
+    table_schema = schema_registry.get(table)
+    if table_schema is None:
+        print(f"Error syncing {table}: unknown table")
+        return None
+    pk = table_schema['primary_key']
+
+    conn = get_db_connection()
+    if conn is None:
+        return None
+    cursor = conn.cursor(dictionary=True)
+    try:
+        position_columns = [order_column] if order_column else []
+        where, params = '', ()
+        if scope:
+            where, params = f" WHERE {scope[0]} = %s", (scope[1],)
+        order_by = f"{order_column}, {pk}" if order_column else pk
+        cursor.execute(f"SELECT {', '.join([pk] + columns + position_columns)} FROM {table}{where} "
+                       f"ORDER BY {order_by} FOR UPDATE", params)
+        existing = cursor.fetchall()
+
+        # Pair each submitted item with an existing row: identical content first
+        # (so a reorder is just a position change), then whatever rows are left
+        matches = [None] * len(items)
+        if order_column:
+            rows_by_content = {}
+            for row in existing:
+                rows_by_content.setdefault(tuple(row[c] for c in columns), []).append(row)
+            for i, item in enumerate(items):
+                candidates = rows_by_content.get(tuple(item.get(c) for c in columns))
+                if candidates:
+                    matches[i] = candidates.pop(0)
+        matched_ids = {row[pk] for row in matches if row}
+        leftover = [row for row in existing if row[pk] not in matched_ids]
+        for i in range(len(items)):
+            if matches[i] is None and leftover:
+                matches[i] = leftover.pop(0)
+
+        upserts = []
+        for position, (item, row) in enumerate(zip(items, matches), 1):
+            values = [item.get(c) for c in columns] + ([position] if order_column else [])
+            current = [row[c] for c in columns + position_columns] if row else None
+            if values != current:
+                upserts.append(tuple([row[pk] if row else None] + values + ([scope[1]] if scope else [])))
+
+        if upserts:
+            write_columns = [pk] + columns + position_columns + ([scope[0]] if scope else [])
+            update_clause = ', '.join(f"{c} = VALUES({c})" for c in write_columns[1:])
+            # executemany folds this into a single multi-row INSERT ... ON DUPLICATE KEY UPDATE
+            cursor.executemany(f"INSERT INTO {table} ({', '.join(write_columns)}) "
+                               f"VALUES ({', '.join(['%s'] * len(write_columns))}) "
+                               f"ON DUPLICATE KEY UPDATE {update_clause}", upserts)
+
+        deleted = 0
+        if leftover:
+            ids = [row[pk] for row in leftover]
+            cursor.execute(f"DELETE FROM {table} WHERE {pk} IN ({', '.join(['%s'] * len(ids))})", ids)
+            deleted = cursor.rowcount
+
+        conn.commit()
+        touched = len(upserts) + deleted
+        if touched:
+            content_cache.invalidate(table)
+        print(f"Synced {table}: {touched} row(s) changed")
+        return touched
+    except mysql.connector.Error as err:
+        print(f"Error syncing {table}: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def update_client_logos(logos):
+    """Update client logos in database."""
+    logo_rows = [{'logo_url': logo_url} for logo_url in logos]
+    return sync_ordered_list('client_logos', logo_rows, ['logo_url'], order_column='logo_order') is not None
+
+@cached_content('founders')
+def fetch_founders():
+    """Fetches all founders from the database."""
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT * FROM founders ORDER BY founder_order")
+        data = cursor.fetchall()
+        return data
+    except mysql.connector.Error as err:
+        print(f"Error fetching founders: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def update_founders(founders_list):
+    """Updates the founders in the database to match the submitted list."""
+    columns = ['founder_name', 'founder_role', 'founder_image', 'founder_description']
+    return sync_ordered_list('founders', founders_list, columns, order_column='founder_order') is not None
+
+@cached_content('who_we_work_with')
+def fetch_who_we_work_with():
+    """Fetches all 'Who We Work With' entries from the database."""
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT * FROM who_we_work_with ORDER BY work_order")
+        data = cursor.fetchall()
+        return data
+    except mysql.connector.Error as err:
+        print(f"Error fetching 'who we work with' data: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def update_who_we_work_with(work_with_list):
+    """Updates the 'Who We Work With' entries in the database."""
+    columns = ['work_icon', 'work_title', 'work_description']
+    return sync_ordered_list('who_we_work_with', work_with_list, columns, order_column='work_order') is not None
+
+def update_services(services_list):
+    """Updates the services in the database to match the submitted list."""
+    services_rows = [
+        {**service, 'service_icon': service.get('service_icon', 'fas fa-cogs')}  # Default icon if not provided
+        for service in services_list
+    ]
+    columns = ['service_head', 'service_icon', 'service_desc']
+    return sync_ordered_list('servicesTable', services_rows, columns) is not None
+
+def update_data(table_name, data_dict):
+    """Updates data in a specified table, handling missing columns gracefully."""
+    table_schema = schema_registry.get(table_name)
+    if table_schema is None:
+        print(f"Table '{table_name}' does not exist. Skipping update...")
+        return False
+
+    # Filter data_dict to only include existing columns
+    filtered_data = {}
+    for key, value in data_dict.items():
+        if key in table_schema['columns']:
+            filtered_data[key] = value
+        else:
+            print(f"Warning: Column '{key}' does not exist in table '{table_name}'. Skipping...")
+
+    if not filtered_data:
+        print(f"No valid columns to update in table '{table_name}'")
+        return False
+
+    conn = get_db_connection()
+    if conn is None:
+        return False
+
+    cursor = conn.cursor()
+    try:
+        # Build the SET clause dynamically with filtered data
+        set_clause = ', '.join([f"{key} = %s" for key in filtered_data.keys()])
+        values = list(filtered_data.values())
+
+        id_field = table_schema['primary_key'] or 'id'
+        query = f"UPDATE {table_name} SET {set_clause} WHERE {id_field} = 1"
+
+        cursor.execute(query, values)
+        conn.commit()
+        content_cache.invalidate(table_name)
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error updating data in {table_name}: {err}")
+        # A column was dropped since the registry loaded - pick up the new schema
+        if err.errno == errorcode.ER_BAD_FIELD_ERROR:
+            schema_registry.refresh()
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+# ========================================================team members
+@cached_content('team_members')
+def fetch_team_members():
+    """Fetches all active team members from the database."""
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT * FROM team_members WHERE member_status = 'active' ORDER BY team_order")
+        data = cursor.fetchall()
+        return data
+    except mysql.connector.Error as err:
+        print(f"Error fetching team members: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def update_team_members(team_members_list):
+    """Updates the active team members in the database to match the submitted list."""
+    columns = ['member_name', 'member_position', 'member_description', 'member_image']
+    return sync_ordered_list('team_members', team_members_list, columns, order_column='team_order',
+                             scope=('member_status', 'active')) is not None
+
+# =================================================================================================
+# Email Outbox
+# =================================================================================================
+# Emails are written to email_outbox in the same transaction as the record that triggers them,
+# and delivered by background workers, so a slow or unreachable SMTP server never holds up a
+# request and a crash between commit and send never loses a message.
+EMAIL_OUTBOX_WORKERS = int(os.getenv('EMAIL_OUTBOX_WORKERS', 2))  # 0 disables in-process delivery
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv('EMAIL_OUTBOX_BATCH_SIZE', 10))
+EMAIL_OUTBOX_POLL_INTERVAL = float(os.getenv('EMAIL_OUTBOX_POLL_INTERVAL', 5))
+EMAIL_MAX_ATTEMPTS = int(os.getenv('EMAIL_MAX_ATTEMPTS', 6))
+EMAIL_RETRY_BASE_DELAY = int(os.getenv('EMAIL_RETRY_BASE_DELAY', 30))  # seconds, doubled per attempt
+EMAIL_RETRY_MAX_DELAY = 3600
+EMAIL_SENDING_TIMEOUT = 600  # a row left in 'sending' this long belongs to a dead worker
+
+def create_email_outbox_table():
+    """Creates the email_outbox table if it doesn't exist."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS email_outbox (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                recipients TEXT NOT NULL,
+                subject VARCHAR(500) NOT NULL,
+                body MEDIUMTEXT NOT NULL,
+                html_body MEDIUMTEXT,
+                status ENUM('pending', 'sending', 'sent', 'dead') DEFAULT 'pending',
+                attempts INT NOT NULL DEFAULT 0,
+                next_attempt_at DATETIME NOT NULL,
+                locked_at DATETIME NULL,
+                claim_token CHAR(32) NULL,
+                last_error TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                sent_at DATETIME NULL,
+                INDEX idx_outbox_status_next (status, next_attempt_at),
+                INDEX idx_outbox_claim (claim_token)
+            )
+        """)
+        # Tables created before claims were token-based lack the column
+        table_schema = schema_registry.get('email_outbox')
+        if table_schema is not None and 'claim_token' not in table_schema['columns']:
+            cursor.execute("""ALTER TABLE email_outbox ADD COLUMN claim_token CHAR(32) NULL AFTER locked_at,
+                              ADD INDEX idx_outbox_claim (claim_token)""")
+            schema_registry.refresh()
+        conn.commit()
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error creating email_outbox table: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def enqueue_email(cursor, to_emails, subject, body, html_body=None):
+    """Queues an email on the caller's cursor.
+
+    Nothing is committed here: the row becomes visible to the workers together with
+    the rest of the caller's transaction, or not at all if it rolls back.
+    """
+    if isinstance(to_emails, str):
+        to_emails = [to_emails]
+    cursor.execute("""INSERT INTO email_outbox (recipients, subject, body, html_body, next_attempt_at)
+                      VALUES (%s, %s, %s, %s, %s)""",
+                   (json.dumps(to_emails), subject, body, html_body, datetime.now()))
+
+def email_retry_delay(attempts):
+    """Exponential backoff with jitter for the given number of failed attempts."""
+    delay = min(EMAIL_RETRY_BASE_DELAY * (2 ** (attempts - 1)), EMAIL_RETRY_MAX_DELAY)
+    return timedelta(seconds=delay * random.uniform(0.8, 1.2))
+
+class EmailOutboxWorker:
+    """Pool of daemon threads delivering queued emails with retries and dead-lettering."""
+
+    def __init__(self, service, workers):
+        self.service = service
+        self.workers = workers
+        self._threads = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+
+    def start(self):
+        """Starts the worker threads once per process."""
+        if self._threads or self.workers <= 0:
+            return
+        with self._lock:
+            if self._threads:
+                return
+            for number in range(self.workers):
+                thread = threading.Thread(target=self._run, name=f"email-outbox-{number}", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            print(f"Email outbox started with {self.workers} worker(s)")
+
+    def notify(self):
+        """Wakes idle workers after new emails have been committed."""
+        self._wake.set()
+
+    def _run(self):
+        while True:
+            try:
+                batch = self._claim()
+            except Exception as e:
+                print(f"Email outbox error: {e}")
+                batch = []
+            if not batch:
+                self._wake.wait(EMAIL_OUTBOX_POLL_INTERVAL)
+                self._wake.clear()
+                continue
+            for row in batch:
+                self._deliver(row)
+
+    def _claim(self):
+        """Marks a batch of due emails as sending and returns them.
+
+        The batch is claimed with a single UPDATE ... LIMIT stamped with a fresh token,
+        so several workers (and several app processes) can poll the same table without
+        handing the same email to two of them. Unlike SELECT ... FOR UPDATE SKIP LOCKED
+        this works on any MySQL or MariaDB version.
+        """
+        conn = get_db_connection()
+        if conn is None:
+            return []
+        cursor = conn.cursor(dictionary=True)
+        try:
+            now = datetime.now()
+            token = secrets.token_hex(16)
+            cursor.execute("""UPDATE email_outbox
+                              SET status = 'sending', locked_at = %s, claim_token = %s, attempts = attempts + 1
+                              WHERE (status = 'pending' AND next_attempt_at <= %s)
+                                 OR (status = 'sending' AND locked_at < %s)
+                              ORDER BY next_attempt_at
+                              LIMIT %s""",
+                           (now, token, now, now - timedelta(seconds=EMAIL_SENDING_TIMEOUT), EMAIL_OUTBOX_BATCH_SIZE))
+            rows = []
+            if cursor.rowcount:
+                cursor.execute("""SELECT id, recipients, subject, body, html_body, attempts
+                                  FROM email_outbox WHERE claim_token = %s""", (token,))
+                rows = cursor.fetchall()
+            conn.commit()
+            return rows
+        except mysql.connector.Error as err:
+            print(f"Error claiming queued emails: {err}")
+            return []
+        finally:
+            cursor.close()
+            conn.close()
+
+    def _deliver(self, row):
+        """Sends one claimed email and records the outcome."""
+        success, message = self.service.send_email(json.loads(row['recipients']), row['subject'],
+                                                   row['body'], row['html_body'])
+        if success:
+            query = "UPDATE email_outbox SET status = 'sent', sent_at = %s, last_error = NULL WHERE id = %s"
+            params = (datetime.now(), row['id'])
+        elif row['attempts'] >= EMAIL_MAX_ATTEMPTS:
+            print(f"Email {row['id']} dead-lettered after {row['attempts']} attempts: {message}")
+            query = "UPDATE email_outbox SET status = 'dead', last_error = %s WHERE id = %s"
+            params = (message, row['id'])
+        else:
+            query = """UPDATE email_outbox SET status = 'pending', next_attempt_at = %s, last_error = %s
+                       WHERE id = %s"""
+            params = (datetime.now() + email_retry_delay(row['attempts']), message, row['id'])
+
+        conn = get_db_connection()
+        if conn is None:
+            # The row stays in 'sending' and is retried after EMAIL_SENDING_TIMEOUT
+            return
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, params)
+            conn.commit()
+        except mysql.connector.Error as err:
+            print(f"Error recording delivery of email {row['id']}: {err}")
+        finally:
+            cursor.close()
+            conn.close()
+
+email_outbox = EmailOutboxWorker(email_service, EMAIL_OUTBOX_WORKERS)
+
+@app.before_request
+def start_email_outbox():
+    """Starts delivery in whichever process actually serves requests."""
+    email_outbox.start()
+
+# =================================================================================================
+# Bulk Email Campaigns
+# =================================================================================================
+EMAIL_BULK_CONCURRENCY = int(os.getenv('EMAIL_BULK_CONCURRENCY', 2))
+EMAIL_BULK_RATE_LIMIT = float(os.getenv('EMAIL_BULK_RATE_LIMIT', 5))  # messages per second, 0 = unlimited
+CAMPAIGN_STATUSES = ('running', 'paused', 'completed')
+# A running campaign refreshes updated_at this often; a claim older than the timeout is from
+# a sender that died and may be taken over
+EMAIL_CAMPAIGN_HEARTBEAT = 60
+EMAIL_CAMPAIGN_CLAIM_TIMEOUT = int(os.getenv('EMAIL_CAMPAIGN_CLAIM_TIMEOUT', 300))
+
+# Campaign templates are written in the admin panel, so they are rendered sandboxed. Subjects and
+# plain text bodies are not escaped; HTML bodies are, since recipient fields come from public forms.
+BULK_TEMPLATE_ENV = SandboxedEnvironment(autoescape=False)
+BULK_HTML_TEMPLATE_ENV = SandboxedEnvironment(autoescape=True)
+
+# Audiences the admin panel can target: key -> (label, query returning an email column)
+BULK_AUDIENCES = {
+    'job_applicants': ("Applicants to a job", """
+        SELECT ja.applicant_email AS email, ja.applicant_name AS name, jp.job_title
+        FROM job_applications ja
+        JOIN job_postings jp ON ja.job_id = jp.job_id
+        WHERE ja.job_id = %s"""),
+    'recent_contacts': ("Recent contact submissions", """
+        SELECT email, name, subject, company
+        FROM contact_submissions
+        WHERE submission_date >= %s""")
+}
+
+class RateLimiter:
+    """Spaces calls evenly so that at most `rate` go through per second across threads."""
+
+    def __init__(self, rate):
+        self.interval = 1.0 / rate if rate > 0 else 0
+        self._next_slot = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+def create_email_campaign_tables():
+    """Creates the email_campaigns and email_campaign_recipients tables if they don't exist."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS email_campaigns (
+                campaign_id INT AUTO_INCREMENT PRIMARY KEY,
+                campaign_name VARCHAR(255) NOT NULL,
+                subject VARCHAR(500) NOT NULL,
+                body MEDIUMTEXT NOT NULL,
+                html_body MEDIUMTEXT,
+                campaign_status ENUM('running', 'paused', 'completed') DEFAULT 'running',
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS email_campaign_recipients (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                campaign_id INT NOT NULL,
+                email VARCHAR(255) NOT NULL,
+                context TEXT,
+                status ENUM('pending', 'sent', 'failed') DEFAULT 'pending',
+                error TEXT,
+                sent_at DATETIME NULL,
+                UNIQUE KEY uq_campaign_email (campaign_id, email),
+                INDEX idx_campaign_status (campaign_id, status),
+                FOREIGN KEY (campaign_id) REFERENCES email_campaigns(campaign_id) ON DELETE CASCADE
+            )
+        """)
+        conn.commit()
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error creating email campaign tables: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def create_email_campaign(name, subject, body, html_body=None, recipients=None, query=None, params=()):
+    """Stores a campaign and a snapshot of its recipients; returns the campaign id.
+
+    Recipients are deduplicated by address. Each recipient's fields are kept as JSON
+    so the templates render the same way when the campaign is resumed.
+    """
+    conn = get_db_connection()
+    if conn is None:
+        return None
+    cursor = conn.cursor(dictionary=True)
+    try:
+        if query is not None:
+            cursor.execute(query, params)
+            recipients = cursor.fetchall()
+        rows = []
+        for recipient in recipients or []:
+            if isinstance(recipient, str):
+                recipient = {'email': recipient}
+            if recipient.get('email'):
+                rows.append(recipient)
+        if not rows:
+            print(f"Campaign '{name}' has no recipients")
+            return None
+
+        # Created unclaimed; resume_bulk() moves it to running
+        cursor.execute("""INSERT INTO email_campaigns (campaign_name, subject, body, html_body, campaign_status)
+                          VALUES (%s, %s, %s, %s, 'paused')""", (name, subject, body, html_body))
+        campaign_id = cursor.lastrowid
+        cursor.executemany("""INSERT IGNORE INTO email_campaign_recipients (campaign_id, email, context)
+                              VALUES (%s, %s, %s)""",
+                           [(campaign_id, row['email'], json.dumps(row, default=str)) for row in rows])
+        conn.commit()
+        return campaign_id
+    except mysql.connector.Error as err:
+        print(f"Error creating email campaign: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+CAMPAIGN_COUNT_COLUMNS = """COUNT(r.id) AS total,
+                            COALESCE(SUM(r.status = 'sent'), 0) AS sent,
+                            COALESCE(SUM(r.status = 'failed'), 0) AS failed,
+                            COALESCE(SUM(r.status = 'pending'), 0) AS pending"""
+
+def fetch_email_campaigns(limit=50):
+    """Fetches the most recent campaigns with their per-status recipient counts."""
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(f"""SELECT c.campaign_id, c.campaign_name, c.subject, c.campaign_status, c.created_at,
+                                  {CAMPAIGN_COUNT_COLUMNS}
+                           FROM email_campaigns c
+                           LEFT JOIN email_campaign_recipients r ON r.campaign_id = c.campaign_id
+                           GROUP BY c.campaign_id
+                           ORDER BY c.campaign_id DESC
+                           LIMIT %s""", (limit,))
+        return cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Error fetching email campaigns: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def get_email_campaign(campaign_id):
+    """Fetches one campaign, including its templates and recipient counts."""
+    conn = get_db_connection()
+    if conn is None:
+        return None
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(f"""SELECT c.*, {CAMPAIGN_COUNT_COLUMNS},
+                                  (c.campaign_status = 'running'
+                                   AND c.updated_at >= NOW() - INTERVAL %s SECOND) AS is_sending
+                           FROM email_campaigns c
+                           LEFT JOIN email_campaign_recipients r ON r.campaign_id = c.campaign_id
+                           WHERE c.campaign_id = %s
+                           GROUP BY c.campaign_id""", (EMAIL_CAMPAIGN_CLAIM_TIMEOUT, campaign_id))
+        return cursor.fetchone()
+    except mysql.connector.Error as err:
+        print(f"Error fetching email campaign: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def fetch_campaign_recipients(campaign_id, status=None, limit=None):
+    """Fetches a campaign's recipients, optionally only those with the given status."""
+    conn = get_db_connection()
+    if conn is None:
+        return []
+    cursor = conn.cursor(dictionary=True)
+    try:
+        query = "SELECT id, email, context, status, error, sent_at FROM email_campaign_recipients WHERE campaign_id = %s"
+        params = [campaign_id]
+        if status:
+            query += " AND status = %s"
+            params.append(status)
+        query += " ORDER BY id"
+        if limit:
+            query += " LIMIT %s"
+            params.append(limit)
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    except mysql.connector.Error as err:
+        print(f"Error fetching campaign recipients: {err}")
+        return []
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def record_campaign_result(recipient_id, success, error=None):
+    """Marks one campaign recipient as sent or failed."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    cursor = conn.cursor()
+    try:
+        if success:
+            cursor.execute("""UPDATE email_campaign_recipients SET status = 'sent', sent_at = %s, error = NULL
+                              WHERE id = %s""", (datetime.now(), recipient_id))
+        else:
+            cursor.execute("UPDATE email_campaign_recipients SET status = 'failed', error = %s WHERE id = %s",
+                           (error, recipient_id))
+        conn.commit()
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error recording campaign result: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def claim_email_campaign(campaign_id):
+    """Marks a campaign running for this sender; False if a live sender already has it.
+
+    The check and the update are one statement, so two workers resuming the same
+    campaign can't both win.
+    """
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""UPDATE email_campaigns SET campaign_status = 'running', updated_at = NOW()
+                          WHERE campaign_id = %s
+                            AND (campaign_status <> 'running' OR updated_at < NOW() - INTERVAL %s SECOND)""",
+                       (campaign_id, EMAIL_CAMPAIGN_CLAIM_TIMEOUT))
+        conn.commit()
+        return cursor.rowcount == 1
+    except mysql.connector.Error as err:
+        print(f"Error claiming email campaign: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def touch_email_campaign(campaign_id):
+    """Refreshes a running campaign's claim."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    cursor = conn.cursor()
+    try:
+        cursor.execute("UPDATE email_campaigns SET updated_at = NOW() WHERE campaign_id = %s", (campaign_id,))
+        conn.commit()
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error refreshing email campaign claim: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def set_email_campaign_status(campaign_id, status):
+    """Updates a campaign's status."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    cursor = conn.cursor()
+    try:
+        cursor.execute("UPDATE email_campaigns SET campaign_status = %s WHERE campaign_id = %s", (status, campaign_id))
+        conn.commit()
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error updating campaign status: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def retry_failed_campaign_recipients(campaign_id):
+    """Puts a campaign's failed recipients back to pending; returns how many."""
+    conn = get_db_connection()
+    if conn is None:
+        return 0
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""UPDATE email_campaign_recipients SET status = 'pending', error = NULL
+                          WHERE campaign_id = %s AND status = 'failed'""", (campaign_id,))
+        conn.commit()
+        return cursor.rowcount
+    except mysql.connector.Error as err:
+        print(f"Error resetting failed recipients: {err}")
+        return 0
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# =================================================================================================
+# Contact Form Database Functions
+# =================================================================================================
+def create_contact_submissions_table():
+    """Creates the contact_submissions table if it doesn't exist."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS contact_submissions (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                name VARCHAR(255) NOT NULL,
+                email VARCHAR(255) NOT NULL,
+                subject TEXT,
+                message TEXT,
+                submission_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                status ENUM('new', 'read', 'replied', 'archived') DEFAULT 'new',
+                priority ENUM('low', 'medium', 'high') DEFAULT 'medium',
+                assigned_to VARCHAR(255),
+                notes TEXT,
+                company VARCHAR(255),
+                industry VARCHAR(255),
+                phone VARCHAR(50),
+                job_title VARCHAR(255),
+                company_size VARCHAR(100),
+                project_details TEXT,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+            )
+        """)
+        conn.commit()
+        schema_registry.refresh()
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error creating contact_submissions table: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# Columns added to contact_submissions after its first release, with their definitions
+CONTACT_SUBMISSION_MIGRATED_COLUMNS = {
+    'status': "ENUM('new', 'read', 'replied', 'archived') DEFAULT 'new'",
+    'priority': "ENUM('low', 'medium', 'high') DEFAULT 'medium'",
+    'assigned_to': "VARCHAR(255)",
+    'notes': "TEXT",
+    'company': "VARCHAR(255)",
+    'industry': "VARCHAR(255)",
+    'phone': "VARCHAR(50)",
+    'job_title': "VARCHAR(255)",
+    'company_size': "VARCHAR(100)",
+    'project_details': "TEXT",
+    'created_at': "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+    'updated_at': "TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP"
+}
+# Structured contact form fields stored alongside the message
+CONTACT_DETAIL_FIELDS = ('company', 'industry', 'phone', 'job_title', 'company_size', 'project_details')
+
+def parse_contact_message(message):
+    """Parses the structured fields out of a contact message built by contact()."""
+    details = dict.fromkeys(CONTACT_DETAIL_FIELDS, '')
+    project_lines = []
+    in_project_section = False
+
+    for line in (message or '').split('\n'):
+        stripped = line.strip()
+        if in_project_section:
+            project_lines.append(line)
+        elif stripped.startswith('- Company:'):
+            details['company'] = stripped.replace('- Company:', '').strip()
+        elif stripped.startswith('- Industry:'):
+            details['industry'] = stripped.replace('- Industry:', '').strip()
+        elif stripped.startswith('- Phone:'):
+            details['phone'] = stripped.replace('- Phone:', '').strip()
+        elif stripped.startswith('- Job Title:'):
+            details['job_title'] = stripped.replace('- Job Title:', '').strip()
+        elif stripped.startswith('- Number of Employees:') or stripped.startswith('- Company Size:'):
+            details['company_size'] = stripped.split(':', 1)[1].strip()
+        elif stripped == 'Project Details:':
+            in_project_section = True
+
+    details['project_details'] = '\n'.join(project_lines).strip()
+    return details
+
+def migrate_contact_submission_fields(batch_size=500):
+    """Adds missing contact_submissions columns and backfills the structured fields.
+
+    Rows written before the structured columns existed have company = NULL;
+    their messages are parsed once, in batches, and never again.
+    """
+    table_schema = schema_registry.get('contact_submissions')
+    if table_schema is None:
+        print("Error migrating contact_submissions: unknown table")
+        return False
+    missing = [column for column in CONTACT_SUBMISSION_MIGRATED_COLUMNS if column not in table_schema['columns']]
+
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    cursor = conn.cursor(dictionary=True)
+    try:
+        if missing:
+            cursor.execute("ALTER TABLE contact_submissions " + ', '.join(
+                f"ADD COLUMN {column} {CONTACT_SUBMISSION_MIGRATED_COLUMNS[column]}" for column in missing))
+            schema_registry.refresh()
+
+        backfilled = 0
+        set_clause = ', '.join(f"{field} = %s" for field in CONTACT_DETAIL_FIELDS)
+        while True:
+            cursor.execute("SELECT id, message FROM contact_submissions WHERE company IS NULL ORDER BY id LIMIT %s",
+                           (batch_size,))
+            rows = cursor.fetchall()
+            if not rows:
+                break
+            updates = []
+            for row in rows:
+                details = parse_contact_message(row['message'])
+                updates.append(tuple(details[field] for field in CONTACT_DETAIL_FIELDS) + (row['id'],))
+            cursor.executemany(f"UPDATE contact_submissions SET {set_clause} WHERE id = %s", updates)
+            conn.commit()
+            backfilled += len(rows)
+
+        if backfilled:
+            print(f"Backfilled structured fields for {backfilled} contact submission(s)")
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error migrating contact_submissions: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def create_contact_stats_table():
+    """Creates the per-day contact submission rollup and backfills it if empty."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+
+    cursor = conn.cursor()
+    try:
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS contact_submission_stats (
+                stat_day DATE PRIMARY KEY,
+                submissions INT NOT NULL DEFAULT 0
             )
         """)
+        cursor.execute("SELECT COUNT(*) FROM contact_submission_stats")
+        if cursor.fetchone()[0] == 0:
+            cursor.execute("""
+                INSERT INTO contact_submission_stats (stat_day, submissions)
+                SELECT DATE(submission_date), COUNT(*)
+                FROM contact_submissions
+                WHERE submission_date IS NOT NULL
+                GROUP BY DATE(submission_date)
+            """)
         conn.commit()
+        schema_registry.refresh()
         return True
     except mysql.connector.Error as err:
-        print(f"Error creating contact_submissions table: {err}")
+        print(f"Error creating contact_submission_stats table: {err}")
         return False
     finally:
         if cursor:
@@ -534,8 +2830,35 @@ def create_contact_submissions_table():
         if conn:
             conn.close()
 
-def add_contact_submission(name, email, subject, message, status='new', priority='medium'):
-    """Adds a new contact form submission to the database."""
+def maintain_contact_stats(cursor, query, params):
+    """Runs a rollup maintenance statement, tolerating a not-yet-migrated rollup table."""
+    try:
+        cursor.execute(query, params)
+    except mysql.connector.Error as err:
+        if err.errno != errorcode.ER_NO_SUCH_TABLE:
+            raise
+        print("Warning: contact_submission_stats is missing; run create_contact_stats_table()")
+
+def decrement_contact_stats(cursor, where, params):
+    """Subtracts the submissions matching where from the daily rollup, before they are deleted."""
+    maintain_contact_stats(cursor, f"""
+        UPDATE contact_submission_stats s
+        JOIN (SELECT DATE(submission_date) AS stat_day, COUNT(*) AS removed
+              FROM contact_submissions
+              WHERE {where}
+              GROUP BY DATE(submission_date)) d ON s.stat_day = d.stat_day
+        SET s.submissions = GREATEST(s.submissions - d.removed, 0)
+    """, params)
+
+def add_contact_submission(name, email, subject, message, status='new', priority='medium', details=None,
+                           emails=None):
+    """Adds a new contact form submission to the database.
+
+    details holds the structured form fields (CONTACT_DETAIL_FIELDS), stored in
+    their own columns so nothing has to re-parse the message later. emails is a list
+    of enqueue_email() keyword dicts, queued in the same transaction.
+    """
+    details = details or {}
     conn = get_db_connection()
     if conn is None:
         print("Database connection failed")
@@ -544,11 +2867,21 @@ def add_contact_submission(name, email, subject, message, status='new', priority
     cursor = conn.cursor()
     try:
         # Use the correct table structure
-        query = """INSERT INTO contact_submissions 
-                   (name, email, subject, message, submission_date, status, priority) 
-                   VALUES (%s, %s, %s, %s, %s, %s, %s)"""
-        cursor.execute(query, (name, email, subject, message, datetime.now(), status, priority))
+        query = f"""INSERT INTO contact_submissions 
+                    (name, email, subject, message, submission_date, status, priority, {', '.join(CONTACT_DETAIL_FIELDS)}) 
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, {', '.join(['%s'] * len(CONTACT_DETAIL_FIELDS))})"""
+        submitted_at = datetime.now()
+        cursor.execute(query, (name, email, subject, message, submitted_at, status, priority,
+                               *(details.get(field, '') for field in CONTACT_DETAIL_FIELDS)))
+        maintain_contact_stats(cursor, """INSERT INTO contact_submission_stats (stat_day, submissions)
+                                          VALUES (%s, 1)
+                                          ON DUPLICATE KEY UPDATE submissions = submissions + 1""",
+                               (submitted_at.date(),))
+        for queued in emails or []:
+            enqueue_email(cursor, **queued)
         conn.commit()
+        if emails:
+            email_outbox.notify()
         print(f"Contact submission saved successfully for {name}")
         return True
     except mysql.connector.Error as err:
@@ -560,64 +2893,124 @@ def add_contact_submission(name, email, subject, message, status='new', priority
         if conn:
             conn.close()
 
-def fetch_contact_submissions():
-    """Fetches all contact form submissions from the database."""
+ADMIN_PAGE_SIZE = int(os.getenv('ADMIN_PAGE_SIZE', 50))
+# Columns shown in the inbox list; the message body is loaded on demand
+CONTACT_LIST_COLUMNS = "id, name, email, subject, submission_date, status, priority"
+
+def encode_page_cursor(row, date_field, id_field):
+    """Encodes a row's (date, id) keyset position for use in a URL."""
+    return f"{row[date_field].isoformat()}_{row[id_field]}"
+
+def decode_page_cursor(cursor_value):
+    """Decodes a keyset cursor into (datetime, id), or None if it is malformed."""
+    try:
+        timestamp, row_id = cursor_value.rsplit('_', 1)
+        return datetime.fromisoformat(timestamp), int(row_id)
+    except (AttributeError, ValueError):
+        return None
+
+def fetch_keyset_page(select_sql, clauses, params, date_column, id_column,
+                      after=None, before=None, page_size=ADMIN_PAGE_SIZE):
+    """Runs a newest-first query one page at a time using keyset pagination.
+
+    Args:
+        select_sql: SELECT ... FROM ... (joins allowed), without WHERE or ORDER BY.
+        clauses, params: Filter conditions ANDed into the WHERE clause.
+        date_column, id_column: Columns to order and seek on, e.g. 'ja.applied_date'.
+        after: Cursor of the last row on the current page, to load older rows.
+        before: Cursor of the first row on the current page, to load newer rows.
+        page_size: Rows per page.
+
+    Returns:
+        dict: 'rows' plus 'next_cursor'/'prev_cursor' (None at either end).
+    """
+    page = {'rows': [], 'next_cursor': None, 'prev_cursor': None}
+    date_field, id_field = date_column.split('.')[-1], id_column.split('.')[-1]
+    clauses, params = list(clauses), list(params)
+
+    # Seek past the cursor on (date, id) so every page is an index range scan
+    position = decode_page_cursor(after or before)
+    backwards = before is not None and position is not None
+    if position:
+        op = '>' if backwards else '<'
+        clauses.append(f"({date_column} {op} %s OR ({date_column} = %s AND {id_column} {op} %s))")
+        params += [position[0], position[0], position[1]]
+
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    direction = 'ASC' if backwards else 'DESC'
+
     conn = get_db_connection()
     if conn is None:
-        return []
-    
+        return page
     cursor = conn.cursor(dictionary=True)
     try:
-        cursor.execute("""SELECT id, name, email, subject, message, submission_date, status, priority, notes 
-                         FROM contact_submissions 
-                         ORDER BY submission_date DESC""")
-        data = cursor.fetchall()
-        return data
+        cursor.execute(f"""{select_sql}
+                           {where}
+                           ORDER BY {date_column} {direction}, {id_column} {direction}
+                           LIMIT %s""", params + [page_size + 1])
+        rows = cursor.fetchall()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+        if backwards:
+            rows.reverse()
+
+        page['rows'] = rows
+        if rows:
+            # Coming from a cursor means there are rows on the side we came from
+            if backwards or has_more:
+                page['next_cursor'] = encode_page_cursor(rows[-1], date_field, id_field)
+            if (backwards and has_more) or (not backwards and position):
+                page['prev_cursor'] = encode_page_cursor(rows[0], date_field, id_field)
+        return page
     except mysql.connector.Error as err:
-        print(f"Error fetching contact submissions: {err}")
-        return []
+        print(f"Error fetching page: {err}")
+        return page
     finally:
         if cursor:
             cursor.close()
         if conn:
             conn.close()
 
+def fetch_contact_submissions_page(filters=None, after=None, before=None, page_size=ADMIN_PAGE_SIZE):
+    """Fetches one page of the contact inbox, newest first, with only the listed columns."""
+    clauses, params = build_contact_filter_clause(filters or {})
+    return fetch_keyset_page(f"SELECT {CONTACT_LIST_COLUMNS} FROM contact_submissions",
+                             clauses, params, 'submission_date', 'id',
+                             after=after, before=before, page_size=page_size)
+
 def get_contact_submissions_stats():
-    """Gets statistics about contact submissions."""
+    """Gets statistics about contact submissions from the daily rollup."""
+    empty_stats = {'total': 0, 'this_week': 0, 'today': 0}
     conn = get_db_connection()
     if conn is None:
-        return {'total': 0, 'this_week': 0, 'today': 0}
-    
+        return empty_stats
+
+    today = date.today()
+    week_start = today - timedelta(days=6)
     cursor = conn.cursor(dictionary=True)
     try:
-        # Get total submissions
-        cursor.execute("SELECT COUNT(*) as total FROM contact_submissions")
-        total = cursor.fetchone()['total']
-        
-        # Get this week's submissions
-        cursor.execute("""
-            SELECT COUNT(*) as this_week 
-            FROM contact_submissions 
-            WHERE submission_date >= DATE_SUB(NOW(), INTERVAL 7 DAY)
-        """)
-        this_week = cursor.fetchone()['this_week']
-        
-        # Get today's submissions
-        cursor.execute("""
-            SELECT COUNT(*) as today 
-            FROM contact_submissions 
-            WHERE DATE(submission_date) = CURDATE()
-        """)
-        today = cursor.fetchone()['today']
-        
-        return {
-            'total': total,
-            'this_week': this_week,
-            'today': today
-        }
+        try:
+            cursor.execute("""
+                SELECT COALESCE(SUM(submissions), 0) AS total,
+                       COALESCE(SUM(CASE WHEN stat_day >= %s THEN submissions END), 0) AS this_week,
+                       COALESCE(SUM(CASE WHEN stat_day = %s THEN submissions END), 0) AS today
+                FROM contact_submission_stats
+            """, (week_start, today))
+        except mysql.connector.Error as err:
+            if err.errno != errorcode.ER_NO_SUCH_TABLE:
+                raise
+            # Rollup not migrated yet - fall back to one sargable pass over the submissions
+            cursor.execute("""
+                SELECT COUNT(*) AS total,
+                       COALESCE(SUM(submission_date >= %s), 0) AS this_week,
+                       COALESCE(SUM(submission_date >= %s), 0) AS today
+                FROM contact_submissions
+            """, (datetime.combine(week_start, datetime.min.time()), datetime.combine(today, datetime.min.time())))
+        row = cursor.fetchone()
+        return {key: int(row[key]) for key in empty_stats}
     except mysql.connector.Error as err:
         print(f"Error fetching contact submission stats: {err}")
-        return {'total': 0, 'this_week': 0, 'today': 0}
+        return empty_stats
     finally:
         if cursor:
             cursor.close()
@@ -632,9 +3025,11 @@ def delete_contact_submission(submission_id):
     
     cursor = conn.cursor()
     try:
+        decrement_contact_stats(cursor, "id = %s", (submission_id,))
         cursor.execute("DELETE FROM contact_submissions WHERE id = %s", (submission_id,))
+        deleted = cursor.rowcount > 0
         conn.commit()
-        return cursor.rowcount > 0
+        return deleted
     except mysql.connector.Error as err:
         print(f"Error deleting contact submission: {err}")
         return False
@@ -688,15 +3083,114 @@ def update_submission_status(submission_id, status, notes=''):
         if conn:
             conn.close()
 
+# Allowed values for the contact_submissions enums
+CONTACT_STATUSES = ('new', 'read', 'replied', 'archived')
+CONTACT_PRIORITIES = ('low', 'medium', 'high')
+CONTACT_BULK_CHUNK_SIZE = 500
+
+def parse_contact_filters(form):
+    """Reads status/priority/date_from/date_to filters from request form or args.
+
+    Dates are 'YYYY-MM-DD'; date_to is inclusive. Invalid values are ignored.
+    """
+    filters = {}
+    if form.get('status') in CONTACT_STATUSES:
+        filters['status'] = form.get('status')
+    if form.get('priority') in CONTACT_PRIORITIES:
+        filters['priority'] = form.get('priority')
+    for field in ('date_from', 'date_to'):
+        try:
+            filters[field] = datetime.strptime(form.get(field, ''), '%Y-%m-%d')
+        except ValueError:
+            pass
+    return filters
+
+def build_contact_filter_clause(filters):
+    """Builds a sargable WHERE clause (no functions on columns) for contact filters."""
+    clauses, params = [], []
+    if filters.get('status'):
+        clauses.append("status = %s")
+        params.append(filters['status'])
+    if filters.get('priority'):
+        clauses.append("priority = %s")
+        params.append(filters['priority'])
+    if filters.get('date_from'):
+        clauses.append("submission_date >= %s")
+        params.append(filters['date_from'])
+    if filters.get('date_to'):
+        clauses.append("submission_date < %s")
+        params.append(filters['date_to'] + timedelta(days=1))
+    return clauses, params
+
+def bulk_modify_contact_submissions(action_sql, action_params=(), submission_ids=None, filters=None,
+                                    decrement_stats=False):
+    """Applies a DELETE or UPDATE to the selected submissions in chunks, in one transaction.
+
+    Args:
+        action_sql: Statement up to (not including) its WHERE clause.
+        action_params: Parameters for placeholders in action_sql.
+        submission_ids: Optional list of ids; chunked into IN (...) lists.
+        filters: Optional dict from parse_contact_filters(); chunked into id ranges.
+        decrement_stats: Remove each chunk from the daily rollup first (for deletes).
+
+    Returns:
+        int: Number of affected rows, or None on error.
+    """
+    ids = sorted({int(i) for i in submission_ids or [] if str(i).isdigit()})
+    clauses, params = build_contact_filter_clause(filters or {})
+    if not ids and not clauses:
+        print("Refusing bulk contact operation without ids or filters")
+        return None
+
+    conn = get_db_connection()
+    if conn is None:
+        return None
+    cursor = conn.cursor()
+    try:
+        # Each chunk is (extra clause, extra params) narrowing the statement
+        if ids:
+            chunks = [(f"id IN ({', '.join(['%s'] * len(ids[i:i + CONTACT_BULK_CHUNK_SIZE]))})",
+                       ids[i:i + CONTACT_BULK_CHUNK_SIZE])
+                      for i in range(0, len(ids), CONTACT_BULK_CHUNK_SIZE)]
+        else:
+            cursor.execute(f"SELECT MIN(id), MAX(id) FROM contact_submissions WHERE {' AND '.join(clauses)}", params)
+            low, high = cursor.fetchone()
+            chunks = [("id BETWEEN %s AND %s", [start, start + CONTACT_BULK_CHUNK_SIZE - 1])
+                      for start in range(low, high + 1, CONTACT_BULK_CHUNK_SIZE)] if low is not None else []
+
+        affected = 0
+        for chunk_clause, chunk_params in chunks:
+            where = ' AND '.join(clauses + [chunk_clause])
+            if decrement_stats:
+                decrement_contact_stats(cursor, where, params + list(chunk_params))
+            cursor.execute(f"{action_sql} WHERE {where}", list(action_params) + params + list(chunk_params))
+            affected += cursor.rowcount
+        conn.commit()
+        return affected
+    except mysql.connector.Error as err:
+        print(f"Error in bulk contact operation: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def delete_contact_submissions(submission_ids=None, filters=None):
+    """Deletes contact submissions by id list and/or filters. Returns the deleted count or None."""
+    return bulk_modify_contact_submissions("DELETE FROM contact_submissions",
+                                           submission_ids=submission_ids, filters=filters,
+                                           decrement_stats=True)
+
+def update_contact_submissions_status(status, submission_ids=None, filters=None):
+    """Sets the status of contact submissions by id list and/or filters. Returns the updated count or None."""
+    return bulk_modify_contact_submissions("UPDATE contact_submissions SET status = %s, updated_at = %s",
+                                           (status, datetime.now()),
+                                           submission_ids=submission_ids, filters=filters)
+
 def base_data():
     """Get base navigation and footer data."""
-    nav_data = fetch_data('navTable')
-    footer_data = fetch_data('footer')
-
-    return {
-        'nav': nav_data[0] if nav_data else {},
-        'footer': footer_data[0] if footer_data else {}
-    }
+    return fetch_sections(BASE_SECTIONS)
 
 def admin_required(f):
     """Decorator to require admin authentication."""
@@ -708,64 +3202,326 @@ def admin_required(f):
         return f(*args, **kwargs)
     return decorated_function
 
+# =================================================================================================
+# Fragment Cache
+# =================================================================================================
+# Template markup built only from CMS tables is rendered once per content version:
+#
+#     {% cache 'client-logos' on 'client_logos' %} ... {% endcache %}
+#
+# The key is the fragment name plus the current content_cache version of each listed table, so
+# an admin edit to any of them makes the next render miss. Fragments must not use per-request
+# state (flash messages, session, the current URL).
+FRAGMENT_CACHE_MAX_ENTRIES = int(os.getenv('FRAGMENT_CACHE_MAX_ENTRIES', 200))
+
+class FragmentCache:
+    """Rendered template fragments keyed by name and table versions.
+
+    A fragment expires with the content cache entries it was rendered from (or after
+    ttl, if sooner), so it is never staler than the rows themselves could be.
+    """
+
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def render(self, name, tables, caller):
+        """Returns the cached markup for a fragment, rendering it with caller() on a miss."""
+        key = (name,) + tuple((table, content_cache.table_version(table)) for table in tables)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return Markup(entry[1])
+            self.misses += 1
+
+        body = caller()
+        # Data from a failed fetch isn't in the content cache, so neither is markup built from it
+        expiries = [content_cache.expires_at(table) for table in tables]
+        if self.ttl > 0 and None not in expiries:
+            expires_at = min(expiries + [time.monotonic() + self.ttl])
+            with self._lock:
+                self._entries[key] = (expires_at, str(body))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return body
+
+    def stats(self):
+        """Returns hit/miss counters and cache size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'entries': len(self._entries)
+            }
+
+fragment_cache = FragmentCache(CONTENT_CACHE_TTL, FRAGMENT_CACHE_MAX_ENTRIES)
+
+class FragmentCacheExtension(Extension):
+    """Adds {% cache name on 'table', ... %}...{% endcache %} backed by fragment_cache."""
+    tags = {'cache'}
+
+    def parse(self, parser):
+        lineno = next(parser.stream).lineno
+        name = parser.parse_expression()
+        tables = []
+        if parser.stream.skip_if('name:on'):
+            tables.append(parser.parse_expression())
+            while parser.stream.skip_if('comma'):
+                tables.append(parser.parse_expression())
+        body = parser.parse_statements(['name:endcache'], drop_needle=True)
+        call = self.call_method('_render_fragment', [name, nodes.List(tables)])
+        return nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+
+    def _render_fragment(self, name, tables, caller):
+        return fragment_cache.render(name, tables, caller)
+
+app.jinja_env.add_extension(FragmentCacheExtension)
+
+# =================================================================================================
+# Page Cache
+# =================================================================================================
+class PageCache:
+    """LRU cache of rendered public pages.
+
+    Keys include the content cache version and the page cache's own version,
+    so admin saves (content tables) and blog/job CRUD (bump()) retire entries.
+    """
+
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns the cached entry for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['expires_at'] <= time.monotonic():
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, body, content_type, last_modified):
+        """Stores a rendered page and returns its entry."""
+        entry = {
+            'body': body,
+            'content_type': content_type,
+            'etag': hashlib.sha256(body).hexdigest()[:32],
+            'last_modified': last_modified,
+            'expires_at': time.monotonic() + self.ttl
+        }
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def bump(self):
+        """Invalidates every cached page."""
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+
+page_cache = PageCache(PAGE_CACHE_TTL, PAGE_CACHE_MAX_ENTRIES)
+
+def set_last_modified(*timestamps):
+    """Records the newest updated_at of the rows a page renders, for Last-Modified."""
+    timestamps = [ts for ts in timestamps if ts]
+    if timestamps:
+        g.last_modified = max(timestamps)
+
+def cached_page(f):
+    """Serves a public route from the page cache with strong ETag/Last-Modified validators.
+
+    Conditional GETs that match the cached entry get a 304 without touching
+    MySQL or Jinja. Pages carrying flash messages are rendered per visitor.
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        if session.get('_flashes'):
+            return f(*args, **kwargs)
+
+        key = (request.endpoint, tuple(sorted(kwargs.items())), content_cache.version, page_cache.version)
+        entry = page_cache.get(key)
+        if entry is None:
+            response = make_response(f(*args, **kwargs))
+            # Only cache plain 200 pages (not-found routes flash and redirect)
+            if response.status_code != 200 or session.get('_flashes'):
+                return response
+            entry = page_cache.set(key, response.get_data(), response.content_type,
+                                   g.get('last_modified') or datetime.utcnow())
+
+        response = make_response(entry['body'])
+        response.content_type = entry['content_type']
+        response.set_etag(entry['etag'])
+        response.last_modified = entry['last_modified']
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+    return decorated_function
+
+# =================================================================================================
+# Response Compression
+# =================================================================================================
+# Text responses (HTML, JSON, CSS/JS) are compressed with Brotli or gzip, whichever the client
+# prefers in Accept-Encoding. Built assets are answered with the .br/.gz siblings written by
+# build_assets.py; everything else above COMPRESSION_MIN_SIZE is compressed on the fly. Media
+# (video, PNG/JPEG/WebP) is already compressed and passes through untouched.
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+COMPRESSION_MIN_SIZE = int(os.getenv('COMPRESSION_MIN_SIZE', 1024))
+COMPRESSION_MAX_SIZE = int(os.getenv('COMPRESSION_MAX_SIZE', 4 * 1024 * 1024))  # larger bodies stay as they are
+COMPRESSION_GZIP_LEVEL = int(os.getenv('COMPRESSION_GZIP_LEVEL', 6))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv('COMPRESSION_BROTLI_QUALITY', 5))
+COMPRESSIBLE_MIMETYPES = {
+    'text/html', 'text/css', 'text/plain', 'text/csv', 'text/xml', 'text/javascript',
+    'application/javascript', 'application/json', 'application/xml', 'image/svg+xml'
+}
+COMPRESSED_BODY_CACHE_SIZE = 256
+PRECOMPRESSED_ENCODINGS = dict(zip(('br', 'gzip'), COMPRESSED_SUFFIXES))
+
+_compressed_bodies = OrderedDict()
+_compressed_bodies_lock = threading.Lock()
+
+def accepted_encodings(offers):
+    """The offered content codings the client accepts, most preferred first."""
+    accept = request.accept_encodings
+    qualities = [(accept.quality(encoding), -index, encoding) for index, encoding in enumerate(offers)]
+    return [encoding for quality, _, encoding in sorted(qualities, reverse=True) if quality > 0]
+
+def compress_body(data, encoding):
+    if encoding == 'br':
+        return brotli.compress(data, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(data, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+def cached_compress_body(etag, data, encoding):
+    """compress_body() memoised on the response ETag, so cached pages are compressed once."""
+    if not etag:
+        return compress_body(data, encoding)
+    key = (etag, encoding)
+    with _compressed_bodies_lock:
+        body = _compressed_bodies.get(key)
+        if body is not None:
+            _compressed_bodies.move_to_end(key)
+            return body
+    body = compress_body(data, encoding)
+    with _compressed_bodies_lock:
+        _compressed_bodies[key] = body
+        while len(_compressed_bodies) > COMPRESSED_BODY_CACHE_SIZE:
+            _compressed_bodies.popitem(last=False)
+    return body
+
+@app.before_request
+def serve_precompressed_assets():
+    """Answers built css/js requests with a precompressed sibling the client accepts."""
+    if (not COMPRESSION_ENABLED or request.endpoint != 'static' or request.range
+            or not (request.view_args or {}).get('filename', '').startswith(f"{DIST_FOLDER}/")):
+        return None
+    path = safe_join(app.static_folder, request.view_args['filename'])
+    if path is None:
+        return None
+    for encoding in accepted_encodings(list(PRECOMPRESSED_ENCODINGS)):
+        sibling = path + PRECOMPRESSED_ENCODINGS[encoding]
+        if os.path.isfile(sibling):
+            response = send_file(sibling, mimetype=mimetypes.guess_type(path)[0], conditional=True, etag=True)
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            return response
+    return None
+
+@app.after_request
+def compress_response(response):
+    """Compresses text responses above COMPRESSION_MIN_SIZE for clients that accept it."""
+    if not COMPRESSION_ENABLED or response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if response.status_code != 200 or 'Content-Encoding' in response.headers:
+        return response
+    if response.direct_passthrough:
+        # A static file sent by send_file(); small text files are read so they can be compressed
+        if not response.content_length or response.content_length > COMPRESSION_MAX_SIZE:
+            return response
+        response.direct_passthrough = False
+    elif response.is_streamed:
+        return response  # e.g. CSV exports, which are sent as they are generated
+
+    data = response.get_data()
+    if len(data) < COMPRESSION_MIN_SIZE or len(data) > COMPRESSION_MAX_SIZE:
+        return response
+    encodings = accepted_encodings(['br', 'gzip'] if brotli is not None else ['gzip'])
+    if not encodings:
+        return response
+
+    etag, _ = response.get_etag()
+    body = cached_compress_body(etag, data, encodings[0])
+    if len(body) >= len(data):
+        return response
+    response.set_data(body)
+    response.headers['Content-Encoding'] = encodings[0]
+    # Byte ranges of the identity body don't apply to the compressed one
+    response.headers.pop('Accept-Ranges', None)
+    if etag:
+        # Same resource, different bytes: a weak validator still matches If-None-Match (as nginx does)
+        response.set_etag(etag, weak=True)
+    return response
+
 # =================================================================================================
 # Public Routes
 # =================================================================================================
 @app.route('/')
+@cached_page
 def index():
     """Renders the main index page with data from all tables."""
-    nav_data = fetch_data('navTable')
-    hero_data = fetch_data('heroTable')
-    clients_data = fetch_data('Ourclients')
-    client_logos = fetch_client_logos()
-    innovations_data = fetch_data('innovations')
-    know_data = fetch_data('know')
-    statistics_data = fetch_data('statistics')
-    footer_data = fetch_data('footer')
-
-    template_data = {
-        'nav': nav_data[0] if nav_data else {},
-        'hero': hero_data[0] if hero_data else {},
-        'client': clients_data[0] if clients_data else {},
-        'client_logos': client_logos,
-        'innovation': innovations_data[0] if innovations_data else {},
-        'know': know_data[0] if know_data else {},
-        'statistic': statistics_data[0] if statistics_data else {},
-        'footer': footer_data[0] if footer_data else {}
-    }
-
+    template_data = fetch_sections(HOME_SECTIONS, {'client_logos': 'client_logos'})
     return render_template('index.html', **template_data)
 
 @app.route('/about')
+@cached_page
 def about():
     """Renders the about us page with data from the aboutUs table."""
-    about_data = fetch_data('aboutUs')
-    about_us = about_data[0] if about_data else {}
-    base_data_dict = base_data()
-    founders_data = fetch_founders()
-    who_we_work_with_data = fetch_who_we_work_with()
-    team_members_data = fetch_team_members()
-
-    return render_template('about.html',
-                           aboutData=about_us,
-                           founders=founders_data,
-                           work_with=who_we_work_with_data,
-                           team_members=team_members_data,
-                           **base_data_dict)
+    template_data = fetch_sections(
+        {**BASE_SECTIONS, 'aboutData': 'aboutUs'},
+        {'founders': 'founders', 'work_with': 'who_we_work_with', 'team_members': 'team_members'}
+    )
+    return render_template('about.html', **template_data)
 
 @app.route('/services')
+@cached_page
 def services():
     """Renders the services page with data from the servicesTable."""
-    services_data = fetch_data('servicesTable')
-    base_data_dict = base_data()
-    return render_template('services.html', servicesList=services_data, **base_data_dict)
+    template_data = fetch_sections(BASE_SECTIONS, {'servicesList': 'servicesTable'})
+    return render_template('services.html', **template_data)
+
+# =================================================================================================
+# Media Route
+# =================================================================================================
+@app.route('/media/<path:filename>')
+def media(filename):
+    """Serves uploads and assets with Range support and long-lived caching for versioned URLs."""
+    path = media_path(filename)
+    if path is None:
+        return {'error': 'Not found'}, 404
+    # A stale ?v= (from a page rendered before the file changed) still gets the file, just not forever
+    immutable = (HASHED_UPLOAD_RE.match(os.path.basename(filename)) is not None
+                 or request.args.get('v') == media_version(path))
+    return send_media(path, filename, immutable)
 
 # =================================================================================================
 # Contact Form Route with Email Integration
 # =================================================================================================
 @app.route('/contact', methods=['GET', 'POST'])
 def contact():
-    """Enhanced contact form with smtplib email handling."""
+    """Enhanced contact form; notification emails go through the outbox."""
     base_data_dict = base_data()
     
     if request.method == 'POST':
@@ -808,9 +3564,6 @@ Project Details:
 {additional_details}
         """.strip()
 
-        # Save to database first (so it's saved even if email fails)
-        db_saved = add_contact_submission(full_name, email, subject_line, comprehensive_message)
-        
         # Prepare admin email
         admin_subject = f"New Contact Submission: {subject_line}"
         admin_body = f"""
@@ -853,38 +3606,24 @@ MindTune Innovations Team
 If you have any urgent questions, feel free to reply to this email or call us directly.
         """.strip()
 
-        # Send emails
-        email_results = []
-        
-        # Send to admin
-        admin_success, admin_msg = email_service.send_email(
-            EMAIL_USER,  # Send to admin email
-            admin_subject, 
-            admin_body
-        )
-        email_results.append(('admin', admin_success, admin_msg))
-        
-        # Send confirmation to user
-        user_success, user_msg = email_service.send_email(
-            email, 
-            user_subject, 
-            user_body
-        )
-        email_results.append(('user', user_success, user_msg))
-
-        # Determine final message based on results
-        if db_saved and admin_success and user_success:
+        # Save the submission and queue both emails in one transaction; delivery happens
+        # in the background so the visitor never waits on SMTP
+        db_saved = add_contact_submission(full_name, email, subject_line, comprehensive_message, details={
+            'company': company_name,
+            'industry': industry,
+            'phone': phone_number,
+            'job_title': job_title,
+            'company_size': num_employees,
+            'project_details': additional_details
+        }, emails=[
+            {'to_emails': EMAIL_USER, 'subject': admin_subject, 'body': admin_body},
+            {'to_emails': email, 'subject': user_subject, 'body': user_body}
+        ])
+
+        if db_saved:
             flash('Your message has been sent successfully! We will get back to you within 24 hours.', 'success')
-        elif db_saved and (admin_success or user_success):
-            flash('Your message has been received and saved. We will contact you soon.', 'warning')
-        elif db_saved:
-            flash('Your message has been saved. We will contact you soon. (Email delivery issue - please check your email or contact us directly)', 'warning')
         else:
             flash('There was an error processing your message. Please try again or contact us directly.', 'error')
-            
-        # Log email results for debugging
-        for recipient, success, msg in email_results:
-            print(f"Email to {recipient}: {'SUCCESS' if success else 'FAILED'} - {msg}")
 
         return redirect(url_for('contact'))
     
@@ -929,40 +3668,53 @@ def admin_logout():
     flash('Successfully logged out.', 'success')
     return redirect(url_for('admin_login'))
 
+# Section titles for display
+ADMIN_SECTION_TITLES = {
+    'nav': 'Navigation Settings',
+    'hero': 'Hero Section',
+    'clients': 'Our Clients',
+    'innovations': 'Innovations Section',
+    'know': 'Know Section',
+    'statistics': 'Statistics Section',
+    'footer': 'Footer Links',
+    'about_us': 'About Us Page',
+    'services': 'Services Management',
+    'contact_submissions': 'Contact Submissions'
+}
+
+# Admin section to database table
+ADMIN_TABLE_MAPPING = {
+    'nav': 'navTable',
+    'hero': 'heroTable',
+    'clients': 'Ourclients',
+    'innovations': 'innovations',
+    'know': 'know',
+    'statistics': 'statistics',
+    'footer': 'footer',
+    'about_us': 'aboutUs',
+    'services': 'servicesTable',
+    'contact_submissions': 'contact_submissions'
+}
+
+# Image-or-video inputs: form field -> (media type field, image column, video column)
+ADMIN_MEDIA_UPLOAD_FIELDS = {
+    'innovationFile': ('innovationMediaType', 'innovationImage', 'innovationVideo'),
+    'knowFile': ('knowMediaType', 'knowImage', 'knowVideo')
+}
+VIDEO_EXTENSIONS = {'mp4', 'webm', 'ogg'}
+
+# Extra lists loaded with each admin section, keyed by template variable
+ADMIN_SECTION_LISTS = {
+    'clients': {'client_logos': 'client_logos'},
+    'about_us': {'founders': 'founders', 'work_with': 'who_we_work_with', 'team_members': 'team_members'},
+    'services': {'services': 'servicesTable'}
+}
+
 @app.route('/admin')
 @app.route('/admin/<section>')
 @admin_required
 def admin(section=None):
     """Admin panel main page."""
-
-    # Section titles for display
-    section_titles = {
-        'nav': 'Navigation Settings',
-        'hero': 'Hero Section',
-        'clients': 'Our Clients',
-        'innovations': 'Innovations Section',
-        'know': 'Know Section',
-        'statistics': 'Statistics Section',
-        'footer': 'Footer Links',
-        'about_us': 'About Us Page',
-        'services': 'Services Management',
-        'contact_submissions': 'Contact Submissions'
-    }
-
-    # Table mapping
-    table_mapping = {
-        'nav': 'navTable',
-        'hero': 'heroTable',
-        'clients': 'Ourclients',
-        'innovations': 'innovations',
-        'know': 'know',
-        'statistics': 'statistics',
-        'footer': 'footer',
-        'about_us': 'aboutUs',
-        'services': 'servicesTable',
-        'contact_submissions': 'contact_submissions'
-    }
-
     current_data = {}
     client_logos = []
     founders_data = []
@@ -971,32 +3723,34 @@ def admin(section=None):
     services_data = []
     contact_submissions_data = []
     contact_stats = {}
+    contact_page = {}
+    contact_filter_args = {}
 
-    if section and section in table_mapping:
+    if section and section in ADMIN_TABLE_MAPPING:
         if section == 'contact_submissions':
-            contact_submissions_data = fetch_contact_submissions()
+            contact_filters = parse_contact_filters(request.args)
+            contact_page = fetch_contact_submissions_page(contact_filters,
+                                                          after=request.args.get('after'),
+                                                          before=request.args.get('before'))
+            contact_submissions_data = contact_page['rows']
             contact_stats = get_contact_submissions_stats()
+            # Raw filter values, carried through pagination links
+            contact_filter_args = {k: request.args[k] for k in ('status', 'priority', 'date_from', 'date_to')
+                                   if request.args.get(k)}
         else:
-            data = fetch_data(table_mapping[section])
-            current_data = data[0] if data else {}
-
-            # Special handling for clients section to get logos
-            if section == 'clients':
-                client_logos = fetch_client_logos()
-
-            # Special handling for about_us section to get founders and 'who we work with'
-            if section == 'about_us':
-                founders_data = fetch_founders()
-                work_with_data = fetch_who_we_work_with()
-                team_members_data = fetch_team_members() 
-
-            # Special handling for services section to get all services
-            if section == 'services':
-                services_data = data
+            # Load the section row together with any lists it edits in one round trip
+            section_data = fetch_sections({'data': ADMIN_TABLE_MAPPING[section]},
+                                          ADMIN_SECTION_LISTS.get(section))
+            current_data = section_data['data']
+            client_logos = section_data.get('client_logos', [])
+            founders_data = section_data.get('founders', [])
+            work_with_data = section_data.get('work_with', [])
+            team_members_data = section_data.get('team_members', [])
+            services_data = section_data.get('services', [])
 
     return render_template('admin.html',
                            current_section=section,
-                           section_titles=section_titles,
+                           section_titles=ADMIN_SECTION_TITLES,
                            data=current_data,
                            client_logos=client_logos,
                            founders=founders_data,
@@ -1004,40 +3758,15 @@ def admin(section=None):
                            team_members=team_members_data,
                            services=services_data,
                            contact_submissions=contact_submissions_data,
-                           contact_stats=contact_stats)
+                           contact_stats=contact_stats,
+                           contact_page=contact_page,
+                           contact_filter_args=contact_filter_args)
 
 @app.route('/admin/<section>', methods=['POST'])
 @admin_required
 def admin_update(section):
     """Handle admin form submissions."""
-
-    section_titles = {
-        'nav': 'Navigation Settings',
-        'hero': 'Hero Section',
-        'clients': 'Our Clients',
-        'innovations': 'Innovations Section',
-        'know': 'Know Section',
-        'statistics': 'Statistics Section',
-        'footer': 'Footer Links',
-        'about_us': 'About Us Page',
-        'services': 'Services Management',
-        'contact_submissions': 'Contact Submissions'
-    }
-
-    table_mapping = {
-        'nav': 'navTable',
-        'hero': 'heroTable',
-        'clients': 'Ourclients',
-        'innovations': 'innovations',
-        'know': 'know',
-        'statistics': 'statistics',
-        'footer': 'footer',
-        'about_us': 'aboutUs',
-        'services': 'servicesTable',
-        'contact_submissions': 'contact_submissions'
-    }
-
-    if section not in table_mapping:
+    if section not in ADMIN_TABLE_MAPPING:
         flash('Invalid section specified.', 'error')
         return redirect(url_for('admin', section=section))
 
@@ -1048,15 +3777,14 @@ def admin_update(section):
     for field_name in request.files:
         file = request.files[field_name]
         if file and file.filename != '' and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            # Add timestamp to prevent filename conflicts
-            timestamp = str(int(time.time()))
-            name, ext = os.path.splitext(filename)
-            filename = f"{name}_{timestamp}{ext}"
+            uploaded_files[field_name] = save_upload(file)
 
-            file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(file_path)
-            uploaded_files[field_name] = f"/static/uploads/{filename}"
+    # Files sent beforehand through the chunked upload endpoint arrive as <field>_upload_id
+    for key in [k for k in form_data if k.endswith('_upload_id')]:
+        upload_id = form_data.pop(key)
+        file_url = get_completed_upload_url(upload_id) if upload_id else None
+        if file_url:
+            uploaded_files[key[:-len('_upload_id')]] = file_url
 
     # Special handling for hero section
     if section == 'hero':
@@ -1072,7 +3800,7 @@ def admin_update(section):
         # Clean up empty values
         form_data = {k: v for k, v in form_data.items() if v}
 
-        if form_data and update_data(table_mapping[section], form_data):
+        if form_data and update_data(ADMIN_TABLE_MAPPING[section], form_data):
             flash('Hero section updated successfully!', 'success')
         elif not form_data:
             flash('No changes to update.', 'warning')
@@ -1115,12 +3843,12 @@ def admin_update(section):
         client_section_data = {k: v for k, v in client_section_data.items() if v}
 
         # Update the main Ourclients table
-        if client_section_data and update_data(table_mapping[section], client_section_data):
+        if client_section_data and update_data(ADMIN_TABLE_MAPPING[section], client_section_data):
             flash('Client section details updated successfully!', 'success')
         elif not client_section_data:
             flash('No changes to update for client section details.', 'warning')
         else:
-            flash(f'Error updating {section_titles.get(section, "section")} details. Please try again.', 'error')
+            flash(f'Error updating {ADMIN_SECTION_TITLES.get(section, "section")} details. Please try again.', 'error')
 
         # Now handle logos separately
         new_logos = []
@@ -1187,7 +3915,7 @@ def admin_update(section):
         about_us_data = {k: v for k, v in about_us_data.items() if v}
 
         # Update the main `aboutUs` table
-        if about_us_data and update_data(table_mapping[section], about_us_data):
+        if about_us_data and update_data(ADMIN_TABLE_MAPPING[section], about_us_data):
             flash('About Us page content updated successfully!', 'success')
         elif not about_us_data:
             flash('No changes to update for About Us content.', 'warning')
@@ -1266,6 +3994,17 @@ def admin_update(section):
             flash('Error updating team members.', 'error')
 
         return redirect(url_for('admin', section=section))
+
+    # The combined image/video inputs are saved to the column their media type renders from
+    for field_name, (type_field, image_field, video_field) in ADMIN_MEDIA_UPLOAD_FIELDS.items():
+        file_url = uploaded_files.pop(field_name, None)
+        if file_url:
+            media_type = form_data.get(type_field)
+            if media_type not in ('image', 'video'):
+                media_type = 'video' if file_url.rsplit('.', 1)[-1].lower() in VIDEO_EXTENSIONS else 'image'
+            form_data[type_field] = media_type
+            uploaded_files[video_field if media_type == 'video' else image_field] = file_url
+
     # Update form_data with uploaded file paths
     for field_name, file_path in uploaded_files.items():
         form_data[field_name] = file_path
@@ -1297,15 +4036,79 @@ def admin_update(section):
                     video_field = "knowVideo"
                 if video_field in form_data: del form_data[video_field]
 
-    if form_data and update_data(table_mapping[section], form_data):
-        flash(f'{section_titles.get(section, "Section")} updated successfully!', 'success')
+    if form_data and update_data(ADMIN_TABLE_MAPPING[section], form_data):
+        flash(f'{ADMIN_SECTION_TITLES.get(section, "Section")} updated successfully!', 'success')
     elif not form_data:
         flash('No changes to update.', 'warning')
     else:
-        flash(f'Error updating {section_titles.get(section, "section")}. Please try again.', 'error')
+        flash(f'Error updating {ADMIN_SECTION_TITLES.get(section, "section")}. Please try again.', 'error')
 
     return redirect(url_for('admin', section=section))
 
+# =================================================================================================
+# Admin Chunked Uploads
+# =================================================================================================
+@app.route('/admin/uploads', methods=['POST'])
+@admin_required
+def admin_upload_start():
+    """Start a chunked upload: JSON {filename, size} -> upload session."""
+    payload = request.get_json(silent=True) or {}
+    filename = str(payload.get('filename', ''))
+    try:
+        size = int(payload.get('size', 0))
+    except (TypeError, ValueError):
+        size = 0
+    if not filename or not allowed_file(filename):
+        return {'error': 'File type not allowed'}, 400
+    if size <= 0 or size > UPLOAD_SESSION_MAX_SIZE:
+        return {'error': f'File size must be between 1 byte and {UPLOAD_SESSION_MAX_SIZE} bytes'}, 400
+
+    session_row = start_upload_session(filename, size)
+    if session_row is None:
+        return {'error': 'Could not start upload'}, 500
+    return jsonify(upload_session_status(session_row)), 201
+
+@app.route('/admin/uploads/<upload_id>')
+@admin_required
+def admin_upload_status(upload_id):
+    """Progress of a chunked upload, used by the client to resume."""
+    session_row = get_upload_session(upload_id)
+    if session_row is None:
+        return {'error': 'Upload not found'}, 404
+    return jsonify(upload_session_status(session_row))
+
+@app.route('/admin/uploads/<upload_id>', methods=['PUT'])
+@admin_required
+def admin_upload_chunk(upload_id):
+    """Receive one chunk; the raw body is written at X-Upload-Offset and checked against X-Chunk-SHA256."""
+    offset = request.headers.get('X-Upload-Offset', type=int)
+    if offset is None or offset < 0:
+        return {'error': 'X-Upload-Offset header is required'}, 400
+
+    session_row, error = write_upload_chunk(upload_id, offset, request.stream,
+                                            request.headers.get('X-Chunk-SHA256'))
+    if session_row is None:
+        return {'error': error}, 404 if error == 'Upload not found' else 500
+    if error:
+        # The client resumes from the 'received' offset in the response
+        return jsonify(dict(upload_session_status(session_row), error=error)), 409
+    return jsonify(upload_session_status(session_row))
+
+# =================================================================================================
+# Admin Cache Stats Route
+# =================================================================================================
+@app.route('/admin/cache-stats')
+@admin_required
+def admin_cache_stats():
+    """Content and fragment cache hit/miss counters as JSON."""
+    return jsonify({**content_cache.stats(), 'fragments': fragment_cache.stats()})
+
+@app.route('/admin/metrics')
+@admin_required
+def admin_metrics():
+    """Per-endpoint request metrics in the Prometheus text format."""
+    return Response(request_metrics.render(), mimetype='text/plain; version=0.0.4')
+
 # =================================================================================================
 # Admin Email Test Route
 # =================================================================================================
@@ -1359,6 +4162,72 @@ If you received this email, your configuration is working properly!
     
     return render_template('admin_test_email_smtp.html', config=config_info)
 
+# =================================================================================================
+# Admin Email Campaigns
+# =================================================================================================
+@app.route('/admin/campaigns')
+@app.route('/admin/campaigns/<int:campaign_id>')
+@admin_required
+def admin_campaigns(campaign_id=None):
+    """Announcement campaigns, with per-recipient results for the selected one."""
+    campaign = get_email_campaign(campaign_id) if campaign_id else None
+    if campaign_id and campaign is None:
+        flash('Campaign not found.', 'error')
+        return redirect(url_for('admin_campaigns'))
+    return render_template('admin_campaigns.html',
+                           campaigns=fetch_email_campaigns(),
+                           campaign=campaign,
+                           campaign_active=email_service.is_campaign_active(campaign),
+                           failed_recipients=fetch_campaign_recipients(campaign_id, 'failed', ADMIN_PAGE_SIZE)
+                                             if campaign else [],
+                           audiences=BULK_AUDIENCES,
+                           job_titles=fetch_job_titles())
+
+@app.route('/admin/campaigns/create', methods=['POST'])
+@admin_required
+def admin_campaign_create():
+    """Create a campaign for one of the BULK_AUDIENCES and start sending it."""
+    name = request.form.get('campaign_name', '').strip()
+    subject = request.form.get('subject', '').strip()
+    body = request.form.get('body', '').strip()
+    audience = request.form.get('audience')
+    if not name or not subject or not body or audience not in BULK_AUDIENCES:
+        flash('Please fill in the name, audience, subject and message.', 'error')
+        return redirect(url_for('admin_campaigns'))
+
+    if audience == 'job_applicants':
+        params = (request.form.get('job_id', type=int),)
+    else:
+        days = request.form.get('days', 30, type=int)
+        params = (datetime.now() - timedelta(days=days),)
+
+    try:
+        BULK_TEMPLATE_ENV.from_string(subject)
+        BULK_TEMPLATE_ENV.from_string(body)
+    except jinja2.TemplateSyntaxError as e:
+        flash(f'Template error: {e}', 'error')
+        return redirect(url_for('admin_campaigns'))
+
+    campaign_id = email_service.send_bulk(name, subject, body, query=BULK_AUDIENCES[audience][1], params=params)
+    if campaign_id is None:
+        flash('No recipients matched, or the campaign could not be saved.', 'error')
+        return redirect(url_for('admin_campaigns'))
+    flash('Campaign created, sending in the background.', 'success')
+    return redirect(url_for('admin_campaigns', campaign_id=campaign_id))
+
+@app.route('/admin/campaigns/<int:campaign_id>/resume', methods=['POST'])
+@admin_required
+def admin_campaign_resume(campaign_id):
+    """Resume a paused or interrupted campaign, optionally retrying failed recipients."""
+    if request.form.get('retry_failed'):
+        retried = retry_failed_campaign_recipients(campaign_id)
+        flash(f'{retried} failed recipient(s) queued again.', 'success')
+    if email_service.resume_bulk(campaign_id):
+        flash('Campaign resumed.', 'success')
+    else:
+        flash('This campaign is already sending.', 'warning')
+    return redirect(url_for('admin_campaigns', campaign_id=campaign_id))
+
 # =================================================================================================
 # Contact Submission Management Routes
 # =================================================================================================
@@ -1391,7 +4260,8 @@ def view_contact_submission(submission_id):
         'submission_date': submission['submission_date'].strftime('%Y-%m-%d %H:%M:%S') if submission['submission_date'] else None,
         'status': submission.get('status', 'new'),
         'priority': submission.get('priority', 'medium'),
-        'notes': submission.get('notes', '')
+        'notes': submission.get('notes', ''),
+        **{field: submission.get(field) or '' for field in CONTACT_DETAIL_FIELDS}
     }
     
     return jsonify(submission_data)
@@ -1410,118 +4280,150 @@ def update_contact_status(submission_id):
     
     return redirect(url_for('admin', section='contact_submissions'))
 
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', 1000))
+
+def contact_submission_csv_row(submission):
+    """Builds an export row from a submission's stored columns."""
+    return [
+        submission['id'],
+        submission['name'],
+        submission['email'],
+        submission['subject'],
+        submission['company'] or '',
+        submission['industry'] or '',
+        submission['phone'] or '',
+        submission['job_title'] or '',
+        submission['company_size'] or '',
+        submission['project_details'] or '',
+        submission.get('status', 'new'),
+        submission.get('priority', 'medium'),
+        submission.get('notes', ''),
+        submission['submission_date'].strftime('%Y-%m-%d %H:%M:%S') if submission['submission_date'] else ''
+    ]
+
 @app.route('/admin/contact/export')
 @admin_required
 def export_contact_submissions():
-    """Export contact submissions as CSV."""
-    submissions = fetch_contact_submissions()
-    
-    # Create CSV content
-    output = StringIO()
-    writer = csv.writer(output)
-    
-    # Write header
-    writer.writerow([
-        'ID', 'Name', 'Email', 'Subject', 'Company', 'Industry', 
-        'Phone', 'Job Title', 'Company Size', 'Project Details', 'Status', 
-        'Priority', 'Notes', 'Submission Date'
-    ])
-    
-    # Write data
-    for submission in submissions:
-        # Parse message to extract structured data
-        message = submission['message']
-        company = ''
-        industry = ''
-        phone = ''
-        job_title = ''
-        company_size = ''
-        project_details = ''
-        
-        # Extract data from message using simple string parsing
-        lines = message.split('\n')
-        in_project_section = False
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- Company:'):
-                company = line.replace('- Company:', '').strip()
-            elif line.startswith('- Industry:'):
-                industry = line.replace('- Industry:', '').strip()
-            elif line.startswith('- Phone:'):
-                phone = line.replace('- Phone:', '').strip()
-            elif line.startswith('- Job Title:'):
-                job_title = line.replace('- Job Title:', '').strip()
-            elif line.startswith('- Number of Employees:') or line.startswith('- Company Size:'):
-                company_size = line.split(':', 1)[1].strip() if ':' in line else ''
-            elif line == 'Project Details:':
-                in_project_section = True
-            elif in_project_section and line:
-                project_details += line + ' '
-        
-        writer.writerow([
-            submission['id'],
-            submission['name'],
-            submission['email'],
-            submission['subject'],
-            company,
-            industry,
-            phone,
-            job_title,
-            company_size,
-            project_details.strip(),
-            submission.get('status', 'new'),
-            submission.get('priority', 'medium'),
-            submission.get('notes', ''),
-            submission['submission_date'].strftime('%Y-%m-%d %H:%M:%S') if submission['submission_date'] else ''
-        ])
-    
-    # Create response
-    response = make_response(output.getvalue())
-    response.headers['Content-Type'] = 'text/csv'
+    """Export contact submissions as CSV, streamed in batches.
+
+    Accepts the same status/priority/date_from/date_to filters as the inbox.
+    """
+    clauses, params = build_contact_filter_clause(parse_contact_filters(request.args))
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+
+    # A dedicated, unbuffered cursor reads rows off the socket batch by batch. The query runs
+    # before the response starts, so a failure is reported instead of sending a truncated 200.
+    conn = None
+    cursor = None
+    released = []
+
+    def release():
+        """Returns the connection to the pool, once, draining rows an aborted download left unread."""
+        if released or conn is None:
+            return
+        released.append(True)
+        try:
+            if cursor is not None:
+                conn.consume_results()
+                cursor.close()
+        except mysql.connector.Error as err:
+            print(f"Error closing export cursor: {err}")
+        finally:
+            try:
+                conn.close()
+            except mysql.connector.Error as err:
+                print(f"Error releasing export connection: {err}")
+
+    try:
+        # TimedConnection, so the export is counted in the metrics and slow-query log like other queries
+        conn = TimedConnection(checkout_pooled_connection())
+        cursor = conn.cursor(dictionary=True, buffered=False)
+        cursor.execute(f"""SELECT id, name, email, subject, {', '.join(CONTACT_DETAIL_FIELDS)},
+                                  submission_date, status, priority, notes
+                           FROM contact_submissions
+                           {where}
+                           ORDER BY submission_date DESC, id DESC""", params)
+    except mysql.connector.Error as err:
+        print(f"Error exporting contact submissions: {err}")
+        release()
+        flash('Error exporting submissions. Please try again.', 'error')
+        return redirect(url_for('admin', section='contact_submissions'))
+
+    def generate():
+        try:
+            output = StringIO()
+            writer = csv.writer(output)
+
+            # Write header
+            writer.writerow([
+                'ID', 'Name', 'Email', 'Subject', 'Company', 'Industry', 
+                'Phone', 'Job Title', 'Company Size', 'Project Details', 'Status', 
+                'Priority', 'Notes', 'Submission Date'
+            ])
+            yield output.getvalue()
+
+            while True:
+                submissions = cursor.fetchmany(EXPORT_BATCH_SIZE)
+                if not submissions:
+                    break
+                output.seek(0)
+                output.truncate()
+                for submission in submissions:
+                    writer.writerow(contact_submission_csv_row(submission))
+                yield output.getvalue()
+        finally:
+            release()
+
+    response = Response(stream_with_context(generate()), mimetype='text/csv')
+    # Also covers a client that disconnects before the first chunk is generated
+    response.call_on_close(release)
     response.headers['Content-Disposition'] = f'attachment; filename=contact_submissions_{datetime.now().strftime("%Y%m%d_%H%M%S")}.csv'
-    
     return response
 
 @app.route('/admin/contact/bulk-delete', methods=['POST'])
 @admin_required
 def bulk_delete_contact_submissions():
-    """Bulk delete contact submissions."""
+    """Bulk delete contact submissions by selection or filter."""
     submission_ids = request.form.getlist('submission_ids')
-    
-    if not submission_ids:
+    filters = parse_contact_filters(request.form)
+
+    if not submission_ids and not filters:
         flash('No submissions selected for deletion.', 'warning')
         return redirect(url_for('admin', section='contact_submissions'))
-    
-    conn = get_db_connection()
-    if conn is None:
-        flash('Database connection error.', 'error')
-        return redirect(url_for('admin', section='contact_submissions'))
-    
-    cursor = conn.cursor()
-    deleted_count = 0
-    
-    try:
-        for submission_id in submission_ids:
-            cursor.execute("DELETE FROM contact_submissions WHERE id = %s", (submission_id,))
-            if cursor.rowcount > 0:
-                deleted_count += 1
-        conn.commit()
-        
-        if deleted_count > 0:
-            flash(f'Successfully deleted {deleted_count} submission(s).', 'success')
-        else:
-            flash('No submissions were deleted.', 'warning')
-            
-    except mysql.connector.Error as err:
-        print(f"Error bulk deleting submissions: {err}")
+
+    deleted_count = delete_contact_submissions(submission_ids, filters)
+    if deleted_count is None:
         flash('Error deleting submissions.', 'error')
-    finally:
-        if cursor:
-            cursor.close()
-        if conn:
-            conn.close()
-    
+    elif deleted_count > 0:
+        flash(f'Successfully deleted {deleted_count} submission(s).', 'success')
+    else:
+        flash('No submissions were deleted.', 'warning')
+
+    return redirect(url_for('admin', section='contact_submissions'))
+
+@app.route('/admin/contact/bulk-status', methods=['POST'])
+@admin_required
+def bulk_update_contact_status():
+    """Bulk update contact submission status by selection or filter."""
+    new_status = request.form.get('new_status')
+    submission_ids = request.form.getlist('submission_ids')
+    filters = parse_contact_filters(request.form)
+
+    if new_status not in CONTACT_STATUSES:
+        flash('Invalid status selected.', 'error')
+        return redirect(url_for('admin', section='contact_submissions'))
+    if not submission_ids and not filters:
+        flash('No submissions selected for update.', 'warning')
+        return redirect(url_for('admin', section='contact_submissions'))
+
+    updated_count = update_contact_submissions_status(new_status, submission_ids, filters)
+    if updated_count is None:
+        flash('Error updating submissions.', 'error')
+    elif updated_count > 0:
+        flash(f'Successfully marked {updated_count} submission(s) as {new_status}.', 'success')
+    else:
+        flash('No submissions were updated.', 'warning')
+
     return redirect(url_for('admin', section='contact_submissions'))
 
 # =================================================================================================
@@ -1651,13 +4553,16 @@ def delete_blog_post(blog_id):
 
 # Public Blog Routes
 @app.route('/news')
+@cached_page
 def news():
     """Renders the news/blog listing page."""
     blog_posts = fetch_blog_posts()
     base_data_dict = base_data()
+    set_last_modified(*(post.get('updated_at') for post in blog_posts))
     return render_template('news.html', blog_posts=blog_posts, **base_data_dict)
 
 @app.route('/blog/<int:blog_id>')
+@cached_page
 def blog_detail(blog_id):
     """Renders a single blog post detail page."""
     blog_post = fetch_blog_post_by_id(blog_id)
@@ -1669,6 +4574,7 @@ def blog_detail(blog_id):
     # Get related posts (exclude current post)
     related_posts = fetch_blog_posts(limit=3)
     related_posts = [post for post in related_posts if post['blog_id'] != blog_id][:3]
+    set_last_modified(blog_post.get('updated_at'), *(post.get('updated_at') for post in related_posts))
     
     return render_template('blog_detail.html', 
                          blog_post=blog_post, 
@@ -1696,14 +4602,7 @@ def admin_blog_create():
         if 'blog_image' in request.files:
             file = request.files['blog_image']
             if file and file.filename != '' and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                timestamp = str(int(time.time()))
-                name, ext = os.path.splitext(filename)
-                filename = f"{name}_{timestamp}{ext}"
-                
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(file_path)
-                blog_image = f"/static/uploads/{filename}"
+                blog_image = save_upload(file)
         
         post_data = {
             'blog_title': request.form.get('blog_title'),
@@ -1717,6 +4616,7 @@ def admin_blog_create():
         }
         
         if create_blog_post(post_data):
+            page_cache.bump()
             flash('Blog post created successfully!', 'success')
             return redirect(url_for('admin_blogs'))
         else:
@@ -1739,14 +4639,7 @@ def admin_blog_edit(blog_id):
         if 'blog_image' in request.files:
             file = request.files['blog_image']
             if file and file.filename != '' and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                timestamp = str(int(time.time()))
-                name, ext = os.path.splitext(filename)
-                filename = f"{name}_{timestamp}{ext}"
-                
-                file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(file_path)
-                blog_image = f"/static/uploads/{filename}"
+                blog_image = save_upload(file)
         
         post_data = {
             'blog_title': request.form.get('blog_title'),
@@ -1760,6 +4653,7 @@ def admin_blog_edit(blog_id):
         }
         
         if update_blog_post(blog_id, post_data):
+            page_cache.bump()
             flash('Blog post updated successfully!', 'success')
             return redirect(url_for('admin_blogs'))
         else:
@@ -1772,6 +4666,7 @@ def admin_blog_edit(blog_id):
 def admin_blog_delete(blog_id):
     """Delete blog post."""
     if delete_blog_post(blog_id):
+        page_cache.bump()
         flash('Blog post deleted successfully!', 'success')
     else:
         flash('Error deleting blog post.', 'error')
@@ -1907,8 +4802,8 @@ def delete_job_posting(job_id):
         if conn:
             conn.close()
 
-def create_job_application(application_data):
-    """Creates a new job application."""
+def create_job_application(application_data, emails=None):
+    """Creates a new job application, queueing its notification emails in the same transaction."""
     conn = get_db_connection()
     if conn is None:
         return False
@@ -1934,7 +4829,11 @@ def create_job_application(application_data):
             application_data.get('availability_date'),
             'pending'
         ))
+        for queued in emails or []:
+            enqueue_email(cursor, **queued)
         conn.commit()
+        if emails:
+            email_outbox.notify()
         return True
     except mysql.connector.Error as err:
         print(f"Error creating job application: {err}")
@@ -1945,22 +4844,95 @@ def create_job_application(application_data):
         if conn:
             conn.close()
 
-def fetch_job_applications():
-    """Fetches all job applications with job details."""
+APPLICATION_STATUSES = ('pending', 'reviewed', 'shortlisted', 'interviewed', 'hired', 'rejected')
+# Columns shown in the applications list; the cover letter is loaded on demand
+APPLICATION_LIST_COLUMNS = """ja.application_id, ja.job_id, ja.applicant_name, ja.applicant_email,
+                              ja.applicant_phone, ja.cv_filename, ja.cv_path, ja.linkedin_profile,
+                              ja.portfolio_website, ja.expected_salary, ja.availability_date,
+                              ja.application_status, ja.applied_date, ja.notes,
+                              jp.job_title, jp.department"""
+
+def parse_application_filters(args):
+    """Reads job_id/status/date_from/date_to filters from request args. Invalid values are ignored."""
+    filters = {}
+    if str(args.get('job_id', '')).isdigit():
+        filters['job_id'] = int(args['job_id'])
+    if args.get('status') in APPLICATION_STATUSES:
+        filters['status'] = args['status']
+    for field in ('date_from', 'date_to'):
+        try:
+            filters[field] = datetime.strptime(args.get(field, ''), '%Y-%m-%d')
+        except ValueError:
+            pass
+    return filters
+
+def build_application_filter_clause(filters):
+    """Builds a WHERE clause served by the (job_id, applied_date) and (application_status, applied_date) indexes."""
+    clauses, params = [], []
+    if filters.get('job_id'):
+        clauses.append("ja.job_id = %s")
+        params.append(filters['job_id'])
+    if filters.get('status'):
+        clauses.append("ja.application_status = %s")
+        params.append(filters['status'])
+    if filters.get('date_from'):
+        clauses.append("ja.applied_date >= %s")
+        params.append(filters['date_from'])
+    if filters.get('date_to'):
+        clauses.append("ja.applied_date < %s")
+        params.append(filters['date_to'] + timedelta(days=1))
+    return clauses, params
+
+def fetch_job_applications(filters=None, after=None, before=None, page_size=ADMIN_PAGE_SIZE):
+    """Fetches one page of job applications with job details, newest first, without cover letters."""
+    clauses, params = build_application_filter_clause(filters or {})
+    return fetch_keyset_page(f"""SELECT {APPLICATION_LIST_COLUMNS}
+                                 FROM job_applications ja
+                                 JOIN job_postings jp ON ja.job_id = jp.job_id""",
+                             clauses, params, 'ja.applied_date', 'ja.application_id',
+                             after=after, before=before, page_size=page_size)
+
+def get_job_application_stats(filters=None):
+    """Counts job applications per status, honouring the job and date filters."""
+    filters = {k: v for k, v in (filters or {}).items() if k != 'status'}
+    clauses, params = build_application_filter_clause(filters)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+    stats = {status: 0 for status in APPLICATION_STATUSES}
+    stats['total'] = 0
+
+    conn = get_db_connection()
+    if conn is None:
+        return stats
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(f"""SELECT ja.application_status AS status, COUNT(*) AS applications
+                           FROM job_applications ja
+                           {where}
+                           GROUP BY ja.application_status""", params)
+        for row in cursor.fetchall():
+            stats[row['status']] = row['applications']
+            stats['total'] += row['applications']
+        return stats
+    except mysql.connector.Error as err:
+        print(f"Error fetching job application stats: {err}")
+        return stats
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+def fetch_job_titles():
+    """Fetches id and title of every job posting, for filter dropdowns."""
     conn = get_db_connection()
     if conn is None:
         return []
     cursor = conn.cursor(dictionary=True)
     try:
-        query = """SELECT ja.*, jp.job_title, jp.department 
-                   FROM job_applications ja 
-                   JOIN job_postings jp ON ja.job_id = jp.job_id 
-                   ORDER BY ja.applied_date DESC"""
-        cursor.execute(query)
-        data = cursor.fetchall()
-        return data
+        cursor.execute("SELECT job_id, job_title FROM job_postings ORDER BY posted_date DESC")
+        return cursor.fetchall()
     except mysql.connector.Error as err:
-        print(f"Error fetching job applications: {err}")
+        print(f"Error fetching job titles: {err}")
         return []
     finally:
         if cursor:
@@ -1968,6 +4940,25 @@ def fetch_job_applications():
         if conn:
             conn.close()
 
+def get_job_application_cover_letter(application_id):
+    """Fetches the cover letter of a single job application."""
+    conn = get_db_connection()
+    if conn is None:
+        return None
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute("SELECT application_id, cover_letter FROM job_applications WHERE application_id = %s",
+                       (application_id,))
+        return cursor.fetchone()
+    except mysql.connector.Error as err:
+        print(f"Error fetching cover letter: {err}")
+        return None
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
 def update_application_status(application_id, status, notes=''):
     """Updates job application status."""
     conn = get_db_connection()
@@ -1990,13 +4981,16 @@ def update_application_status(application_id, status, notes=''):
 
 # Public Career Routes
 @app.route('/careers')
+@cached_page
 def careers():
     """Renders the careers page with active job postings."""
     job_postings = fetch_job_postings('active')
     base_data_dict = base_data()
+    set_last_modified(*(job.get('updated_date') for job in job_postings))
     return render_template('careers.html', job_postings=job_postings, **base_data_dict)
 
 @app.route('/careers/<int:job_id>')
+@cached_page
 def job_detail(job_id):
     """Renders job detail page."""
     job_posting = fetch_job_posting_by_id(job_id)
@@ -2005,11 +4999,12 @@ def job_detail(job_id):
         return redirect(url_for('careers'))
     
     base_data_dict = base_data()
+    set_last_modified(job_posting.get('updated_date'))
     return render_template('job_detail.html', job=job_posting, **base_data_dict)
 
 @app.route('/apply/<int:job_id>', methods=['POST'])
 def apply_for_job(job_id):
-    """Handle job application submission with smtplib."""
+    """Handle job application submission; notification emails go through the outbox."""
     job_posting = fetch_job_posting_by_id(job_id)
     if not job_posting:
         flash('Job posting not found.', 'error')
@@ -2070,10 +5065,9 @@ def apply_for_job(job_id):
             'availability_date': availability_date if availability_date else None
         }
         
-        if create_job_application(application_data):
-            # Send email notification to admin
-            admin_subject = f"New Job Application: {job_posting['job_title']}"
-            admin_body = f"""
+        # Notification to admin
+        admin_subject = f"New Job Application: {job_posting['job_title']}"
+        admin_body = f"""
 New job application received:
 
 Position: {job_posting['job_title']}
@@ -2090,17 +5084,11 @@ Expected Salary: {expected_salary}
 Availability: {availability_date}
 
 The CV has been uploaded to the system. Please check the admin panel for the complete application.
-            """.strip()
-            
-            admin_success, admin_msg = email_service.send_email(
-                EMAIL_USER,  # Send to admin
-                admin_subject,
-                admin_body
-            )
-            
-            # Send confirmation email to applicant
-            user_subject = f"Application Received: {job_posting['job_title']}"
-            user_body = f"""
+        """.strip()
+        
+        # Confirmation to applicant
+        user_subject = f"Application Received: {job_posting['job_title']}"
+        user_body = f"""
 Dear {applicant_name},
 
 Thank you for your interest in the {job_posting['job_title']} position at MindTune Innovations.
@@ -2109,18 +5097,13 @@ We have received your application and will review it carefully. If your qualific
 
 Best regards,
 MindTune Innovations HR Team
-            """.strip()
-            
-            user_success, user_msg = email_service.send_email(
-                applicant_email,
-                user_subject,
-                user_body
-            )
-            
-            # Log results
-            print(f"Admin notification: {'SUCCESS' if admin_success else 'FAILED'} - {admin_msg}")
-            print(f"User confirmation: {'SUCCESS' if user_success else 'FAILED'} - {user_msg}")
-            
+        """.strip()
+        
+        # The application and both emails commit together; the outbox workers deliver them
+        if create_job_application(application_data, emails=[
+            {'to_emails': EMAIL_USER, 'subject': admin_subject, 'body': admin_body},
+            {'to_emails': applicant_email, 'subject': user_subject, 'body': user_body}
+        ]):
             flash('Your application has been submitted successfully! We will contact you soon.', 'success')
         else:
             flash('Error submitting application. Please try again.', 'error')
@@ -2164,6 +5147,7 @@ def admin_job_create():
         }
         
         if create_job_posting(job_data):
+            page_cache.bump()
             flash('Job posting created successfully!', 'success')
             return redirect(url_for('admin_jobs'))
         else:
@@ -2196,6 +5180,7 @@ def admin_job_edit(job_id):
         }
         
         if update_job_posting(job_id, job_data):
+            page_cache.bump()
             flash('Job posting updated successfully!', 'success')
             return redirect(url_for('admin_jobs'))
         else:
@@ -2208,6 +5193,7 @@ def admin_job_edit(job_id):
 def admin_job_delete(job_id):
     """Delete job posting."""
     if delete_job_posting(job_id):
+        page_cache.bump()
         flash('Job posting deleted successfully!', 'success')
     else:
         flash('Error deleting job posting.', 'error')
@@ -2218,8 +5204,28 @@ def admin_job_delete(job_id):
 @admin_required
 def admin_applications():
     """Admin job applications management page."""
-    applications = fetch_job_applications()
-    return render_template('admin_applications.html', applications=applications)
+    filters = parse_application_filters(request.args)
+    applications_page = fetch_job_applications(filters,
+                                                after=request.args.get('after'),
+                                                before=request.args.get('before'))
+    # Raw filter values, carried through pagination links
+    filter_args = {k: request.args[k] for k in ('job_id', 'status', 'date_from', 'date_to')
+                   if request.args.get(k)}
+    return render_template('admin_applications.html',
+                           applications=applications_page['rows'],
+                           applications_page=applications_page,
+                           application_stats=get_job_application_stats(filters),
+                           job_titles=fetch_job_titles(),
+                           filter_args=filter_args)
+
+@app.route('/admin/applications/<int:application_id>/cover-letter')
+@admin_required
+def view_application_cover_letter(application_id):
+    """Cover letter of a single application (AJAX endpoint)."""
+    application = get_job_application_cover_letter(application_id)
+    if not application:
+        return {'error': 'Application not found'}, 404
+    return jsonify(application)
 
 @app.route('/admin/applications/<int:application_id>/status', methods=['POST'])
 @admin_required
@@ -2273,8 +5279,108 @@ def internal_error(error):
 # =================================================================================================
 # Application Initialization
 # =================================================================================================
+# =================================================================================================
+# Startup Migrations
+# =================================================================================================
+# Secondary indexes the admin listings rely on; setupdb.py creates them for new installs
+QUERY_INDEXES = {
+    'contact_submissions': {
+        'idx_submission_status_date': '(status, submission_date)',
+        'idx_submission_priority_date': '(priority, submission_date)'
+    },
+    'job_applications': {
+        'idx_applied_date': '(applied_date)',
+        'idx_job_applied_date': '(job_id, applied_date)',
+        'idx_status_applied_date': '(application_status, applied_date)'
+    }
+}
+
+def migrate_query_indexes():
+    """Adds any of QUERY_INDEXES missing from existing tables."""
+    conn = get_db_connection()
+    if conn is None:
+        return False
+    cursor = conn.cursor(dictionary=True)
+    try:
+        for table, indexes in QUERY_INDEXES.items():
+            table_schema = schema_registry.get(table)
+            if table_schema is None:
+                continue  # Not created yet; setupdb.py adds the indexes with the table
+            # information_schema rather than CREATE INDEX IF NOT EXISTS, which MySQL doesn't have
+            cursor.execute("""SELECT DISTINCT INDEX_NAME AS index_name FROM information_schema.STATISTICS
+                              WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s""", (table_schema['name'],))
+            existing = {row['index_name'] for row in cursor.fetchall()}
+            missing = [name for name in indexes if name not in existing]
+            if missing:
+                cursor.execute(f"ALTER TABLE {table_schema['name']} " + ', '.join(
+                    f"ADD INDEX {name} {indexes[name]}" for name in missing))
+                print(f"Added {', '.join(missing)} to {table_schema['name']}")
+        return True
+    except mysql.connector.Error as err:
+        print(f"Error adding query indexes: {err}")
+        return False
+    finally:
+        if cursor:
+            cursor.close()
+        if conn:
+            conn.close()
+
+# Each step is idempotent and returns True on success. Steps that succeeded are not run again;
+# after a failure the rest are retried with a growing delay rather than on every request.
+DATABASE_MIGRATIONS = [
+    create_contact_submissions_table,  # Also loads the schema registry
+    migrate_contact_submission_fields,
+    migrate_query_indexes,
+    create_contact_stats_table,
+    create_email_outbox_table,
+    create_email_campaign_tables,
+    create_uploads_table,
+    create_upload_sessions_table,
+    create_upload_references_table
+]
+DATABASE_PREPARE_RETRY = int(os.getenv('DATABASE_PREPARE_RETRY', 30))  # seconds, doubled per failure
+DATABASE_PREPARE_MAX_RETRY = 900
+
+_completed_migrations = set()
+_database_prepared = False
+_database_prepare_lock = threading.Lock()
+_database_prepare_state = {'failures': 0, 'retry_at': 0.0}
+_image_backfill_started = False
+
+def prepare_database():
+    """Runs the migrations that haven't succeeded yet; True once all of them have."""
+    global _image_backfill_started
+    for migration in DATABASE_MIGRATIONS:
+        if migration.__name__ not in _completed_migrations and migration():
+            _completed_migrations.add(migration.__name__)
+    prepared = len(_completed_migrations) == len(DATABASE_MIGRATIONS)
+
+    if prepared:
+        _database_prepare_state.update(failures=0, retry_at=0.0)
+    else:
+        failures = _database_prepare_state['failures'] + 1
+        delay = min(DATABASE_PREPARE_RETRY * 2 ** (failures - 1), DATABASE_PREPARE_MAX_RETRY)
+        _database_prepare_state.update(failures=failures, retry_at=time.monotonic() + delay)
+        print(f"Database preparation incomplete, retrying in {delay}s")
+
+    # Scanning the upload folder doesn't need the database, so it happens once, off the request path
+    if not _image_backfill_started:
+        _image_backfill_started = True
+        threading.Thread(target=backfill_image_variants, name="image-backfill", daemon=True).start()
+    return prepared
+
+@app.before_request
+def ensure_database_prepared():
+    """Runs prepare_database() once per process under any server, not only `python app.py`."""
+    global _database_prepared
+    if _database_prepared or time.monotonic() < _database_prepare_state['retry_at']:
+        return
+    with _database_prepare_lock:
+        if not _database_prepared and time.monotonic() >= _database_prepare_state['retry_at']:
+            _database_prepared = prepare_database()
+
 if __name__ == '__main__':
     # Debug email configuration
     debug_email_config()
-    create_contact_submissions_table()
+    _database_prepared = prepare_database()
     app.run(debug=True)
\ No newline at end of file
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+MindTune Innovations Benchmark Script
+Seeds a benchmark database through setupdb.py, load-tests the public routes and
+compares the results against a saved baseline
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import mysql.connector
+from dotenv import load_dotenv
+
+load_dotenv()
+
+BASELINE_FILE = 'benchmark_baseline.json'
+STATIC_ROUTES = ['/', '/about', '/services', '/news', '/careers']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load-test the public MindTune routes")
+    parser.add_argument('--database', default=os.getenv('BENCH_DB_NAME', 'mindtunes_bench'),
+                        help="Database to seed and benchmark against (never your real one)")
+    parser.add_argument('--blogs', type=int, default=200, help="Blog posts to seed")
+    parser.add_argument('--jobs', type=int, default=100, help="Job postings to seed")
+    parser.add_argument('--skip-seed', action='store_true', help="Reuse the existing benchmark database")
+    parser.add_argument('--requests', type=int, default=200, help="Requests per route")
+    parser.add_argument('--concurrency', type=int, default=10, help="Concurrent clients")
+    parser.add_argument('--warmup', type=int, default=5, help="Untimed requests per route before measuring")
+    parser.add_argument('--detail-pages', type=int, default=20,
+                        help="Distinct blog and job detail pages to spread requests over")
+    parser.add_argument('--cold', action='store_true', help="Disable the content and page caches")
+    parser.add_argument('--url', help="Benchmark a running server (e.g. http://127.0.0.1:5000) instead of in-process")
+    parser.add_argument('--baseline', default=BASELINE_FILE, help="Baseline file to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="Store this run as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=0.15,
+                        help="Allowed relative slowdown before a route is reported as a regression")
+    return parser.parse_args()
+
+
+def configure_environment(args):
+    """Points both setupdb.py and app.py at the benchmark database before they are imported."""
+    os.environ['DB_NAME'] = args.database
+    os.environ['DB_DATABASE'] = args.database
+    # Background delivery would add its own polling queries to the counts
+    os.environ['EMAIL_OUTBOX_WORKERS'] = '0'
+    if args.cold:
+        os.environ['CONTENT_CACHE_TTL'] = '0'
+        os.environ['PAGE_CACHE_TTL'] = '0'
+
+
+def seed_database(args):
+    from setupdb import DatabaseSetup
+
+    db_setup = DatabaseSetup()
+    if not db_setup.setup_complete_database():
+        return False
+    try:
+        return db_setup.seed_benchmark_data(blog_count=args.blogs, job_count=args.jobs)
+    finally:
+        db_setup.close_connection()
+
+
+def monitor_connection(database):
+    return mysql.connector.connect(
+        host=os.getenv('DB_HOST', 'localhost'),
+        user=os.getenv('DB_USER', 'root'),
+        password=os.getenv('DB_PASSWORD', ''),
+        port=int(os.getenv('DB_PORT', '3306')),
+        database=database,
+        autocommit=True
+    )
+
+
+def server_questions(conn):
+    """Statements executed by the server so far (includes this one)."""
+    cursor = conn.cursor()
+    cursor.execute("SHOW GLOBAL STATUS LIKE 'Questions'")
+    value = int(cursor.fetchone()[1])
+    cursor.close()
+    return value
+
+
+def build_routes(conn, detail_pages):
+    """Returns route name -> list of paths; detail routes rotate over several ids."""
+    cursor = conn.cursor()
+    cursor.execute("SELECT blog_id FROM blog_posts WHERE blog_status = 'published' ORDER BY blog_date DESC LIMIT %s",
+                   (detail_pages,))
+    blog_ids = [row[0] for row in cursor.fetchall()]
+    cursor.execute("SELECT job_id FROM job_postings WHERE job_status = 'active' ORDER BY posted_date DESC LIMIT %s",
+                   (detail_pages,))
+    job_ids = [row[0] for row in cursor.fetchall()]
+    cursor.close()
+
+    routes = {path: [path] for path in STATIC_ROUTES}
+    if blog_ids:
+        routes['/blog/<id>'] = [f"/blog/{blog_id}" for blog_id in blog_ids]
+    if job_ids:
+        routes['/careers/<id>'] = [f"/careers/{job_id}" for job_id in job_ids]
+    return routes
+
+
+def make_client(base_url):
+    """Returns a fetch(path) -> status callable, one underlying client per thread."""
+    if base_url:
+        def fetch(path):
+            try:
+                with urllib.request.urlopen(base_url.rstrip('/') + path, timeout=30) as response:
+                    response.read()
+                    return response.status
+            except urllib.error.HTTPError as e:
+                return e.code
+        return fetch
+
+    from app import app
+    local = threading.local()
+
+    def fetch(path):
+        if not hasattr(local, 'client'):
+            local.client = app.test_client()
+        response = local.client.get(path)
+        response.get_data()
+        return response.status_code
+    return fetch
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, int(round(pct / 100.0 * len(sorted_values))))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def run_route(fetch, paths, total, concurrency, warmup):
+    """Issues total requests spread over paths and returns latency statistics."""
+    for n in range(warmup):
+        fetch(paths[n % len(paths)])
+
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+
+    def one(n):
+        start = time.perf_counter()
+        try:
+            status = fetch(paths[n % len(paths)])
+        except Exception as e:
+            status = str(e)
+        elapsed = (time.perf_counter() - start) * 1000
+        with lock:
+            latencies.append(elapsed)
+            if status != 200:
+                errors.append(status)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(one, range(total)))
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'requests': total,
+        'errors': len(errors),
+        'rps': total / wall if wall else 0.0,
+        'p50': percentile(latencies, 50),
+        'p95': percentile(latencies, 95),
+        'p99': percentile(latencies, 99)
+    }
+
+
+def compare(results, baseline, tolerance):
+    """Returns regression messages for routes that got slower or chattier than the baseline."""
+    regressions = []
+    for route, result in results.items():
+        previous = baseline.get('routes', {}).get(route)
+        if not previous:
+            continue
+        if result['p95'] > previous['p95'] * (1 + tolerance):
+            regressions.append(f"{route}: p95 {previous['p95']:.1f}ms -> {result['p95']:.1f}ms")
+        if result['rps'] < previous['rps'] * (1 - tolerance):
+            regressions.append(f"{route}: req/s {previous['rps']:.1f} -> {result['rps']:.1f}")
+        if result['queries'] > previous['queries'] + 0.5:
+            regressions.append(f"{route}: queries/request {previous['queries']:.1f} -> {result['queries']:.1f}")
+    return regressions
+
+
+def print_report(results):
+    header = f"{'Route':<16}{'Reqs':>7}{'Errors':>8}{'Req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'Queries':>10}"
+    print(header)
+    print('-' * len(header))
+    for route, r in results.items():
+        print(f"{route:<16}{r['requests']:>7}{r['errors']:>8}{r['rps']:>10.1f}"
+              f"{r['p50']:>10.1f}{r['p95']:>10.1f}{r['p99']:>10.1f}{r['queries']:>10.1f}")
+
+
+def main():
+    args = parse_args()
+    configure_environment(args)
+
+    if not args.skip_seed:
+        print(f"Seeding benchmark database '{args.database}'...")
+        if not seed_database(args):
+            print("❌ Seeding failed. Check database_setup.log for details.")
+            return False
+
+    monitor = monitor_connection(args.database)
+    routes = build_routes(monitor, args.detail_pages)
+    fetch = make_client(args.url)
+
+    mode = args.url or 'in-process'
+    print(f"Benchmarking {mode}: {args.requests} requests/route, concurrency {args.concurrency}"
+          f"{', caches disabled' if args.cold else ''}")
+
+    results = {}
+    for route, paths in routes.items():
+        before = server_questions(monitor)
+        result = run_route(fetch, paths, args.requests, args.concurrency, args.warmup)
+        # Questions is server-wide: subtract our own SHOW STATUS and spread over every request sent
+        executed = server_questions(monitor) - before - 1
+        result['queries'] = max(executed, 0) / (args.requests + args.warmup)
+        results[route] = result
+    monitor.close()
+
+    print()
+    print_report(results)
+
+    exit_ok = True
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        print()
+        if regressions:
+            print(f"❌ Regressions against baseline from {baseline.get('recorded_at')}:")
+            for message in regressions:
+                print(f"   {message}")
+            exit_ok = False
+        else:
+            print(f"✅ No regressions against baseline from {baseline.get('recorded_at')}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump({
+                'recorded_at': datetime.now().isoformat(timespec='seconds'),
+                'settings': {k: getattr(args, k) for k in ('blogs', 'jobs', 'requests', 'concurrency', 'cold')},
+                'routes': results
+            }, f, indent=2)
+        print(f"✅ Baseline saved to {args.baseline}")
+
+    return exit_ok
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
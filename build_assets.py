@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+MindTune Innovations Static Asset Build
+Bundles and minifies the CSS/JS under static/ into content-hashed files in static/dist,
+and writes static/dist/manifest.json for app.py to resolve them
+"""
+
+import os
+import re
+import sys
+import json
+import gzip
+import hashlib
+import argparse
+import posixpath
+
+try:
+    import rcssmin
+except ImportError:  # optional; the built-in minifiers below are more conservative
+    rcssmin = None
+try:
+    import rjsmin
+except ImportError:
+    rjsmin = None
+try:
+    import brotli
+except ImportError:  # optional; without it only .gz siblings are written
+    brotli = None
+
+STATIC_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+DIST_FOLDER = 'dist'
+MANIFEST_FILE = 'manifest.json'
+HASH_LENGTH = 12
+# Precompressed siblings served by app.py to clients that accept them
+COMPRESSED_SUFFIXES = ('.br', '.gz')
+
+# Bundle name -> source files (relative to static/), in load order. Templates include bundles
+# with asset_tags(name); every other css/js file still gets its own fingerprinted copy.
+ASSET_BUNDLES = {
+    'site.css': ['css/navbar.css', 'css/backtotop.css'],
+    'site.js': ['js/navbarSetting.js', 'js/backtotop.js'],
+    'index.css': ['css/animation.css', 'css/index.css'],
+    'index.js': ['js/innovationVideoControls.js', 'js/ExpVideoControls.js', 'js/showContact.js'],
+}
+
+STRING_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'')
+# url() with its target, or a quoted string; strings are matched whole so that url() inside them
+# (e.g. fill="url(%23a)" in an inline SVG) is never taken for a stylesheet reference
+CSS_URL_RE = re.compile(r'url\(\s*(?:"([^"]*)"|\'([^\']*)\'|([^"\'()\s]+))\s*\)|' + STRING_RE.pattern)
+
+
+def split_strings(text):
+    """Yields (is_string, chunk) pieces so minifiers never touch quoted content."""
+    position = 0
+    for match in STRING_RE.finditer(text):
+        yield False, text[position:match.start()]
+        yield True, match.group(0)
+        position = match.end()
+    yield False, text[position:]
+
+
+def minify_css(text):
+    if rcssmin is not None:
+        return rcssmin.cssmin(text)
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    parts = []
+    for is_string, chunk in split_strings(text):
+        if not is_string:
+            chunk = re.sub(r'\s+', ' ', chunk)
+            chunk = re.sub(r'\s*([{};,>])\s*', r'\1', chunk)
+            chunk = re.sub(r':\s+', ':', chunk)  # "a :hover" differs from "a:hover", so only after
+            chunk = chunk.replace(';}', '}')
+        parts.append(chunk)
+    return ''.join(parts).strip()
+
+
+def minify_js(text):
+    if rjsmin is not None:
+        return rjsmin.jsmin(text)
+    # Without a real tokenizer only whole-line comments and indentation are safe to drop
+    lines = []
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def rebase_css_urls(text, source, output):
+    """Rewrites relative url() references so they still resolve from the output file."""
+    source_dir = posixpath.dirname(source)
+    output_dir = posixpath.dirname(output)
+
+    def rebase(match):
+        double, single, bare = match.groups()
+        target = next((group for group in (double, single, bare) if group is not None), None)
+        # Quoted strings, data: and other absolute URLs, and fragment references stay as they are
+        if target is None or re.match(r'^(?:[a-z][a-z0-9+.-]*:|/|#)', target, re.I):
+            return match.group(0)
+        quote = '"' if double is not None else "'" if single is not None else ''
+        resolved = posixpath.normpath(posixpath.join(source_dir, target))
+        return f"url({quote}{posixpath.relpath(resolved, output_dir or '.')}{quote})"
+
+    return CSS_URL_RE.sub(rebase, text)
+
+
+def read_source(name):
+    with open(os.path.join(STATIC_FOLDER, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def build_output(name, sources):
+    """Returns the minified content for one output; JS sources are isolated from each other."""
+    pieces = []
+    for source in sources:
+        text = read_source(source)
+        if name.endswith('.css'):
+            pieces.append(minify_css(rebase_css_urls(text, source, hashed_filename(name, ''))))
+        elif len(sources) > 1:
+            # A missing element in one script must not stop the others, as with separate <script> tags
+            pieces.append(f"(function(){{try{{\n{minify_js(text)}\n}}catch(e){{console.error('{source}',e);}}}})();")
+        else:
+            pieces.append(minify_js(text))
+    return '\n'.join(pieces) + '\n'
+
+
+def hashed_filename(name, digest):
+    """dist/<stem>.<hash><ext> for an output, relative to static/; every output lands directly in dist."""
+    stem, ext = posixpath.splitext(posixpath.basename(name))
+    return f"{DIST_FOLDER}/{stem}.{digest}{ext}"
+
+
+def write_hashed(name, content):
+    """Writes content as dist/<stem>.<hash><ext> and returns that path relative to static/."""
+    digest = hashlib.sha256(content.encode('utf-8')).hexdigest()[:HASH_LENGTH]
+    filename = hashed_filename(name, digest)
+    path = os.path.join(STATIC_FOLDER, filename)
+    data = content.encode('utf-8')
+    if not os.path.exists(path):
+        write_atomic(path, data)
+    if not os.path.exists(path + '.gz'):
+        write_atomic(path + '.gz', gzip.compress(data, compresslevel=9, mtime=0))
+    if brotli is not None and not os.path.exists(path + '.br'):
+        write_atomic(path + '.br', brotli.compress(data, quality=11))
+    return filename
+
+
+def write_atomic(path, data):
+    with open(path + '.tmp', 'wb') as f:
+        f.write(data)
+    os.replace(path + '.tmp', path)
+
+
+def standalone_sources():
+    """css/js files not covered by a bundle, relative to static/."""
+    bundled = {source for sources in ASSET_BUNDLES.values() for source in sources}
+    found = []
+    for folder, ext in (('css', '.css'), ('js', '.js')):
+        for entry in sorted(os.listdir(os.path.join(STATIC_FOLDER, folder))):
+            name = f"{folder}/{entry}"
+            if entry.endswith(ext) and name not in bundled:
+                found.append(name)
+    return found
+
+
+def load_manifest(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def build(keep_previous=True):
+    """Builds every bundle and standalone file and returns the new manifest."""
+    dist_path = os.path.join(STATIC_FOLDER, DIST_FOLDER)
+    manifest_path = os.path.join(dist_path, MANIFEST_FILE)
+    os.makedirs(dist_path, exist_ok=True)
+    previous = load_manifest(manifest_path)
+
+    manifest = {'bundles': {}, 'files': {}}
+    for name, sources in ASSET_BUNDLES.items():
+        manifest['bundles'][name] = write_hashed(name, build_output(name, sources))
+        # Sources referenced directly (e.g. by a template not yet using the bundle) resolve too
+        for source in sources:
+            manifest['files'][source] = write_hashed(source, build_output(source, [source]))
+    for source in standalone_sources():
+        manifest['files'][source] = write_hashed(source, build_output(source, [source]))
+
+    with open(manifest_path + '.tmp', 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(manifest_path + '.tmp', manifest_path)
+
+    # Cached pages may still point at the previous build, so its files survive one more run
+    keep = set(manifest['bundles'].values()) | set(manifest['files'].values())
+    if keep_previous:
+        keep |= set(previous.get('bundles', {}).values()) | set(previous.get('files', {}).values())
+    removed = 0
+    for entry in os.scandir(dist_path):
+        name = entry.name
+        if name.endswith(COMPRESSED_SUFFIXES):
+            name = os.path.splitext(name)[0]
+        if entry.is_file() and name != MANIFEST_FILE and f"{DIST_FOLDER}/{name}" not in keep:
+            os.remove(entry.path)
+            removed += 1
+    return manifest, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bundle, minify and fingerprint static CSS/JS")
+    parser.add_argument('--clean', action='store_true', help="Also delete the previous build's files")
+    args = parser.parse_args()
+
+    manifest, removed = build(keep_previous=not args.clean)
+    for name, filename in sorted(manifest['bundles'].items()):
+        print(f"  {name:<28} -> {filename}")
+    print(f"✅ Built {len(manifest['bundles'])} bundles and {len(manifest['files'])} files"
+          f"{f', removed {removed} stale' if removed else ''}")
+    if rcssmin is None or rjsmin is None or brotli is None:
+        print("   (pip install rcssmin rjsmin brotli for smaller output and .br copies)")
+    return True
+
+
+if __name__ == "__main__":
+    sys.exit(0 if main() else 1)
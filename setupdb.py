@@ -285,7 +285,106 @@ class DatabaseSetup:
                     email VARCHAR(255) NOT NULL,
                     subject VARCHAR(255),
                     message TEXT,
-                    submission_date DATETIME DEFAULT CURRENT_TIMESTAMP
+                    submission_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+                    status ENUM('new', 'read', 'replied', 'archived') DEFAULT 'new',
+                    priority ENUM('low', 'medium', 'high') DEFAULT 'medium',
+                    assigned_to VARCHAR(255),
+                    notes TEXT,
+                    company VARCHAR(255),
+                    industry VARCHAR(255),
+                    phone VARCHAR(50),
+                    job_title VARCHAR(255),
+                    company_size VARCHAR(100),
+                    project_details TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                )
+            """,
+            
+            'contact_submission_stats': """
+                CREATE TABLE IF NOT EXISTS contact_submission_stats (
+                    stat_day DATE PRIMARY KEY,
+                    submissions INT NOT NULL DEFAULT 0
+                )
+            """,
+            
+            'email_outbox': """
+                CREATE TABLE IF NOT EXISTS email_outbox (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    recipients TEXT NOT NULL,
+                    subject VARCHAR(500) NOT NULL,
+                    body MEDIUMTEXT NOT NULL,
+                    html_body MEDIUMTEXT,
+                    status ENUM('pending', 'sending', 'sent', 'dead') DEFAULT 'pending',
+                    attempts INT NOT NULL DEFAULT 0,
+                    next_attempt_at DATETIME NOT NULL,
+                    locked_at DATETIME NULL,
+                    claim_token CHAR(32) NULL,
+                    last_error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    sent_at DATETIME NULL
+                )
+            """,
+            
+            'email_campaigns': """
+                CREATE TABLE IF NOT EXISTS email_campaigns (
+                    campaign_id INT AUTO_INCREMENT PRIMARY KEY,
+                    campaign_name VARCHAR(255) NOT NULL,
+                    subject VARCHAR(500) NOT NULL,
+                    body MEDIUMTEXT NOT NULL,
+                    html_body MEDIUMTEXT,
+                    campaign_status ENUM('running', 'paused', 'completed') DEFAULT 'running',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                )
+            """,
+            
+            'email_campaign_recipients': """
+                CREATE TABLE IF NOT EXISTS email_campaign_recipients (
+                    id INT AUTO_INCREMENT PRIMARY KEY,
+                    campaign_id INT NOT NULL,
+                    email VARCHAR(255) NOT NULL,
+                    context TEXT,
+                    status ENUM('pending', 'sent', 'failed') DEFAULT 'pending',
+                    error TEXT,
+                    sent_at DATETIME NULL,
+                    UNIQUE KEY uq_campaign_email (campaign_id, email),
+                    FOREIGN KEY (campaign_id) REFERENCES email_campaigns(campaign_id) ON DELETE CASCADE
+                )
+            """,
+            
+            'uploads': """
+                CREATE TABLE IF NOT EXISTS uploads (
+                    upload_id INT AUTO_INCREMENT PRIMARY KEY,
+                    content_hash CHAR(64) NOT NULL,
+                    file_url VARCHAR(255) NOT NULL UNIQUE,
+                    original_name VARCHAR(255),
+                    size_bytes BIGINT NOT NULL,
+                    ref_count INT NOT NULL DEFAULT 0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+                )
+            """,
+            
+            'upload_references': """
+                CREATE TABLE IF NOT EXISTS upload_references (
+                    table_name VARCHAR(64) NOT NULL,
+                    file_url VARCHAR(255) NOT NULL,
+                    refs INT NOT NULL,
+                    PRIMARY KEY (table_name, file_url),
+                    INDEX idx_upload_reference_url (file_url)
+                )
+            """,
+            
+            'upload_sessions': """
+                CREATE TABLE IF NOT EXISTS upload_sessions (
+                    upload_id CHAR(32) PRIMARY KEY,
+                    original_name VARCHAR(255) NOT NULL,
+                    total_size BIGINT NOT NULL,
+                    received_bytes BIGINT NOT NULL DEFAULT 0,
+                    file_url VARCHAR(255),
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
                 )
             """,
             
@@ -313,9 +412,19 @@ class DatabaseSetup:
             # Create indexes
             indexes = [
                 "CREATE INDEX IF NOT EXISTS idx_submission_date ON contact_submissions (submission_date)",
+                "CREATE INDEX IF NOT EXISTS idx_submission_status_date ON contact_submissions (status, submission_date)",
+                "CREATE INDEX IF NOT EXISTS idx_submission_priority_date ON contact_submissions (priority, submission_date)",
                 "CREATE INDEX IF NOT EXISTS idx_blog_status ON blog_posts (blog_status)",
                 "CREATE INDEX IF NOT EXISTS idx_job_status ON job_postings (job_status)",
-                "CREATE INDEX IF NOT EXISTS idx_application_status ON job_applications (application_status)"
+                "CREATE INDEX IF NOT EXISTS idx_application_status ON job_applications (application_status)",
+                "CREATE INDEX IF NOT EXISTS idx_applied_date ON job_applications (applied_date)",
+                "CREATE INDEX IF NOT EXISTS idx_job_applied_date ON job_applications (job_id, applied_date)",
+                "CREATE INDEX IF NOT EXISTS idx_status_applied_date ON job_applications (application_status, applied_date)",
+                "CREATE INDEX IF NOT EXISTS idx_outbox_status_next ON email_outbox (status, next_attempt_at)",
+                "CREATE INDEX IF NOT EXISTS idx_outbox_claim ON email_outbox (claim_token)",
+                "CREATE INDEX IF NOT EXISTS idx_campaign_status ON email_campaign_recipients (campaign_id, status)",
+                "CREATE INDEX IF NOT EXISTS idx_upload_hash ON uploads (content_hash)",
+                "CREATE INDEX IF NOT EXISTS idx_upload_refs ON uploads (ref_count, updated_at)"
             ]
             
             for index_sql in indexes:
@@ -611,6 +720,75 @@ class DatabaseSetup:
             self.connection.rollback()
             return False
 
+    def seed_benchmark_data(self, blog_count=200, job_count=100, application_count=500):
+        """Top up blog posts, job postings and applications to representative volumes (used by benchmark.py)"""
+        try:
+            if not self.connection or not self.connection.is_connected():
+                if not self.connect_database():
+                    return False
+            cursor = self.connection.cursor()
+            paragraph = ("MindTune Innovations helps teams ship reliable software faster. "
+                         "This paragraph stands in for a realistic article body. ") * 8
+
+            cursor.execute("SELECT COUNT(*) FROM blog_posts")
+            existing = cursor.fetchone()[0]
+            blog_rows = [
+                (f"Benchmark Post {n}", f"Subtitle for post {n}", "Benchmark Author",
+                 date.fromordinal(date.today().toordinal() - n), '/static/images/blog-placeholder.jpg',
+                 paragraph[:300], "\n\n".join([paragraph] * 6), 'published' if n % 10 else 'draft')
+                for n in range(existing + 1, blog_count + 1)
+            ]
+            if blog_rows:
+                cursor.executemany("""
+                    INSERT INTO blog_posts (blog_title, blog_subtitle, blog_author, blog_date, blog_image,
+                                            blog_excerpt, blog_content, blog_status)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+                """, blog_rows)
+            logging.info(f"Blog posts seeded: {len(blog_rows)} added")
+
+            job_types = ('full-time', 'part-time', 'internship', 'contract')
+            cursor.execute("SELECT COUNT(*) FROM job_postings")
+            existing = cursor.fetchone()[0]
+            job_rows = [
+                (f"Benchmark Role {n}", job_types[n % len(job_types)], f"Department {n % 6}", 'Remote',
+                 '$50,000 - $80,000', paragraph * 2, paragraph, paragraph, paragraph[:200],
+                 'active' if n % 5 else 'closed')
+                for n in range(existing + 1, job_count + 1)
+            ]
+            if job_rows:
+                cursor.executemany("""
+                    INSERT INTO job_postings (job_title, job_type, department, location, salary_range,
+                                              job_description, requirements, responsibilities, benefits, job_status)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, job_rows)
+            logging.info(f"Job postings seeded: {len(job_rows)} added")
+
+            cursor.execute("SELECT job_id FROM job_postings")
+            job_ids = [row[0] for row in cursor.fetchall()]
+            cursor.execute("SELECT COUNT(*) FROM job_applications")
+            existing = cursor.fetchone()[0]
+            application_rows = [
+                (job_ids[n % len(job_ids)], f"Applicant {n}", f"applicant{n}@example.com", '555-0100',
+                 paragraph, f"cv_{n}.pdf", f"/static/uploads/cvs/cv_{n}.pdf")
+                for n in range(existing + 1, application_count + 1)
+            ] if job_ids else []
+            if application_rows:
+                cursor.executemany("""
+                    INSERT INTO job_applications (job_id, applicant_name, applicant_email, applicant_phone,
+                                                  cover_letter, cv_filename, cv_path)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s)
+                """, application_rows)
+            logging.info(f"Job applications seeded: {len(application_rows)} added")
+
+            self.connection.commit()
+            cursor.close()
+            return True
+
+        except Error as e:
+            logging.error(f"Error seeding benchmark data: {e}")
+            self.connection.rollback()
+            return False
+
     def close_connection(self):
         """Close database connection"""
         if self.connection and self.connection.is_connected():
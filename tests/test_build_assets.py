@@ -0,0 +1,103 @@
+"""
+Static asset build: url() rebasing and the fingerprint manifest. Pure Python, no database.
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import build_assets
+
+
+SVG_BACKGROUND = ("a{background:url('data:image/svg+xml,<svg><radialGradient id=\"a\"/>"
+                  "<rect fill=\"url(%23a)\"/></svg>')}")
+
+
+def test_data_uri_with_inner_url_is_left_alone():
+    assert build_assets.rebase_css_urls(SVG_BACKGROUND, 'css/about.css', 'dist/about.css') == SVG_BACKGROUND
+
+
+def test_url_inside_a_quoted_string_is_left_alone():
+    css = 'a:after{content:"url(icon.png)"}'
+    assert build_assets.rebase_css_urls(css, 'css/about.css', 'dist/about.css') == css
+
+
+@pytest.mark.parametrize('reference, rebased', [
+    ('url(../assets/logo.png)', 'url(../assets/logo.png)'),
+    ('url("img/bg.png")', 'url("../css/img/bg.png")'),
+    ("url( 'fonts/a.woff2' )", "url('../css/fonts/a.woff2')"),
+    ('url(/static/assets/logo.png)', 'url(/static/assets/logo.png)'),
+    ('url(https://example.com/a.png)', 'url(https://example.com/a.png)'),
+    ('url(#grain)', 'url(#grain)'),
+])
+def test_relative_urls_are_rebased(reference, rebased):
+    css = f"a{{background:{reference}}}"
+    assert build_assets.rebase_css_urls(css, 'css/about.css', 'dist/about.css') == f"a{{background:{rebased}}}"
+
+
+def test_css_is_rebased_against_the_flat_file_write_hashed_writes(tmp_path, monkeypatch):
+    (tmp_path / 'css').mkdir()
+    (tmp_path / 'css' / 'page.css').write_text('a{background:url(../assets/logo.png)}')
+    monkeypatch.setattr(build_assets, 'STATIC_FOLDER', str(tmp_path))
+
+    output = build_assets.build_output('css/page.css', ['css/page.css'])
+    filename = build_assets.hashed_filename('css/page.css', 'abc')
+    assert filename == 'dist/page.abc.css'
+    # From static/dist/page.abc.css, ../assets/logo.png is static/assets/logo.png
+    assert 'url(../assets/logo.png)' in output
+
+
+@pytest.fixture
+def static_tree(tmp_path, monkeypatch):
+    for folder in ('css', 'js'):
+        (tmp_path / folder).mkdir()
+    (tmp_path / 'css' / 'navbar.css').write_text('nav {\n  color : red;\n}\n')
+    (tmp_path / 'css' / 'backtotop.css').write_text('.top { display: none; }\n')
+    (tmp_path / 'css' / 'page.css').write_text('/* page */\nbody { margin: 0; }\n')
+    (tmp_path / 'js' / 'navbarSetting.js').write_text('// nav\nvar a = 1;\n')
+    (tmp_path / 'js' / 'backtotop.js').write_text('var b = 2;\n')
+    monkeypatch.setattr(build_assets, 'STATIC_FOLDER', str(tmp_path))
+    monkeypatch.setattr(build_assets, 'ASSET_BUNDLES', {
+        'site.css': ['css/navbar.css', 'css/backtotop.css'],
+        'site.js': ['js/navbarSetting.js', 'js/backtotop.js'],
+    })
+    return tmp_path
+
+
+def test_manifest_maps_bundles_and_files_to_hashed_outputs(static_tree):
+    manifest, removed = build_assets.build()
+    assert removed == 0
+    assert set(manifest['bundles']) == {'site.css', 'site.js'}
+    assert set(manifest['files']) == {'css/navbar.css', 'css/backtotop.css', 'css/page.css',
+                                      'js/navbarSetting.js', 'js/backtotop.js'}
+    for filename in list(manifest['bundles'].values()) + list(manifest['files'].values()):
+        assert filename.startswith('dist/')
+        assert (static_tree / filename).is_file()
+        assert (static_tree / (filename + '.gz')).is_file()
+
+    with open(static_tree / 'dist' / 'manifest.json') as f:
+        assert json.load(f) == manifest
+    assert (static_tree / manifest['files']['css/page.css']).read_text() == 'body{margin:0}\n'
+
+
+def test_fingerprint_changes_only_with_content(static_tree):
+    first, _ = build_assets.build()
+    again, _ = build_assets.build()
+    assert again == first
+
+    (static_tree / 'css' / 'page.css').write_text('body { margin: 1px; }\n')
+    changed, removed = build_assets.build()
+    assert changed['files']['css/page.css'] != first['files']['css/page.css']
+    assert changed['bundles'] == first['bundles']
+    # The previous build's file survives one more run for pages that still reference it
+    assert removed == 0
+    assert (static_tree / first['files']['css/page.css']).is_file()
+
+    _, removed = build_assets.build(keep_previous=False)
+    assert removed == (2 if build_assets.brotli is None else 3)  # the old page.css and its .gz/.br
+    assert not (static_tree / first['files']['css/page.css']).exists()
@@ -0,0 +1,92 @@
+"""
+Chunked upload round trip against a throwaway MySQL database (TEST_DB_NAME, default
+mindtunes_test) seeded through setupdb.py. Skipped when Flask or MySQL isn't available.
+"""
+
+import os
+import sys
+import hashlib
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TEST_DB_NAME = os.getenv('TEST_DB_NAME', 'mindtunes_test')
+
+pytest.importorskip('flask')
+
+
+@pytest.fixture(scope='module')
+def app_module():
+    os.chdir(ROOT)
+    sys.path.insert(0, ROOT)
+    os.environ['DB_NAME'] = TEST_DB_NAME
+    os.environ['DB_DATABASE'] = TEST_DB_NAME
+    os.environ['EMAIL_OUTBOX_WORKERS'] = '0'
+
+    from setupdb import DatabaseSetup
+    db_setup = DatabaseSetup()
+    try:
+        if not db_setup.setup_complete_database():
+            pytest.skip("MySQL is not available for the test database")
+    finally:
+        db_setup.close_connection()
+
+    import app as app_module
+    app_module.create_uploads_table()
+    app_module.create_upload_sessions_table()
+    app_module.create_upload_references_table()
+    return app_module
+
+
+@pytest.fixture
+def client(app_module):
+    client = app_module.app.test_client()
+    with client.session_transaction() as sess:
+        sess['admin_logged_in'] = True
+    return client
+
+
+def fetch_one(app_module, query, params):
+    conn = app_module.get_db_connection()
+    cursor = conn.cursor(dictionary=True)
+    try:
+        cursor.execute(query, params)
+        return cursor.fetchone()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def test_chunked_video_is_saved_to_the_rendered_column(app_module, client):
+    data = os.urandom(3000)
+    response = client.post('/admin/uploads', json={'filename': 'clip.webm', 'size': len(data)})
+    assert response.status_code == 201
+    upload_id = response.get_json()['upload_id']
+
+    for offset in (0, 1024, 2048):
+        chunk = data[offset:offset + 1024]
+        response = client.put(f'/admin/uploads/{upload_id}', data=chunk, headers={
+            'X-Upload-Offset': str(offset),
+            'X-Chunk-SHA256': hashlib.sha256(chunk).hexdigest()
+        })
+        assert response.status_code == 200
+    status = response.get_json()
+    assert status['complete']
+    file_url = status['url']
+    assert file_url == f"/static/uploads/{hashlib.sha256(data).hexdigest()}.webm"
+
+    try:
+        response = client.post('/admin/innovations', data={
+            'innovationMediaType': 'video',
+            'innovationFile_upload_id': upload_id
+        })
+        assert response.status_code == 302
+
+        row = fetch_one(app_module, "SELECT innovationVideo, innovationMediaType FROM innovations LIMIT 1", ())
+        assert row['innovationVideo'] == file_url
+        assert row['innovationMediaType'] == 'video'
+
+        upload = fetch_one(app_module, "SELECT ref_count FROM uploads WHERE file_url = %s", (file_url,))
+        assert upload['ref_count'] == 1
+    finally:
+        app_module.remove_upload_files(file_url)
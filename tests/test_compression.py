@@ -0,0 +1,97 @@
+"""
+Response compression: content negotiation, Vary and ETag handling. No database needed.
+"""
+
+import os
+import sys
+import gzip
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+PAGE = ('<html><body>' + '<p>MindTune Innovations</p>' * 200 + '</body></html>').encode()
+
+
+@pytest.fixture(autouse=True)
+def gzip_only(monkeypatch):
+    # Pin negotiation to gzip whether or not Brotli is installed
+    monkeypatch.setattr(app_module, 'brotli', None)
+    monkeypatch.setattr(app_module, 'COMPRESSION_ENABLED', True)
+
+
+def compress(body=PAGE, accept='gzip, deflate', mimetype='text/html', status=200, etag='"abc123"'):
+    headers = {'Accept-Encoding': accept} if accept is not None else {}
+    with app_module.app.test_request_context('/', headers=headers):
+        response = app_module.app.response_class(body, status=status, mimetype=mimetype)
+        if etag:
+            response.headers['ETag'] = etag
+        return app_module.compress_response(response)
+
+
+def test_gzip_for_clients_that_accept_it():
+    response = compress()
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'Accept-Encoding' in response.vary
+    assert gzip.decompress(response.get_data()) == PAGE
+    assert response.content_length == len(response.get_data())
+
+
+def test_etag_becomes_weak_but_keeps_its_value():
+    response = compress()
+    assert response.get_etag() == ('abc123', True)
+
+
+def test_response_without_etag_is_still_compressed():
+    response = compress(etag=None)
+    assert response.headers['Content-Encoding'] == 'gzip'
+    assert 'ETag' not in response.headers
+
+
+@pytest.mark.parametrize('accept', [None, 'identity', 'gzip;q=0'])
+def test_identity_when_gzip_is_not_accepted(accept):
+    response = compress(accept=accept)
+    assert 'Content-Encoding' not in response.headers
+    assert response.get_data() == PAGE
+    assert response.get_etag() == ('abc123', False)
+    # Caches must still keep the encodings apart
+    assert 'Accept-Encoding' in response.vary
+
+
+def test_small_bodies_are_sent_as_they_are():
+    response = compress(body=b'<p>hi</p>')
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.vary
+
+
+def test_not_modified_varies_but_has_no_body_to_compress():
+    response = compress(body=b'', status=304)
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' in response.vary
+
+
+def test_binary_types_are_left_alone():
+    response = compress(body=os.urandom(4096), mimetype='image/png')
+    assert 'Content-Encoding' not in response.headers
+    assert 'Accept-Encoding' not in response.vary
+
+
+def test_streamed_responses_are_left_alone():
+    with app_module.app.test_request_context('/', headers={'Accept-Encoding': 'gzip'}):
+        response = app_module.app.response_class(iter([PAGE]), mimetype='text/csv')
+        response = app_module.compress_response(response)
+        assert 'Content-Encoding' not in response.headers
+
+
+def test_brotli_is_preferred_when_available(monkeypatch):
+    brotli = pytest.importorskip('brotli')
+    monkeypatch.setattr(app_module, 'brotli', brotli)
+    response = compress(accept='gzip, br')
+    assert response.headers['Content-Encoding'] == 'br'
+    assert brotli.decompress(response.get_data()) == PAGE
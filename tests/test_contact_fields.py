@@ -0,0 +1,65 @@
+"""
+Parsing structured fields out of legacy contact messages. No database needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+
+MESSAGE = """Contact Details:
+- Name: Ada Lovelace
+- Email: ada@example.com
+- Phone: +44 20 7946 0000
+- Job Title: Analyst
+- Company: Analytical Engines Ltd
+- Industry: Computing
+- Company Size: 11-50
+
+Project Details:
+We need a difference engine.
+- Budget: flexible
+Company: this line belongs to the project text"""
+
+
+def test_parses_every_field():
+    assert app_module.parse_contact_message(MESSAGE) == {
+        'company': 'Analytical Engines Ltd',
+        'industry': 'Computing',
+        'phone': '+44 20 7946 0000',
+        'job_title': 'Analyst',
+        'company_size': '11-50',
+        'project_details': ("We need a difference engine.\n- Budget: flexible\n"
+                            "Company: this line belongs to the project text")
+    }
+
+
+def test_older_messages_used_number_of_employees():
+    details = app_module.parse_contact_message("- Number of Employees: 200+\n")
+    assert details['company_size'] == '200+'
+
+
+def test_missing_fields_are_empty_strings():
+    details = app_module.parse_contact_message("Just a plain message")
+    assert details == dict.fromkeys(app_module.CONTACT_DETAIL_FIELDS, '')
+
+
+@pytest.mark.parametrize('message', [None, ''])
+def test_empty_message(message):
+    assert app_module.parse_contact_message(message) == dict.fromkeys(app_module.CONTACT_DETAIL_FIELDS, '')
+
+
+def test_blank_optional_fields_stay_blank():
+    details = app_module.parse_contact_message("- Company: \n- Phone:\nProject Details:\n\n  Build it  \n")
+    assert details['company'] == ''
+    assert details['phone'] == ''
+    assert details['project_details'] == 'Build it'
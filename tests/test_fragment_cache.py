@@ -0,0 +1,152 @@
+"""
+Fragment cache keying and expiry, and the {% cache %} tag. No database needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import jinja2
+
+import app as app_module
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(app_module.time, 'monotonic', clock)
+    return clock
+
+
+@pytest.fixture
+def content(monkeypatch):
+    content = app_module.ContentCache(ttl=300)
+    monkeypatch.setattr(app_module, 'content_cache', content)
+    return content
+
+
+@pytest.fixture
+def fragments():
+    return app_module.FragmentCache(ttl=300, max_entries=2)
+
+
+class Renderer:
+    """caller() stand-in that counts renders."""
+
+    def __init__(self, markup='<ul></ul>'):
+        self.markup = markup
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.markup
+
+
+def cache_rows(content, table):
+    content.set(table, 'list', [{'id': 1}], content.table_version(table))
+
+
+def test_hit_until_a_listed_table_changes(clock, content, fragments):
+    cache_rows(content, 'navTable')
+    cache_rows(content, 'footer')
+    render = Renderer()
+
+    assert fragments.render('nav', ['navTable', 'footer'], render) == '<ul></ul>'
+    assert fragments.render('nav', ['navTable', 'footer'], render) == '<ul></ul>'
+    assert render.calls == 1
+
+    content.invalidate('clients')  # unrelated table
+    fragments.render('nav', ['navTable', 'footer'], render)
+    assert render.calls == 1
+
+    content.invalidate('footer')
+    cache_rows(content, 'footer')
+    fragments.render('nav', ['navTable', 'footer'], render)
+    assert render.calls == 2
+    assert fragments.stats()['hits'] == 2
+
+
+def test_names_are_keyed_separately(clock, content, fragments):
+    cache_rows(content, 'navTable')
+    first, second = Renderer('<a>'), Renderer('<b>')
+    assert fragments.render('nav', ['navTable'], first) == '<a>'
+    assert fragments.render('footer', ['navTable'], second) == '<b>'
+    assert fragments.render('nav', ['navTable'], first) == '<a>'
+    assert (first.calls, second.calls) == (1, 1)
+
+
+def test_not_stored_when_the_content_fetch_failed(clock, content, fragments):
+    render = Renderer()
+    fragments.render('nav', ['navTable'], render)
+    fragments.render('nav', ['navTable'], render)
+    assert render.calls == 2
+    assert fragments.stats()['entries'] == 0
+
+
+def test_expires_with_the_content_it_was_built_from(clock, content, fragments):
+    cache_rows(content, 'navTable')  # content expires at 1300
+    clock.now = 1290.0
+    render = Renderer()
+    fragments.render('nav', ['navTable'], render)
+
+    clock.now = 1299.0
+    fragments.render('nav', ['navTable'], render)
+    assert render.calls == 1
+
+    # The fragment's own ttl would run to 1590, but the rows it shows are stale from 1300
+    clock.now = 1301.0
+    cache_rows(content, 'navTable')
+    fragments.render('nav', ['navTable'], render)
+    assert render.calls == 2
+
+
+def test_expires_after_its_own_ttl(clock, content, fragments):
+    content.ttl = 10000
+    cache_rows(content, 'navTable')
+    render = Renderer()
+    fragments.render('nav', ['navTable'], render)
+    clock.now += 301
+    fragments.render('nav', ['navTable'], render)
+    assert render.calls == 2
+
+
+def test_least_recently_used_entry_is_evicted(clock, content, fragments):
+    cache_rows(content, 'navTable')
+    renders = {name: Renderer(name) for name in ('a', 'b', 'c')}
+    for name in ('a', 'b'):
+        fragments.render(name, ['navTable'], renders[name])
+    fragments.render('a', ['navTable'], renders['a'])  # a is now the most recent
+    fragments.render('c', ['navTable'], renders['c'])  # evicts b
+
+    fragments.render('a', ['navTable'], renders['a'])
+    fragments.render('b', ['navTable'], renders['b'])
+    assert (renders['a'].calls, renders['b'].calls) == (1, 2)
+
+
+def test_cache_tag(clock, content, monkeypatch):
+    monkeypatch.setattr(app_module, 'fragment_cache', app_module.FragmentCache(ttl=300, max_entries=10))
+    cache_rows(content, 'navTable')
+    env = jinja2.Environment(extensions=[app_module.FragmentCacheExtension], autoescape=True)
+    template = env.from_string("{% cache 'nav' on 'navTable' %}<i>{{ label }}</i>{% endcache %}")
+
+    assert template.render(label='first') == '<i>first</i>'
+    # Served from the cache, so the new context value doesn't show until navTable changes
+    assert template.render(label='second') == '<i>first</i>'
+    content.invalidate('navTable')
+    cache_rows(content, 'navTable')
+    assert template.render(label='<third>') == '<i>&lt;third&gt;</i>'
@@ -0,0 +1,115 @@
+"""
+Keyset cursors and page navigation for the admin listings, against an in-memory fake
+connection instead of MySQL.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+
+def test_cursor_round_trip():
+    row = {'submission_date': datetime(2024, 3, 5, 14, 30, 15, 250000), 'id': 981}
+    cursor_value = app_module.encode_page_cursor(row, 'submission_date', 'id')
+    assert cursor_value == '2024-03-05T14:30:15.250000_981'
+    assert app_module.decode_page_cursor(cursor_value) == (row['submission_date'], 981)
+
+
+@pytest.mark.parametrize('cursor_value', [None, '', 'garbage', '2024-03-05T14:30:15', '2024-13-45T00:00:00_1',
+                                          '2024-03-05T14:30:15_abc'])
+def test_malformed_cursors_decode_to_none(cursor_value):
+    assert app_module.decode_page_cursor(cursor_value) is None
+
+
+class FakeConnection:
+    """Answers the keyset query from a list of rows, newest first, like MySQL would."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def cursor(self, dictionary=False):
+        return FakeCursor(self)
+
+    def close(self):
+        pass
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = []
+
+    def execute(self, query, params):
+        self.conn.queries.append((query, params))
+        rows = sorted(self.conn.rows, key=lambda row: (row['submission_date'], row['id']),
+                      reverse='DESC' in query)
+        params = list(params)
+        limit = params.pop()
+        if params:
+            when, _, row_id = params
+            if 'submission_date > %s' in query:
+                rows = [row for row in rows if (row['submission_date'], row['id']) > (when, row_id)]
+            else:
+                rows = [row for row in rows if (row['submission_date'], row['id']) < (when, row_id)]
+        self.result = rows[:limit]
+
+    def fetchall(self):
+        return self.result
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    start = datetime(2024, 1, 1)
+    # Pairs of rows share a timestamp, so the id has to break ties
+    rows = [{'id': number, 'submission_date': start + timedelta(hours=number // 2)} for number in range(1, 8)]
+    monkeypatch.setattr(app_module, 'get_db_connection', lambda: FakeConnection(rows))
+    return rows
+
+
+def page(after=None, before=None):
+    return app_module.fetch_keyset_page("SELECT * FROM contact_submissions", [], [], 'submission_date', 'id',
+                                        after=after, before=before, page_size=3)
+
+
+def ids(result):
+    return [row['id'] for row in result['rows']]
+
+
+def test_pages_walk_forward_and_back_without_gaps(rows):
+    first = page()
+    assert ids(first) == [7, 6, 5]
+    assert first['prev_cursor'] is None
+
+    second = page(after=first['next_cursor'])
+    assert ids(second) == [4, 3, 2]
+
+    last = page(after=second['next_cursor'])
+    assert ids(last) == [1]
+    assert last['next_cursor'] is None
+
+    back = page(before=last['prev_cursor'])
+    assert ids(back) == [4, 3, 2]
+    assert back['prev_cursor'] is not None
+
+    start = page(before=back['prev_cursor'])
+    assert ids(start) == [7, 6, 5]
+    assert start['prev_cursor'] is None
+    assert start['next_cursor'] is not None
+
+
+def test_malformed_cursor_shows_the_first_page(rows):
+    assert ids(page(after='not-a-cursor')) == [7, 6, 5]
@@ -0,0 +1,108 @@
+"""
+send_media: Range requests, conditional GETs and caching headers. No database needed.
+"""
+
+import os
+import sys
+
+import pytest
+from werkzeug.exceptions import RequestedRangeNotSatisfiable
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+DATA = bytes(range(256)) * 40  # 10240 bytes
+
+
+@pytest.fixture
+def video(tmp_path, monkeypatch):
+    monkeypatch.setattr(app_module, 'MEDIA_OFFLOAD', '')
+    path = tmp_path / 'clip.mp4'
+    path.write_bytes(DATA)
+    return str(path)
+
+
+def send(path, headers=None, immutable=True):
+    with app_module.app.test_request_context('/media/uploads/clip.mp4', headers=headers or {}):
+        response = app_module.send_media(path, 'uploads/clip.mp4', immutable)
+        response.direct_passthrough = False
+        return response
+
+
+def test_full_response_advertises_ranges(video):
+    response = send(video)
+    assert response.status_code == 200
+    assert response.get_data() == DATA
+    assert response.headers['Accept-Ranges'] == 'bytes'
+    assert response.headers['ETag']
+
+
+@pytest.mark.parametrize('range_header, start, end', [
+    ('bytes=0-99', 0, 99),
+    ('bytes=1000-', 1000, len(DATA) - 1),
+    ('bytes=-500', len(DATA) - 500, len(DATA) - 1),
+    ('bytes=10000-20000', 10000, len(DATA) - 1),
+])
+def test_range_gets_partial_content(video, range_header, start, end):
+    response = send(video, {'Range': range_header})
+    assert response.status_code == 206
+    assert response.get_data() == DATA[start:end + 1]
+    assert response.headers['Content-Range'] == f"bytes {start}-{end}/{len(DATA)}"
+    assert response.content_length == end - start + 1
+
+
+def test_unsatisfiable_range(video):
+    # Flask turns the exception into the 416 response
+    with pytest.raises(RequestedRangeNotSatisfiable) as raised:
+        send(video, {'Range': f'bytes={len(DATA)}-'})
+    assert raised.value.get_response().headers['Content-Range'] == f"bytes */{len(DATA)}"
+
+
+def test_if_range_with_a_stale_etag_sends_the_whole_file(video):
+    response = send(video, {'Range': 'bytes=0-99', 'If-Range': '"stale"'})
+    assert response.status_code == 200
+    assert response.get_data() == DATA
+
+
+def test_if_range_with_the_current_etag_sends_the_range(video):
+    etag = send(video).headers['ETag']
+    response = send(video, {'Range': 'bytes=0-99', 'If-Range': etag})
+    assert response.status_code == 206
+    assert response.get_data() == DATA[:100]
+
+
+def test_if_none_match_gets_not_modified(video):
+    etag = send(video).headers['ETag']
+    response = send(video, {'If-None-Match': etag})
+    assert response.status_code == 304
+
+
+def test_versioned_media_is_immutable_and_not_no_cache(video):
+    cache_control = send(video, immutable=True).cache_control
+    assert cache_control.immutable
+    assert cache_control.public
+    assert cache_control.max_age == app_module.MEDIA_IMMUTABLE_MAX_AGE
+    assert not cache_control.no_cache
+
+
+def test_unversioned_media_gets_the_short_max_age(video, monkeypatch):
+    monkeypatch.setattr(app_module, 'MEDIA_MAX_AGE', 3600)
+    cache_control = send(video, immutable=False).cache_control
+    assert not cache_control.immutable
+    assert cache_control.max_age == 3600
+    assert not cache_control.no_cache
+
+
+def test_offload_hands_the_file_to_nginx(video, monkeypatch):
+    monkeypatch.setattr(app_module, 'MEDIA_OFFLOAD', 'x-accel-redirect')
+    response = send(video, {'Range': 'bytes=0-99'})
+    assert response.status_code == 200
+    assert response.get_data() == b''
+    assert response.headers['X-Accel-Redirect'] == app_module.MEDIA_ACCEL_PREFIX.rstrip('/') + '/uploads/clip.mp4'
+    assert response.headers['Content-Type'] == 'video/mp4'
+    assert response.cache_control.immutable
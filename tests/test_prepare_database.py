@@ -0,0 +1,93 @@
+"""
+Startup migrations: each step runs until it succeeds, failures back off, and the image
+backfill runs once. The steps are replaced by fakes, so no database is needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+
+class Step:
+    def __init__(self, name, results):
+        self.__name__ = name
+        self.results = list(results)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.results.pop(0) if self.results else True
+
+
+@pytest.fixture
+def state(monkeypatch):
+    clock = {'now': 1000.0}
+    backfills = []
+    monkeypatch.setattr(app_module.time, 'monotonic', lambda: clock['now'])
+    monkeypatch.setattr(app_module, 'backfill_image_variants', lambda: backfills.append(True))
+    monkeypatch.setattr(app_module, '_completed_migrations', set())
+    monkeypatch.setattr(app_module, '_database_prepared', False)
+    monkeypatch.setattr(app_module, '_database_prepare_state', {'failures': 0, 'retry_at': 0.0})
+    monkeypatch.setattr(app_module, '_image_backfill_started', False)
+    monkeypatch.setattr(app_module, 'DATABASE_PREPARE_RETRY', 30)
+    return clock, backfills
+
+
+def prepare_on_request():
+    with app_module.app.test_request_context('/'):
+        app_module.ensure_database_prepared()
+
+
+def test_successful_steps_are_not_repeated(state, monkeypatch):
+    clock, backfills = state
+    good, flaky = Step('good', [True]), Step('flaky', [False, True])
+    monkeypatch.setattr(app_module, 'DATABASE_MIGRATIONS', [good, flaky])
+
+    prepare_on_request()
+    assert (good.calls, flaky.calls) == (1, 1)
+    assert not app_module._database_prepared
+
+    # Within the retry delay requests don't touch the database
+    for _ in range(5):
+        prepare_on_request()
+    assert flaky.calls == 1
+
+    clock['now'] += 31
+    prepare_on_request()
+    assert (good.calls, flaky.calls) == (1, 2)
+    assert app_module._database_prepared
+
+    prepare_on_request()
+    assert (good.calls, flaky.calls) == (1, 2)
+
+
+def test_retry_delay_doubles_up_to_the_limit(state, monkeypatch):
+    clock, _ = state
+    broken = Step('broken', [False] * 20)
+    monkeypatch.setattr(app_module, 'DATABASE_MIGRATIONS', [broken])
+
+    delays = []
+    for _ in range(8):
+        app_module.prepare_database()
+        delays.append(app_module._database_prepare_state['retry_at'] - clock['now'])
+    assert delays == [30, 60, 120, 240, 480, 900, 900, 900]
+
+
+def test_image_backfill_runs_once(state, monkeypatch):
+    _, backfills = state
+    monkeypatch.setattr(app_module, 'DATABASE_MIGRATIONS', [Step('broken', [False, False])])
+    for _ in range(3):
+        app_module.prepare_database()
+    for thread in app_module.threading.enumerate():
+        if thread.name == 'image-backfill':
+            thread.join()
+    assert backfills == [True]
@@ -0,0 +1,84 @@
+"""
+Query instrumentation: statement shapes and per-statement timing. No database needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+
+@pytest.mark.parametrize('operation, shape', [
+    ("SELECT * FROM news WHERE id = %s", "SELECT * FROM news WHERE id = ?"),
+    ("SELECT * FROM news WHERE id = 42", "SELECT * FROM news WHERE id = ?"),
+    ("SELECT * FROM t WHERE name = 'O\\'Brien' AND x = %(x)s", "SELECT * FROM t WHERE name = ? AND x = ?"),
+    ("DELETE FROM t WHERE id IN (%s, %s, %s)", "DELETE FROM t WHERE id IN (?+)"),
+    ("DELETE FROM t WHERE id IN (1,2)", "DELETE FROM t WHERE id IN (?+)"),
+    ("SELECT *\n   FROM t\n  LIMIT 10", "SELECT * FROM t LIMIT ?"),
+    (b"SELECT 1", "SELECT ?"),
+])
+def test_normalize_sql(operation, shape):
+    assert app_module.normalize_sql(operation) == shape
+
+
+def test_in_lists_of_any_length_share_a_shape():
+    two = app_module.normalize_sql("SELECT * FROM t WHERE id IN (%s, %s)")
+    five = app_module.normalize_sql("SELECT * FROM t WHERE id IN (%s, %s, %s, %s, %s)")
+    assert two == five
+
+
+def test_identifiers_with_digits_are_kept():
+    assert app_module.normalize_sql("SELECT col1 FROM table2") == "SELECT col1 FROM table2"
+
+
+@pytest.mark.parametrize('params, count', [(None, 0), ((), 0), ((1, 2), 2), ({'a': 1}, 1)])
+def test_bind_count(params, count):
+    assert app_module.bind_count(params) == count
+
+
+class FakeMultiCursor:
+    """Stands in for a mysql cursor: multi=True yields itself once per statement."""
+
+    def __init__(self):
+        self.statement = None
+
+    def execute(self, operation, params=None, multi=False):
+        if not multi:
+            self.statement = operation
+            return None
+
+        def results():
+            for statement in operation.split('; '):
+                self.statement = statement
+                yield self
+        return results()
+
+    def fetchall(self):
+        return [{'statement': self.statement}]
+
+
+def test_multi_statement_execute_records_every_statement():
+    with app_module.app.test_request_context('/'):
+        app_module.g.metrics = {field: 0 for field, _, _ in app_module.RequestMetrics.TOTALS}
+        cursor = app_module.TimedCursor(FakeMultiCursor())
+
+        rows = [res.fetchall() for res in cursor.execute("SELECT * FROM a LIMIT 1; SELECT * FROM b", multi=True)]
+
+        assert rows == [[{'statement': 'SELECT * FROM a LIMIT 1'}], [{'statement': 'SELECT * FROM b'}]]
+        assert app_module.g.metrics['db_queries'] == 2
+
+
+def test_single_execute_records_one_statement():
+    with app_module.app.test_request_context('/'):
+        app_module.g.metrics = {field: 0 for field, _, _ in app_module.RequestMetrics.TOTALS}
+        cursor = app_module.TimedCursor(FakeMultiCursor())
+        cursor.execute("SELECT 1")
+        assert app_module.g.metrics['db_queries'] == 1
@@ -0,0 +1,137 @@
+"""
+Transaction scoping of the shared request connection, against a fake connection that
+records what would be sent to MySQL.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+
+class FakeConnection:
+    def __init__(self):
+        self.log = []
+        self.in_transaction = False
+
+    def cursor(self, *args, **kwargs):
+        return FakeCursor(self)
+
+    def commit(self):
+        self.log.append('COMMIT')
+        self.in_transaction = False
+
+    def rollback(self):
+        self.log.append('ROLLBACK')
+        self.in_transaction = False
+
+
+class FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+
+    def execute(self, operation, params=None, multi=False):
+        self.conn.log.append(operation)
+        if not operation.startswith(('SAVEPOINT', 'RELEASE', 'ROLLBACK TO')):
+            self.conn.in_transaction = True
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def raw(monkeypatch):
+    raw = FakeConnection()
+    monkeypatch.setattr(app_module, 'checkout_pooled_connection', lambda background=False: raw)
+    with app_module.app.test_request_context('/'):
+        yield raw
+        app_module.g.pop('db_conn', None)
+
+
+def run(conn, statement):
+    cursor = conn.cursor()
+    cursor.execute(statement)
+    cursor.close()
+
+
+def test_sequential_helpers_commit_for_real(raw):
+    conn = app_module.get_db_connection()
+    run(conn, "UPDATE a")
+    conn.commit()
+    conn.close()
+
+    conn = app_module.get_db_connection()
+    run(conn, "SELECT b")
+    conn.close()
+    assert raw.log == ["UPDATE a", "COMMIT", "SELECT b", "ROLLBACK"]
+
+
+def test_nested_commit_leaves_the_outer_transaction_open(raw):
+    outer = app_module.get_db_connection()
+    run(outer, "SELECT * FROM upload_sessions FOR UPDATE")
+
+    inner = app_module.get_db_connection()
+    run(inner, "INSERT INTO uploads")
+    inner.commit()
+    inner.close()
+    assert 'COMMIT' not in raw.log
+    assert raw.in_transaction
+
+    run(outer, "UPDATE upload_sessions")
+    outer.commit()
+    outer.close()
+    assert raw.log == ["SELECT * FROM upload_sessions FOR UPDATE", "SAVEPOINT helper_1", "INSERT INTO uploads",
+                       "RELEASE SAVEPOINT helper_1", "UPDATE upload_sessions", "COMMIT"]
+
+
+def test_nested_failure_undoes_only_its_own_work(raw):
+    outer = app_module.get_db_connection()
+    run(outer, "UPDATE upload_sessions SET received_bytes")
+
+    inner = app_module.get_db_connection()
+    run(inner, "INSERT INTO uploads")
+    inner.close()  # closed without committing, as after an error
+
+    assert raw.log[-2:] == ["ROLLBACK TO SAVEPOINT helper_1", "RELEASE SAVEPOINT helper_1"]
+    assert raw.in_transaction
+    outer.commit()
+    assert raw.log[-1] == 'COMMIT'
+
+
+def test_nested_rollback_goes_to_its_savepoint(raw):
+    outer = app_module.get_db_connection()
+    run(outer, "UPDATE a")
+    inner = app_module.get_db_connection()
+    inner.rollback()
+    inner.close()
+    assert 'ROLLBACK' not in raw.log
+    assert raw.log[-3:] == ["ROLLBACK TO SAVEPOINT helper_1", "ROLLBACK TO SAVEPOINT helper_1",
+                            "RELEASE SAVEPOINT helper_1"]
+
+
+def test_savepoints_get_distinct_names(raw):
+    outer = app_module.get_db_connection()
+    run(outer, "UPDATE a")
+    first = app_module.get_db_connection()
+    second = app_module.get_db_connection()
+    first.commit()
+    second.commit()
+    assert "SAVEPOINT helper_1" in raw.log and "SAVEPOINT helper_2" in raw.log
+
+
+def test_outside_a_request_connections_come_from_the_background_pool(monkeypatch):
+    pools = []
+    monkeypatch.setattr(app_module, 'checkout_pooled_connection',
+                        lambda background=False: pools.append(background) or FakeConnection())
+    conn = app_module.get_db_connection()
+    assert isinstance(conn, app_module.TimedConnection)
+    assert not isinstance(conn, app_module.RequestConnection)
+    assert pools == [True]
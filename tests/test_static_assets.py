@@ -0,0 +1,86 @@
+"""
+How the app resolves the asset build manifest, and the caching headers of built files.
+No database needed.
+"""
+
+import os
+import sys
+import json
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+MANIFEST = {
+    'bundles': {'site.css': 'dist/site.0123456789ab.css', 'site.js': 'dist/site.ba9876543210.js'},
+    'files': {'css/navbar.css': 'dist/navbar.aaaaaaaaaaaa.css'}
+}
+
+
+@pytest.fixture
+def manifest_path(tmp_path, monkeypatch):
+    path = tmp_path / 'manifest.json'
+    monkeypatch.setattr(app_module, 'ASSET_MANIFEST_PATH', str(path))
+    monkeypatch.setattr(app_module, '_asset_manifest', {'mtime': None, 'bundles': {}, 'files': {}})
+    monkeypatch.setattr(app_module.app, 'debug', False)
+    return path
+
+
+def test_without_a_build_urls_point_at_the_sources(manifest_path):
+    with app_module.app.test_request_context('/'):
+        assert app_module.url_for('static', filename='css/navbar.css') == '/static/css/navbar.css'
+        assert app_module.asset_tags('site.css') == (
+            '<link rel="stylesheet" href="/static/css/navbar.css">\n'
+            '    <link rel="stylesheet" href="/static/css/backtotop.css">')
+
+
+def test_built_files_and_bundles_resolve_through_the_manifest(manifest_path):
+    manifest_path.write_text(json.dumps(MANIFEST))
+    with app_module.app.test_request_context('/'):
+        assert app_module.url_for('static', filename='css/navbar.css') == '/static/dist/navbar.aaaaaaaaaaaa.css'
+        assert app_module.url_for('static', filename='css/index.css') == '/static/css/index.css'
+        assert app_module.asset_tags('site.css') == '<link rel="stylesheet" href="/static/dist/site.0123456789ab.css">'
+        assert app_module.asset_tags('site.js') == '<script src="/static/dist/site.ba9876543210.js"></script>'
+
+
+def test_manifest_is_reloaded_when_it_changes(manifest_path):
+    manifest_path.write_text(json.dumps(MANIFEST))
+    assert app_module.asset_manifest()['files'] == MANIFEST['files']
+
+    rebuilt = {'bundles': {}, 'files': {'css/navbar.css': 'dist/navbar.bbbbbbbbbbbb.css'}}
+    manifest_path.write_text(json.dumps(rebuilt))
+    os.utime(manifest_path, (0, os.stat(manifest_path).st_mtime + 10))
+    assert app_module.asset_manifest()['files'] == rebuilt['files']
+
+    manifest_path.unlink()
+    assert app_module.asset_manifest()['files'] == {}
+
+
+def test_unreadable_manifest_falls_back_to_sources(manifest_path):
+    manifest_path.write_text('{not json')
+    assert app_module.asset_manifest()['bundles'] == {}
+
+
+def test_built_assets_are_immutable_and_not_no_cache():
+    with app_module.app.test_request_context('/static/dist/site.0123456789ab.css'):
+        response = app_module.app.response_class('body{}', mimetype='text/css')
+        response.cache_control.no_cache = True  # what the static view sends without a max age
+        response = app_module.cache_built_assets(response)
+        assert response.cache_control.immutable
+        assert response.cache_control.max_age == 31536000
+        assert not response.cache_control.no_cache
+
+
+def test_other_static_files_keep_their_headers():
+    with app_module.app.test_request_context('/static/css/navbar.css'):
+        response = app_module.app.response_class('nav{}', mimetype='text/css')
+        response.cache_control.no_cache = True
+        response = app_module.cache_built_assets(response)
+        assert response.cache_control.no_cache
+        assert not response.cache_control.immutable
@@ -0,0 +1,59 @@
+"""
+Finding upload references in CMS content. No database needed.
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+pytest.importorskip('flask')
+pytest.importorskip('mysql.connector')
+
+import app as app_module
+
+IMAGE = '/static/uploads/' + 'a' * 64 + '.jpg'
+VIDEO = '/static/uploads/' + 'b' * 64 + '.mp4'
+
+
+@pytest.mark.parametrize('value, urls', [
+    (IMAGE, [IMAGE]),
+    (f'<p>Intro</p><img src="{IMAGE}" alt="x"><video src=\'{VIDEO}\'></video>', [IMAGE, VIDEO]),
+    (f'<div style="background:url({IMAGE})">', [IMAGE]),
+    (f'<img srcset="{IMAGE} 640w,{VIDEO} 960w">', [IMAGE, VIDEO]),
+    (f'https://mindtune.example{IMAGE}?v=3#top', [IMAGE]),
+    ('/static/assets/logo.png', []),
+])
+def test_upload_urls_are_found_anywhere_in_a_value(value, urls):
+    assert app_module.UPLOAD_URL_RE.findall(value) == urls
+
+
+class FakeRegistry:
+    def __init__(self, tables):
+        self.tables = tables
+
+    def get(self, name):
+        return self.tables.get(name.lower())
+
+
+def test_reference_columns_are_the_text_columns(monkeypatch):
+    monkeypatch.setattr(app_module, 'schema_registry', FakeRegistry({
+        'blog_posts': {'name': 'blog_posts', 'columns': {
+            'blog_id': 'int', 'blog_image': 'varchar', 'blog_content': 'longtext', 'blog_date': 'date'}},
+        'innovations': {'name': 'innovations', 'columns': {
+            'id': 'int', 'innovationImage': 'varchar', 'innovationVideo': 'text'}},
+    }))
+    assert app_module.upload_reference_columns() == {
+        'blog_posts': ('blog_image', 'blog_content'),
+        'innovations': ('innovationImage', 'innovationVideo')
+    }
+    assert app_module.upload_reference_columns({'blog_posts'}) == {'blog_posts': ('blog_image', 'blog_content')}
+
+
+def test_no_schema_means_no_recount(monkeypatch):
+    monkeypatch.setattr(app_module, 'schema_registry', FakeRegistry({}))
+    monkeypatch.setattr(app_module, 'get_db_connection', lambda: pytest.fail("must not touch the database"))
+    assert app_module.refresh_upload_references() is False